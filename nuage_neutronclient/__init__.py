@@ -12,8 +12,23 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-import pbr.version
+import sys
 
 
-__version__ = pbr.version.VersionInfo(
-    'nuage_openstack_neutronclient').version_string()
+def _version_string():
+    import pbr.version
+    return pbr.version.VersionInfo(
+        'nuage_openstack_neutronclient').version_string()
+
+
+if sys.version_info >= (3, 7):
+    # pbr takes a large share of the import time of the OSC plugin, which
+    # is loaded for every openstack command: look the version up on use.
+    def __getattr__(name):
+        if name == '__version__':
+            globals()['__version__'] = _version_string()
+            return globals()['__version__']
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+else:
+    __version__ = _version_string()
@@ -19,6 +19,7 @@ from neutronclient.common import extension
 from neutronclient.neutron import v2_0 as neutronV20
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.secgroup_index import get_security_group_index
 
 
 class ExternalSecurityGroup(extension.NeutronClientExtension):
@@ -178,53 +179,18 @@ class ListExternalSecurityGroupRule(extension.ClientExtensionList,
 
         :return: a dict from secgroup ID to secgroup name
         """
-        neutron_client = self.get_client()
-        search_opts = {'fields': ['id', 'name']}
-        sec_group_ids = set()
-        for rule in data:
-            for key in self.replace_rules:
-                if rule.get(key):
-                    sec_group_ids.add(rule[key])
-        sec_group_ids = list(sec_group_ids)
-
-        def _get_sec_group_list(sec_group_ids):
-            search_opts['id'] = sec_group_ids
-            resp = neutron_client.list_security_groups(
-                **search_opts).get('security_groups', [])
-            return resp
-
-        try:
-            secgroups = _get_sec_group_list(sec_group_ids)
-        except exceptions.RequestURITooLong as uri_len_exc:
-            # Length of a query filter on security group rule id
-            # id=<uuid>& (with len(uuid)=36)
-            sec_group_id_filter_len = 40
-            # The URI is too long because of too many sec_group_id filters
-            # Use the excess attribute of the exception to know how many
-            # sec_group_id filters can be inserted into a single request
-            sec_group_count = len(sec_group_ids)
-            max_size = ((sec_group_id_filter_len * sec_group_count) -
-                        uri_len_exc.excess)
-            chunk_size = max_size // sec_group_id_filter_len
-            secgroups = []
-            for i in range(0, sec_group_count, chunk_size):
-                secgroups.extend(
-                    _get_sec_group_list(sec_group_ids[i: i + chunk_size]))
-
-        return dict([(sg['id'], sg['name'])
-                     for sg in secgroups if sg['name']])
+        return get_security_group_index(self.get_client()).names(
+            rule[key] for rule in data for key in self.replace_rules
+            if rule.get(key))
 
     @staticmethod
     def _has_fileds(rule, required_fileds):
         return all([key in rule for key in required_fileds])
 
     def extend_list(self, data, parsed_args):
-        sg_dict = self._get_sg_name_dict(data)
-        for rule in data:
-            # Replace security group UUID with its name.
-            for key in self.replace_rules:
-                if key in rule:
-                    rule[key] = sg_dict.get(rule[key], rule[key])
+        # Replace security group UUID with its name.
+        get_security_group_index(self.get_client()).replace_ids(
+            data, self.replace_rules)
 
     def setup_columns(self, info, parsed_args):
         # Translate the specified columns from the command line
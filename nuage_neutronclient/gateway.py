@@ -58,39 +58,48 @@ def check_vlan_value(value):
     return vlan_val
 
 
+# IDs resolved by get_resource_by_name_or_id and find_gateway_id, so that
+# one invocation does not resolve the same resource twice
+_resolved_ids = {}
+
+
+def find_gateway_id(neutron_client, gateway):
+    key = (GW_RESOURCE, gateway)
+    if key not in _resolved_ids:
+        _resolved_ids[key] = neutronV20.find_resourceid_by_name_or_id(
+            neutron_client, GW_RESOURCE, gateway)
+    return _resolved_ids[key]
+
+
 def get_resource_by_name_or_id(neutron_client, resource, resource_id,
                                parent_resource, parent_id):
-    obj_lister = getattr(neutron_client, "list_%s" % resource + 's')
+    key = (resource, resource_id, parent_resource, parent_id)
+    if key in _resolved_ids:
+        return _resolved_ids[key]
 
-    params = {
-        'id': resource_id,
-        parent_resource: parent_id
-    }
-    data = obj_lister(**params)
-    resource += 's'
-    resp_dict = None
-    if data[resource]:
-        resp_dict = data[resource][0]
-        _id = resp_dict['id']
-    if not resp_dict:
-        params = {
-            'name': resource_id,
-            parent_resource: parent_id
-        }
-        data = obj_lister(**params)
-        if data[resource]:
-            resp_dict = data[resource][0]
-            _id = resp_dict['id']
-
-    if not resp_dict:
+    obj_lister = getattr(neutron_client, "list_%s" % resource + 's')
+    collection = resource + 's'
+
+    # Only a UUID can match on id, anything else is looked up by name
+    # right away instead of issuing a list request which can't match.
+    items = []
+    if re.match(UUID_PATTERN, str(resource_id)):
+        items = obj_lister(**{'id': resource_id,
+                              parent_resource: parent_id})[collection]
+    if not items:
+        items = obj_lister(**{'name': resource_id,
+                              parent_resource: parent_id})[collection]
+
+    if not items:
         not_found_message = (_("Unable to find %(resource)s with name "
                              "'%(name)s'") %
-                             {'resource': resource, 'name': resource_id})
+                             {'resource': collection, 'name': resource_id})
         # 404 is used to simulate server side behavior
         raise exceptions.NeutronClientException(
             message=not_found_message, status_code=404)
 
-    return _id
+    _resolved_ids[key] = items[0]['id']
+    return _resolved_ids[key]
 
 
 def get_gatway_info(parsed_args, neutron_client):
@@ -100,8 +109,7 @@ def get_gatway_info(parsed_args, neutron_client):
             # id is vlan value
             check_vlan_value(res_id)
 
-            gw_id = neutronV20.find_resourceid_by_name_or_id(
-                neutron_client, GW_RESOURCE, parsed_args.gateway)
+            gw_id = find_gateway_id(neutron_client, parsed_args.gateway)
             gw_port_id = get_resource_by_name_or_id(
                 neutron_client, GW_PORT_RESOURCE, parsed_args.gatewayport,
                 GATEWAY, gw_id)
@@ -210,8 +218,7 @@ class ShowGatewayPort(extension.ClientExtensionShow, GatewayPort):
         params = {}
         if parsed_args.id:
             if parsed_args.gateway:
-                gw_id = neutronV20.find_resourceid_by_name_or_id(
-                    neutron_client, GW_RESOURCE, parsed_args.gateway)
+                gw_id = find_gateway_id(neutron_client, parsed_args.gateway)
 
                 _id = get_resource_by_name_or_id(
                     neutron_client, GW_PORT_RESOURCE, parsed_args.id,
@@ -295,8 +302,7 @@ class ListGatewayPortVlan(extension.ClientExtensionList, GatewayPortVlan,
             params['tenant'] = ''
 
         if parsed_args.gateway:
-            gw_id = neutronV20.find_resourceid_by_name_or_id(
-                neutron_client, GW_RESOURCE, parsed_args.gateway)
+            gw_id = find_gateway_id(neutron_client, parsed_args.gateway)
             params['gateway'] = gw_id
 
         if parsed_args.gatewayport:
@@ -348,8 +354,7 @@ class ShowGatewayPortVlan(extension.ClientExtensionShow,
                 # id is vlan value
                 check_vlan_value(_id)
 
-                gw_id = neutronV20.find_resourceid_by_name_or_id(
-                    neutron_client, GW_RESOURCE, parsed_args.gateway)
+                gw_id = find_gateway_id(neutron_client, parsed_args.gateway)
                 gw_port_id = get_resource_by_name_or_id(
                     neutron_client, GW_PORT_RESOURCE, parsed_args.gatewayport,
                     GATEWAY, gw_id)
@@ -431,8 +436,7 @@ class CreateGatewayPortVlan(extension.ClientExtensionCreate,
 
         if parsed_args.gateway and parsed_args.gatewayport:
             body[self.resource].update({'gateway': parsed_args.gateway})
-            gw_id = neutronV20.find_resourceid_by_name_or_id(
-                self.get_client(), GW_RESOURCE, parsed_args.gateway)
+            gw_id = find_gateway_id(self.get_client(), parsed_args.gateway)
             body[self.resource].update(
                 {'gateway': gw_id})
 
@@ -471,6 +475,11 @@ class DeleteGatewayPortVlan(extension.ClientExtensionDelete,
 
     shell_command = 'nuage-gateway-vlan-delete'
 
+    def run(self, parsed_args):
+        # A deleted VLAN can no longer be resolved
+        _resolved_ids.clear()
+        return super(DeleteGatewayPortVlan, self).run(parsed_args)
+
 
 class AssignGatewayPortVlan(extension.ClientExtensionUpdate,
                             GatewayPortVlan):
@@ -14,13 +14,13 @@
 #
 from __future__ import print_function
 
-import copy
-
 from neutronclient.common import exceptions
 from neutronclient.common import extension
 from neutronclient.neutron import v2_0 as neutronV20
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.netpartition_index import NETPARTITION_FIELDS
+from nuage_neutronclient.netpartition_index import NetpartitionIndex
 
 
 class NetPartition(extension.NeutronClientExtension):
@@ -72,22 +72,30 @@ class ProjectNetPartitionMapping(extension.NeutronClientExtension):
     resource_path = '/%s/%%s' % 'project-net-partition-mappings'
     versions = ['2.0']
 
+    def get_netpartition_index(self, netpartition_ids=None):
+        """List the netpartitions, or only netpartition_ids, in one request"""
+        params = {'fields': NETPARTITION_FIELDS}
+        if netpartition_ids is not None:
+            params['id'] = list(netpartition_ids)
+        return NetpartitionIndex(self.get_client().get(
+            '/net-partitions', params=params)['net_partitions'])
+
+    @staticmethod
+    def to_output_row(mapping, index):
+        row = {
+            'project': mapping['project'],
+            'associated_netpartition_id': mapping['net_partition_id'],
+        }
+        name = index.name(mapping['net_partition_id'])
+        if name is not None:
+            row['associated_netpartition_name'] = name
+        return row
+
     def cleanup_output_data(self, data):
         result = data['project_net_partition_mapping']
-        resource_path = '/%s/%%s' % 'net-partitions'
-        client = self.get_client()
-        try:
-            netpartition = client.get(
-                resource_path % result['net_partition_id'])['net_partition']
-        except exceptions.NotFound:
-            netpartition = None
-        new_row = {
-            'project': result['project'],
-            'associated_netpartition_id': result['net_partition_id'],
-        }
-        if netpartition:
-            new_row['associated_netpartition_name'] = netpartition['name']
-        data['project_net_partition_mapping'] = new_row
+        index = self.get_netpartition_index([result['net_partition_id']])
+        data['project_net_partition_mapping'] = self.to_output_row(result,
+                                                                   index)
 
 
 class ProjectNetpartitionMappingCreate(extension.ClientExtensionCreate,
@@ -157,21 +165,9 @@ class ProjectNetpartitionMappingList(extension.ClientExtensionList,
                     'associated_netpartition_name']
 
     def extend_list(self, data, parsed_args):
-        results = copy.deepcopy(data)
-        resource_path = '/%s' % 'net-partitions'
-        client = self.get_client()
-        response = client.get(resource_path)['net_partitions']
-        netpartitions = {netpart['id']: netpart for netpart in response}
-        for row in results:
-            data.remove(row)
-            new_row = {
-                'associated_netpartition_id': row['net_partition_id'],
-                'project': row['project']
-            }
-            netpartition = netpartitions.get(row['net_partition_id'])
-            if netpartition:
-                new_row['associated_netpartition_name'] = netpartition['name']
-            data.append(new_row)
+        index = self.get_netpartition_index()
+        for i, row in enumerate(data):
+            data[i] = self.to_output_row(row, index)
 
 
 class ProjectNetpartitionMappingShow(extension.ClientExtensionShow,
@@ -0,0 +1,52 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Join of project to netpartition mappings with the netpartition names
+
+Used by both the neutron CLI extension and the openstack client commands, so
+it only depends on the standard library.
+"""
+
+NETPARTITION_FIELDS = ['id', 'name']
+
+
+class NetpartitionIndex(object):
+    """Names of netpartitions by ID
+
+    :param netpartitions: iterable of netpartitions with an id and a name,
+                          as listed with fields=NETPARTITION_FIELDS
+    """
+
+    def __init__(self, netpartitions):
+        self._names = {netpartition['id']: netpartition['name']
+                       for netpartition in netpartitions}
+
+    def __len__(self):
+        return len(self._names)
+
+    def name(self, netpartition_id):
+        """Return the name of a netpartition, None if it is unknown"""
+        return self._names.get(netpartition_id)
+
+    def join(self, mappings, name_key='net_partition_name'):
+        """Add the netpartition name to mappings while iterating over them
+
+        The mappings are updated in place, mappings of an unknown
+        netpartition are left without name.
+        """
+        for mapping in mappings:
+            name = self._names.get(mapping.get('net_partition_id'))
+            if name is not None:
+                mapping[name_key] = name
+            yield mapping
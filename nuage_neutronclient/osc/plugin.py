@@ -15,13 +15,18 @@
 """OpenStackClient plugin for Nuage service."""
 
 import logging
+import sys
 
 # from nuage_neutronclient.api.v2 import octavia
 from osc_lib import utils
 
+from nuage_neutronclient.osc.v2 import profile
+
 LOG = logging.getLogger(__name__)
 
 DEFAULT_API_VERSION = '2.0'
+# Number of connections to Neutron kept open, see osc.v2.connection_pool
+DEFAULT_POOL_SIZE = 32
 API_VERSION_OPTION = 'os_nuageclient_api_version'
 API_NAME = 'nuageclient'
 API_TYPE = 'nuageclient'
@@ -39,14 +44,57 @@ def make_client(instance):
         API_VERSIONS)
     LOG.debug('Instantiating nuage client: %s', nuage_client)
 
+    profile_format = instance._cli_options.config.get('nuage_profile')
+    profiler = profile.RequestProfiler() if profile_format else None
+    pool_size = int(instance._cli_options.config.get('nuageclient_pool_size')
+                    or DEFAULT_POOL_SIZE)
+
     client = nuage_client(session=instance.session,
                           region_name=instance.region_name,
                           endpoint_type=instance.interface,
                           insecure=not instance.verify,
-                          ca_cert=instance.cacert)
+                          ca_cert=instance.cacert,
+                          profiler=profiler,
+                          reference_store=_get_reference_store(instance),
+                          connection_pool_size=pool_size)
+    instance.nuage_profiler = profiler
     return client
 
 
+def start_command(instance):
+    """Start the command specific state of the Nuage client of instance"""
+    profiler = getattr(instance, 'nuage_profiler', None)
+    if profiler:
+        profiler.reset()
+
+
+def end_command(instance):
+    """End the command specific state of the Nuage client of instance
+
+    The requests of the command are reported when profiling, and the
+    reference store counts the command for the collections it used.
+    """
+    profiler = getattr(instance, 'nuage_profiler', None)
+    if profiler:
+        profiler.report(sys.stderr,
+                        instance._cli_options.config.get('nuage_profile'))
+        profiler.reset()
+    store = getattr(instance, 'nuage_reference_store', None)
+    if store is not None:
+        store.end_command()
+
+
+def _get_reference_store(instance):
+    """Return the Nuage reference store kept on the client manager"""
+    from nuage_neutronclient.osc.v2 import reference_store
+
+    store = getattr(instance, 'nuage_reference_store', None)
+    if store is None:
+        store = instance.nuage_reference_store = (
+            reference_store.ReferenceStore())
+    return store
+
+
 def build_option_parser(parser):
     """Hook to add global options
 
@@ -66,4 +114,23 @@ def build_option_parser(parser):
         help='OSC Plugin API version, default=' +
              DEFAULT_API_VERSION +
              ' (Env: OS_NUAGECLIENT_API_VERSION)')
+    parser.add_argument(
+        '--nuage-profile',
+        metavar='<format>',
+        nargs='?',
+        const='table',
+        choices=profile.FORMATS,
+        default=utils.env('OS_NUAGECLIENT_PROFILE') or None,
+        help='Report method, path, status, latency and size of every Nuage '
+             'request on stderr when the command ends, as a table (default) '
+             'or as json (Env: OS_NUAGECLIENT_PROFILE)')
+    parser.add_argument(
+        '--os-nuageclient-pool-size',
+        metavar='<size>',
+        type=int,
+        default=utils.env('OS_NUAGECLIENT_POOL_SIZE',
+                          default=str(DEFAULT_POOL_SIZE)),
+        help='Number of connections to the Neutron endpoint kept open for '
+             'concurrent requests, default=' + str(DEFAULT_POOL_SIZE) +
+             ' (Env: OS_NUAGECLIENT_POOL_SIZE)')
     return parser
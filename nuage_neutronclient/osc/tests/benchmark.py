@@ -0,0 +1,442 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Request count and latency benchmarks of the OSC Nuage commands
+
+Every scenario runs one of the openstack.nuageclient.v2 commands against a
+fresh FakeNuageServer and records the number of round trips, the bytes of
+the responses, the wall time of the command and the peak RSS of the process
+running it. The command runs in a child process, so that neither the server
+nor earlier scenarios influence its memory usage or warm its caches.
+
+Record a baseline, and later compare against it:
+
+    python -m nuage_neutronclient.osc.tests.benchmark -o baseline.json
+    python -m nuage_neutronclient.osc.tests.benchmark --compare baseline.json
+
+The comparison fails when a scenario needs more requests than in the
+baseline, or when its response bytes, wall time or peak RSS grow beyond the
+given tolerances.
+"""
+
+import argparse
+import collections
+import configparser
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from neutronclient.v2_0 import client as neutron_client
+
+from nuage_neutronclient.osc.tests import fake_server
+
+MODULE = 'nuage_neutronclient.osc.tests.benchmark'
+ENTRY_POINT_GROUP = 'openstack.nuageclient.v2'
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__),
+                                'benchmark_baseline.json')
+
+DEFAULT_LATENCY = 0.005
+DEFAULT_SIZES = {
+    'nuage_gateways': 10,
+    'nuage_gateway_ports': 8,
+    'nuage_gateway_vlans': 16,
+    'nuage_policy_groups': 50,
+    'nuage_redirect_targets': 20,
+    'nuage_floatingips': 50,
+    'ports': 200,
+    'routers': 10,
+    'switchport_mappings': 50,
+    'project_net_partition_mappings': 20,
+}
+
+Scenario = collections.namedtuple('Scenario', ['name', 'entry_point',
+                                               'argv'])
+
+
+def _nth(data, collection, index=0, attribute='name'):
+    return str(list(data.collections[collection].values())[index][attribute])
+
+
+SCENARIOS = (
+    Scenario('port show', 'port_show',
+             lambda d: [_nth(d, 'ports', 1)]),
+    Scenario('port list --nuage-details', 'port_list',
+             lambda d: ['--nuage-details']),
+    Scenario('port set', 'port_set',
+             lambda d: ['--nuage-policy-group', _nth(d, 'nuage_policy_groups'),
+                        '--nuage-redirect-target',
+                        _nth(d, 'nuage_redirect_targets'),
+                        _nth(d, 'ports', 1)]),
+    Scenario('port unset', 'port_unset',
+             lambda d: ['--nuage-policy-group', _nth(d, 'nuage_policy_groups'),
+                        _nth(d, 'ports')]),
+    Scenario('router show', 'router_show',
+             lambda d: [_nth(d, 'routers', 1)]),
+    Scenario('router list --nuage-details', 'router_list',
+             lambda d: ['--nuage-details']),
+    Scenario('nuage gateway list', 'nuage_gateway_list', lambda d: []),
+    Scenario('nuage gateway show', 'nuage_gateway_show',
+             lambda d: [_nth(d, 'nuage_gateways', 1)]),
+    Scenario('nuage gateway port list', 'nuage_gateway_port_list',
+             lambda d: [_nth(d, 'nuage_gateways', 1)]),
+    Scenario('nuage gateway port show', 'nuage_gateway_port_show',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways', 1),
+                        _nth(d, 'nuage_gateway_ports', 1)]),
+    Scenario('nuage gateway port vlan list', 'nuage_gateway_port_vlan_list',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways'),
+                        _nth(d, 'nuage_gateway_ports', 1)]),
+    Scenario('nuage gateway port vlan map', 'nuage_gateway_port_vlan_map',
+             lambda d: [_nth(d, 'nuage_gateways')]),
+    Scenario('nuage gateway port vlan show', 'nuage_gateway_port_vlan_show',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways'),
+                        '--gatewayport', _nth(d, 'nuage_gateway_ports', 1),
+                        '1']),
+    Scenario('nuage gateway port vlan create',
+             'nuage_gateway_port_vlan_create',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways'),
+                        '--gatewayport', _nth(d, 'nuage_gateway_ports', 1),
+                        '100']),
+    Scenario('nuage gateway port vlan create --range',
+             'nuage_gateway_port_vlan_create',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways'),
+                        '--gatewayport', _nth(d, 'nuage_gateway_ports', 1),
+                        '--range', '100-163']),
+    Scenario('nuage gateway port vlan delete',
+             'nuage_gateway_port_vlan_delete',
+             lambda d: ['--gateway', _nth(d, 'nuage_gateways'),
+                        '--gatewayport', _nth(d, 'nuage_gateway_ports', 1),
+                        '1']),
+    Scenario('nuage floating ip list', 'nuage_floating_ip_list',
+             lambda d: []),
+    Scenario('nuage floating ip show', 'nuage_floating_ip_show',
+             lambda d: [_nth(d, 'nuage_floatingips', 1, 'id')]),
+    Scenario('nuage l2bridge list', 'nuage_l2bridge_list', lambda d: []),
+    Scenario('nuage l2bridge show', 'nuage_l2bridge_show',
+             lambda d: [_nth(d, 'nuage_l2bridges', 1)]),
+    Scenario('nuage l2bridge delete', 'nuage_l2bridge_delete',
+             lambda d: [_nth(d, 'nuage_l2bridges', i)
+                        for i in range(len(d.collections['nuage_l2bridges']))
+                        ]),
+    Scenario('nuage netpartition list', 'nuage_netpartition_list',
+             lambda d: []),
+    Scenario('nuage netpartition show', 'nuage_netpartition_show',
+             lambda d: [_nth(d, 'net_partitions', 1)]),
+    Scenario('nuage netpartition create', 'nuage_netpartition_create',
+             lambda d: ['benchmark']),
+    Scenario('nuage netpartition delete', 'nuage_netpartition_delete',
+             lambda d: [_nth(d, 'net_partitions', 1)]),
+    Scenario('nuage netpartition project list',
+             'nuage_netpartition_project_list', lambda d: []),
+    Scenario('nuage policy group list', 'nuage_policy_group_list',
+             lambda d: []),
+    Scenario('nuage policy group show', 'nuage_policy_group_show',
+             lambda d: [_nth(d, 'nuage_policy_groups', 1)]),
+    Scenario('nuage redirect target list', 'nuage_redirect_target_list',
+             lambda d: [_nth(d, 'subnets')]),
+    Scenario('nuage redirect target show', 'nuage_redirect_target_show',
+             lambda d: [_nth(d, 'nuage_redirect_targets', 1)]),
+    Scenario('nuage switchport binding list', 'nuage_switchport_binding_list',
+             lambda d: []),
+    Scenario('nuage switchport mapping list', 'nuage_switchport_mapping_list',
+             lambda d: []),
+    Scenario('nuage switchport mapping show', 'nuage_switchport_mapping_show',
+             lambda d: [_nth(d, 'switchport_mappings', 1, 'id')]),
+    Scenario('nuage switchport mapping delete',
+             'nuage_switchport_mapping_delete',
+             lambda d: [_nth(d, 'switchport_mappings', i, 'id')
+                        for i in range(10)]),
+    Scenario('nuage cache refresh', 'nuage_cache_refresh', lambda d: []),
+)
+
+
+def load_entry_points():
+    """Return dict of entry point name to 'module:Class'
+
+    The installed package metadata is preferred, setup.cfg of the source
+    tree is used when the package is not installed, or on Python < 3.8
+    which has no importlib.metadata.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        metadata = None
+    if metadata is not None:
+        installed = metadata.entry_points()
+        if hasattr(installed, 'select'):
+            installed = installed.select(group=ENTRY_POINT_GROUP)
+        else:
+            # Python < 3.10 returns a dict of group to entry points
+            installed = installed.get(ENTRY_POINT_GROUP, ())
+        entry_points = {ep.name: ep.value for ep in installed}
+        if entry_points:
+            return entry_points
+    config = configparser.ConfigParser()
+    config.read(os.path.join(os.path.dirname(__file__), '..', '..', '..',
+                             'setup.cfg'))
+    lines = config.get('entry_points', ENTRY_POINT_GROUP).strip()
+    return dict((name.strip(), value.strip()) for name, value in
+                (line.split('=', 1) for line in lines.splitlines()))
+
+
+def _load_command(entry_point):
+    module_name, class_name = load_entry_points()[entry_point].split(':')
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name)
+
+
+class _ClientManager(object):
+
+    def __init__(self, url):
+        self.nuageclient = fake_server.make_client(url)
+        self.network = fake_server.make_network_client(url)
+        self.neutronclient = neutron_client.Client(endpoint_url=url,
+                                                   token='fake-token')
+        # The fake server has no Keystone, scenarios don't look up projects
+        self.identity = None
+
+
+class _App(object):
+
+    def __init__(self, url):
+        self.client_manager = _ClientManager(url)
+        self.stdin = sys.stdin
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+
+
+def run_command(url, entry_point, argv):
+    """Run a command against the server at url, in this process
+
+    :returns: dict with the wall time and the peak RSS in KiB
+    """
+    command = _load_command(entry_point)(_App(url), None)
+    parser = command.get_parser(entry_point.replace('_', ' '))
+    if 'formatter' in [action.dest for action in parser._actions]:
+        argv = argv + ['-f', 'json']
+    parsed_args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    command.run(parsed_args)
+    wall_time = time.perf_counter() - start
+    return {'wall_time': wall_time,
+            'peak_rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+
+def run_scenario(scenario, latency, sizes):
+    """Run a scenario in a child process against a fresh fake server"""
+    with fake_server.FakeNuageServer(latency=latency,
+                                     sizes=sizes) as server, \
+            tempfile.TemporaryDirectory() as cache_home:
+        argv = scenario.argv(server.data)
+        server.reset_stats()
+        child = subprocess.run(
+            [sys.executable, '-m', MODULE, '--run-command', server.url,
+             scenario.entry_point, json.dumps(argv)],
+            env=dict(os.environ, XDG_CACHE_HOME=cache_home),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if child.returncode:
+            raise RuntimeError('Scenario {!r} failed:\n{}'.format(
+                scenario.name, child.stderr))
+        result = json.loads(child.stdout)
+        result.update(server.stats())
+    return result
+
+
+# Measures, in a fresh interpreter, what loading the plugin costs every
+# openstack command, and whether loading all command modules, as
+# 'openstack --help' does, changes the upstream resources and commands.
+_IMPORT_SCRIPT = """
+import argparse, importlib, json, resource, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+plugin = importlib.import_module('nuage_neutronclient.osc.plugin')
+plugin.build_option_parser(argparse.ArgumentParser())
+wall_time = time.perf_counter() - start
+loaded = set(sys.modules) - before
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+heavy = sorted(m for m in loaded if m.split('.')[0] in {heavy_packages!r})
+checks = {upstream_checks!r}
+originals = [getattr(importlib.import_module(m), a, None) for m, a in checks]
+for module in {command_modules!r}:
+    importlib.import_module(module)
+patched = ['{{}}.{{}}'.format(m, a) for (m, a), original in
+           zip(checks, originals)
+           if getattr(importlib.import_module(m), a, None) is not original]
+print(json.dumps({{'wall_time': wall_time, 'peak_rss': peak_rss,
+                  'modules': len(loaded), 'heavy_modules': heavy,
+                  'patched_on_load': patched}}))
+"""
+
+# Packages only needed once a Nuage command runs
+HEAVY_PACKAGES = ('keystoneclient', 'neutronclient', 'openstack',
+                  'openstackclient', 'pkg_resources', 'six', 'vspk')
+
+# Upstream resources and helpers the command modules patch on demand
+UPSTREAM_CHECKS = (
+    ('openstack.network.v2.floating_ip', 'FloatingIP'),
+    ('openstack.network.v2.network', 'Network'),
+    ('openstack.network.v2.port', 'Port'),
+    ('openstack.network.v2.router', 'Router'),
+    ('openstack.network.v2.subnet', 'Subnet'),
+    ('openstackclient.network.v2.floating_ip', '_get_attrs'),
+    ('openstackclient.network.v2.port', '_get_attrs'),
+    ('openstackclient.network.v2.router', '_get_attrs'),
+    ('openstackclient.network.v2.subnet', '_get_attrs'),
+)
+
+
+def measure_imports():
+    """Measure the import of the plugin in a fresh interpreter"""
+    command_modules = sorted(set(value.split(':')[0] for value in
+                                 load_entry_points().values()))
+    script = _IMPORT_SCRIPT.format(heavy_packages=HEAVY_PACKAGES,
+                                   upstream_checks=UPSTREAM_CHECKS,
+                                   command_modules=command_modules)
+    child = subprocess.run([sys.executable, '-c', script],
+                           stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                           universal_newlines=True)
+    if child.returncode:
+        raise RuntimeError('Import measurement failed:\n' + child.stderr)
+    return json.loads(child.stdout)
+
+
+def run_all(latency, sizes, selected=None):
+    results = collections.OrderedDict()
+    for scenario in SCENARIOS:
+        if selected and scenario.name not in selected:
+            continue
+        results[scenario.name] = run_scenario(scenario, latency, sizes)
+    return {'latency': latency, 'sizes': sizes, 'results': results,
+            'imports': measure_imports()}
+
+
+def compare(baseline, current, bytes_tolerance, time_tolerance,
+            rss_tolerance):
+    """Return the regressions of current compared to baseline"""
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name)
+        if not reference:
+            continue
+        if result['requests'] > reference['requests']:
+            regressions.append('{}: {} requests, baseline {}'.format(
+                name, result['requests'], reference['requests']))
+        checks = (('bytes', bytes_tolerance),
+                  ('wall_time', time_tolerance),
+                  ('peak_rss', rss_tolerance))
+        for key, tolerance in checks:
+            if (tolerance is not None and
+                    result[key] > reference[key] * (1 + tolerance)):
+                regressions.append('{}: {} {:.6g}, baseline {:.6g}'.format(
+                    name, key, result[key], reference[key]))
+
+    imports, reference = current['imports'], baseline.get('imports')
+    if imports['patched_on_load']:
+        regressions.append('loading the commands patches {}'.format(
+            ', '.join(imports['patched_on_load'])))
+    if reference:
+        new_heavy = (set(imports['heavy_modules']) -
+                     set(reference['heavy_modules']))
+        if new_heavy:
+            regressions.append('plugin import loads {}'.format(
+                ', '.join(sorted(new_heavy))))
+        if (time_tolerance is not None and imports['wall_time'] >
+                reference['wall_time'] * (1 + time_tolerance)):
+            regressions.append('plugin import: wall_time {:.6g}, baseline '
+                               '{:.6g}'.format(imports['wall_time'],
+                                               reference['wall_time']))
+    return regressions
+
+
+def print_results(current, stream=sys.stdout):
+    stream.write('{:<42} {:>8} {:>10} {:>10} {:>10}\n'.format(
+        'Scenario', 'Requests', 'Bytes', 'Time (ms)', 'RSS (KiB)'))
+    for name, result in current['results'].items():
+        stream.write('{:<42} {:>8} {:>10} {:>10.1f} {:>10}\n'.format(
+            name, result['requests'], result['bytes'],
+            result['wall_time'] * 1000, result['peak_rss']))
+    imports = current['imports']
+    stream.write('\nPlugin import: {:.1f} ms, {} modules, {} KiB peak RSS\n'
+                 .format(imports['wall_time'] * 1000, imports['modules'],
+                         imports['peak_rss']))
+    stream.write('Heavy modules loaded by the plugin: {}\n'.format(
+        ', '.join(imports['heavy_modules']) or 'none'))
+    stream.write('Upstream patched by loading the commands: {}\n'.format(
+        ', '.join(imports['patched_on_load']) or 'none'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', metavar='<file>',
+                        help='Write the results as JSON to this file')
+    parser.add_argument('--compare', metavar='<file>', nargs='?',
+                        const=DEFAULT_BASELINE,
+                        help='Fail on regressions compared to this baseline '
+                             '(default: {})'.format(DEFAULT_BASELINE))
+    parser.add_argument('--latency', type=float, default=None,
+                        help='Latency of every request in seconds '
+                             '(default: baseline value or {})'.format(
+                                 DEFAULT_LATENCY))
+    parser.add_argument('--scenario', action='append', dest='scenarios',
+                        help='Only run this scenario, can be repeated')
+    parser.add_argument('--bytes-tolerance', type=float, default=0.1,
+                        help='Allowed relative growth of the response bytes')
+    parser.add_argument('--time-tolerance', type=float, default=None,
+                        help='Allowed relative growth of the wall time, not '
+                             'checked by default')
+    parser.add_argument('--rss-tolerance', type=float, default=None,
+                        help='Allowed relative growth of the peak RSS, not '
+                             'checked by default')
+    parser.add_argument('--run-command', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.run_command:
+        url, entry_point, command_argv = args.run_command
+        result = run_command(url, entry_point, json.loads(command_argv))
+        sys.stdout.write(json.dumps(result))
+        return 0
+
+    baseline = None
+    latency, sizes = DEFAULT_LATENCY, DEFAULT_SIZES
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        latency, sizes = baseline['latency'], baseline['sizes']
+    if args.latency is not None:
+        latency = args.latency
+
+    current = run_all(latency, sizes, args.scenarios)
+    print_results(current)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if baseline:
+        regressions = compare(baseline, current, args.bytes_tolerance,
+                              args.time_tolerance, args.rss_tolerance)
+        for regression in regressions:
+            sys.stderr.write('REGRESSION {}\n'.format(regression))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
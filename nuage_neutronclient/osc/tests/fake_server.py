@@ -0,0 +1,576 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""In-process stand-in for the Neutron API with the Nuage extensions
+
+The server keeps its resources in memory and serves the collections used by
+nuage_neutronclient.osc.v2.client.Client, with the Neutron semantics the
+client relies on: filtering on attributes, field selection, pagination with
+limit and marker, revision numbers with conditional GETs of a resource, and
+NeutronError fault bodies. It makes it possible to drive the client and the
+OSC commands without an OpenStack deployment or a VSD, e.g. to measure the
+number of requests a command needs:
+
+    with FakeNuageServer(latency=0.01, sizes={'nuage_gateways': 50}) as srv:
+        client = srv.make_client()
+        list(client.iter_nuage_gateways())
+        print(srv.stats())
+"""
+
+import copy
+import json
+import random
+import socketserver
+import threading
+import time
+import uuid
+
+from http import server as http_server
+from urllib import parse
+
+from nuage_neutronclient.osc.v2 import client as nuage_client
+
+API_PREFIX = '/v2.0'
+
+# Nuage attribute of a port to the collection of which the resources list
+# the ports they are attached to
+PORT_ATTACHMENTS = {
+    'nuage_policy_groups': 'nuage_policy_groups',
+    'nuage_redirect_targets': 'nuage_redirect_targets',
+    'nuage_floatingip': 'nuage_floatingips',
+}
+
+# Attributes which can be filtered on but, like in the Nuage plugin, are not
+# part of the resources returned
+HIDDEN_ATTRIBUTES = {
+    'nuage_floatingips': ('ports',),
+}
+
+# Collection in the URL (with '-' replaced by '_') to resource key
+COLLECTIONS = {
+    'net_partitions': 'net_partition',
+    'project_net_partition_mappings': 'project_net_partition_mapping',
+    'nuage_floatingips': 'nuage_floatingip',
+    'nuage_gateways': 'nuage_gateway',
+    'nuage_gateway_ports': 'nuage_gateway_port',
+    'nuage_gateway_vlans': 'nuage_gateway_vlan',
+    'nuage_gateway_vports': 'nuage_gateway_vport',
+    'nuage_l2bridges': 'nuage_l2bridge',
+    'nuage_policy_groups': 'nuage_policy_group',
+    'nuage_redirect_targets': 'nuage_redirect_target',
+    'switchport_bindings': 'switchport_binding',
+    'switchport_mappings': 'switchport_mapping',
+    'vsd_domains': 'vsd_domain',
+    'ports': 'port',
+    'routers': 'router',
+    'security_groups': 'security_group',
+    'subnets': 'subnet',
+}
+
+# Query parameters which filter on an attribute of another name
+FILTER_ALIASES = {
+    'vsd_domains': {'os_router_ids': 'os_router_id'},
+    'nuage_gateway_vlans': {'name': 'value'},
+}
+
+# Filters without which the Nuage plugin refuses to list a collection
+REQUIRED_FILTERS = {
+    'nuage_gateway_ports': 'gateway',
+    'nuage_gateway_vlans': 'gatewayport',
+}
+
+# Query parameters which are not filters
+NON_FILTERS = ('fields', 'limit', 'marker', 'page_reverse', 'sort_dir',
+               'sort_key', 'tenant')
+
+DEFAULT_SIZES = {
+    'net_partitions': 2,
+    'nuage_gateways': 4,
+    'nuage_gateway_ports': 4,  # per gateway
+    'nuage_gateway_vlans': 8,  # per gateway port
+    'nuage_floatingips': 10,
+    'nuage_l2bridges': 5,
+    'nuage_policy_groups': 10,
+    'nuage_redirect_targets': 5,
+    'ports': 20,
+    'routers': 5,
+    'subnets': 2,
+    'switchport_mappings': 10,
+    'project_net_partition_mappings': 5,
+}
+
+
+class FakeNuageData(object):
+    """In-memory resources of the fake server
+
+    :param sizes: dict of collection to the number of resources to generate,
+                  see DEFAULT_SIZES
+    :param seed: seed of the generated IDs, names and values
+    """
+
+    def __init__(self, sizes=None, seed=0):
+        self.sizes = dict(DEFAULT_SIZES, **(sizes or {}))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.collections = {collection: {} for collection in COLLECTIONS}
+        self.tenant_id = self.new_id().replace('-', '')
+        self._populate()
+
+    def new_id(self):
+        return str(uuid.UUID(int=self._random.getrandbits(128), version=4))
+
+    def add(self, collection, item):
+        item.setdefault('id', self.new_id())
+        item.setdefault('tenant_id', self.tenant_id)
+        item.setdefault('revision_number', 0)
+        self.collections[collection][item['id']] = item
+        return item
+
+    def _count(self, collection):
+        return self.sizes.get(collection, 0)
+
+    def _populate(self):
+        for i in range(self._count('net_partitions')):
+            self.add('net_partitions', {'name': 'netpartition-{}'.format(i)})
+        net_partition_ids = list(self.collections['net_partitions'])
+
+        ports = [self.add('ports', {
+            'name': 'port-{}'.format(i),
+            'mac_address': 'fa:16:3e:{:02x}:{:02x}:{:02x}'.format(
+                i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff),
+            'device_owner': 'compute:nova'})
+            for i in range(self._count('ports'))]
+        port_ids = [port['id'] for port in ports]
+
+        subnet_ids = [self.add('subnets', {
+            'name': 'subnet-{}'.format(i),
+            'cidr': '10.{}.{}.0/24'.format(i >> 8 & 0xff, i & 0xff),
+            'ip_version': 4})['id']
+            for i in range(self._count('subnets'))]
+
+        for i in range(self._count('routers')):
+            router = self.add('routers', {'name': 'router-{}'.format(i)})
+            if subnet_ids:
+                self.add('ports', {
+                    'name': '',
+                    'device_owner': 'network:router_interface',
+                    'device_id': router['id'],
+                    'fixed_ips': [{
+                        'subnet_id': subnet_ids[i % len(subnet_ids)],
+                        'ip_address': '10.{}.{}.1'.format(
+                            i >> 8 & 0xff, i & 0xff)}]})
+            self.add('vsd_domains', {
+                'name': router['id'],
+                'os_router_id': router['id'],
+                'net_partition_id': (net_partition_ids[0]
+                                     if net_partition_ids else None),
+                'type': 'L3',
+                'rd': '65534:{}'.format(i),
+                'rt': '65534:{}'.format(i),
+                'tunnel_type': 'VXLAN'})
+
+        for i in range(self._count('nuage_gateways')):
+            gateway = self.add('nuage_gateways', {
+                'name': 'gateway-{}'.format(i),
+                'type': 'VRSG',
+                'template': self.new_id(),
+                'systemid': '10.0.{}.{}'.format(i >> 8 & 0xff, i & 0xff),
+                'status': 'READY',
+                'redundant': False})
+            for j in range(self._count('nuage_gateway_ports')):
+                gw_port = self.add('nuage_gateway_ports', {
+                    'name': 'port{}'.format(j),
+                    'usermnemonic': None,
+                    'physicalname': 'port{}'.format(j),
+                    'vlan': None,
+                    'status': 'READY',
+                    'gateway': gateway['id']})
+                for value in range(1, self._count('nuage_gateway_vlans') + 1):
+                    self.add('nuage_gateway_vlans', {
+                        'value': value,
+                        'usermnemonic': None,
+                        'assigned': None,
+                        'status': 'READY',
+                        'gateway': gateway['id'],
+                        'gatewayport': gw_port['id'],
+                        'vport': None})
+
+        for i in range(self._count('nuage_policy_groups')):
+            self.add('nuage_policy_groups', {
+                'name': 'policygroup-{}'.format(i),
+                'description': None,
+                'type': 'SOFTWARE',
+                'scope': 'DOMAIN',
+                'evpn_tag': None,
+                'pg_id': self.new_id(),
+                'ports': port_ids[i::max(self._count('nuage_policy_groups'),
+                                         1)]})
+        for i in range(self._count('nuage_redirect_targets')):
+            self.add('nuage_redirect_targets', {
+                'name': 'redirecttarget-{}'.format(i),
+                'description': None,
+                'redundancy_enabled': False,
+                'insertion_mode': 'VIRTUAL_WIRE',
+                'subnet': (subnet_ids[i % len(subnet_ids)]
+                           if subnet_ids else None),
+                'ports': port_ids[i::max(
+                    self._count('nuage_redirect_targets'), 1)]})
+        for i in range(self._count('nuage_floatingips')):
+            self.add('nuage_floatingips', {
+                'floating_ip_address': '192.0.{}.{}'.format(
+                    i >> 8 & 0xff, i & 0xff),
+                'assigned': False})
+        for i in range(self._count('nuage_l2bridges')):
+            self.add('nuage_l2bridges', {
+                'name': 'l2bridge-{}'.format(i),
+                'nuage_subnet_id': self.new_id(),
+                'physnets': [{'physnet': 'physnet{}'.format(i),
+                              'segmentation_id': 100 + i,
+                              'segmentation_type': 'vlan'}]})
+        for i in range(self._count('switchport_mappings')):
+            self.add('switchport_mappings', {
+                'switch_id': '10.1.0.{}'.format(i % 256),
+                'switch_info': 'switch-{}'.format(i),
+                'port_id': 'port{}'.format(i),
+                'host_id': 'host-{}'.format(i),
+                'pci_slot': '0000:{:02x}:00.0'.format(i % 256),
+                'port_uuid': self.new_id(),
+                'bridge': None,
+                'redundant_port_uuid': None})
+        for i in range(self._count('security_groups')):
+            self.add('security_groups', {
+                'name': 'secgroup-{}'.format(i),
+                'description': '',
+                'security_group_rules': []})
+        if not net_partition_ids:
+            return
+        for i in range(self._count('project_net_partition_mappings')):
+            project = self.new_id().replace('-', '')
+            self.add('project_net_partition_mappings', {
+                'id': project,
+                'project': project,
+                'net_partition_id': net_partition_ids[
+                    i % len(net_partition_ids)]})
+
+    def query(self, collection, params):
+        """Return the resources of collection matching the filters"""
+        aliases = FILTER_ALIASES.get(collection, {})
+        filters = {}
+        for key, values in params.items():
+            if key in NON_FILTERS:
+                continue
+            filters[aliases.get(key, key)] = set(values)
+        with self._lock:
+            items = list(self.collections[collection].values())
+        return [item for item in items
+                if all(_matches(item.get(key), values)
+                       for key, values in filters.items())]
+
+    def get(self, collection, resource_id):
+        with self._lock:
+            return self.collections[collection].get(resource_id)
+
+    def create(self, collection, body):
+        item = dict(body)
+        if collection == 'project_net_partition_mappings':
+            item.setdefault('id', item.get('project'))
+        with self._lock:
+            item = self.add(collection, item)
+            if collection == 'ports':
+                self._attach_port(item['id'], body)
+            return copy.deepcopy(item)
+
+    def update(self, collection, resource_id, body):
+        with self._lock:
+            item = self.collections[collection].get(resource_id)
+            if item is not None:
+                item.update(body)
+                item['revision_number'] += 1
+                if collection == 'ports':
+                    self._attach_port(resource_id, body)
+            return copy.deepcopy(item)
+
+    def _attach_port(self, port_id, body):
+        """Reflect the Nuage attributes set on a port in the resources"""
+        for attr, collection in PORT_ATTACHMENTS.items():
+            if attr not in body:
+                continue
+            value = body[attr]
+            if isinstance(value, dict):
+                ids = {value['id']}
+            elif isinstance(value, str):
+                ids = {value}
+            else:
+                ids = set(value or ())
+            for item in self.collections[collection].values():
+                ports = [p for p in item.get('ports') or [] if p != port_id]
+                if item['id'] in ids:
+                    ports.append(port_id)
+                item['ports'] = ports
+
+    def delete(self, collection, resource_id):
+        with self._lock:
+            return self.collections[collection].pop(resource_id, None)
+
+
+def _matches(value, accepted):
+    if isinstance(value, list):
+        return any(str(v) in accepted for v in value)
+    if isinstance(value, bool):
+        value = str(value)
+        accepted = set(a.capitalize() for a in accepted)
+    return str(value) in accepted
+
+
+class _RequestHandler(http_server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body of a response are written separately, which
+    # delays the body of responses on a kept-alive connection otherwise
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _route(self):
+        url = parse.urlparse(self.path)
+        path = url.path
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+        if path.endswith('.json'):
+            path = path[:-len('.json')]
+        segments = [s for s in path.split('/') if s]
+        if segments and segments[0] == 'net-topology':
+            segments = segments[1:]
+        if segments:
+            segments[0] = segments[0].replace('-', '_')
+        collection = segments[0] if segments else None
+        if collection not in COLLECTIONS or len(segments) > 2:
+            return None, None, None
+        resource_id = segments[1] if len(segments) == 2 else None
+        return collection, resource_id, parse.parse_qs(url.query)
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length)) if length else {}
+
+    def _respond(self, status, body=None):
+        payload = json.dumps(body).encode('utf-8') if body is not None else b''
+        self.server.fake.record(self.command, self.path, len(payload))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('X-Openstack-Request-Id',
+                         'req-' + str(uuid.uuid4()))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _fault(self, status, error_type, message):
+        self._respond(status, {'NeutronError': {'type': error_type,
+                                                'message': message,
+                                                'detail': ''}})
+
+    def _not_found(self, what):
+        self._fault(404, 'NotFound', '{} could not be found.'.format(what))
+
+    def _handle(self):
+        fake = self.server.fake
+        if fake.latency:
+            time.sleep(fake.latency)
+        path = parse.urlparse(self.path).path.rstrip('/')
+        if self.command == 'GET' and path in ('', API_PREFIX):
+            return self._respond(200, self._versions())
+        collection, resource_id, params = self._route()
+        if collection is None:
+            return self._not_found('The resource')
+        resource = COLLECTIONS[collection]
+        data = fake.data
+
+        if self.command == 'GET' and resource_id is None:
+            required = REQUIRED_FILTERS.get(collection)
+            if required and required not in params:
+                return self._not_found('{} without {} filter'.format(
+                    collection, required))
+            return self._respond(200, self._list(collection, params))
+        if self.command == 'GET':
+            item = data.get(collection, resource_id)
+            if item is None:
+                return self._not_found('{} {}'.format(resource, resource_id))
+            tag = 'revision_number={}'.format(item['revision_number'])
+            if self.headers.get('If-None-Match') == tag:
+                return self._respond(304)
+            return self._respond(200, {resource: _select_fields(
+                collection, item, params.get('fields'))})
+        if self.command == 'POST' and resource_id is None:
+            body = self._read_body().get(resource)
+            if body is None:
+                return self._fault(400, 'BadRequest',
+                                   'Body must contain {}'.format(resource))
+            item = data.create(collection, body)
+            return self._respond(201, {resource: _select_fields(collection,
+                                                                item)})
+        if self.command == 'PUT' and resource_id is not None:
+            body = self._read_body().get(resource, {})
+            item = data.update(collection, resource_id, body)
+            if item is None:
+                return self._not_found('{} {}'.format(resource, resource_id))
+            return self._respond(200, {resource: _select_fields(collection,
+                                                                item)})
+        if self.command == 'DELETE' and resource_id is not None:
+            if data.delete(collection, resource_id) is None:
+                return self._not_found('{} {}'.format(resource, resource_id))
+            return self._respond(204)
+        self._fault(405, 'HTTPMethodNotAllowed',
+                    'Method {} is not allowed'.format(self.command))
+
+    def _versions(self):
+        return {'versions': [{
+            'id': API_PREFIX.lstrip('/'),
+            'status': 'CURRENT',
+            'links': [{'href': self.server.fake.url + API_PREFIX + '/',
+                       'rel': 'self'}]}]}
+
+    def _list(self, collection, params):
+        items = self.server.fake.data.query(collection, params)
+        items.sort(key=lambda item: item['id'])
+        body = {}
+        marker = params.get('marker', [None])[0]
+        if marker:
+            items = [item for item in items if item['id'] > marker]
+        limit = int(params.get('limit', [0])[0] or 0)
+        if limit and len(items) > limit:
+            items = items[:limit]
+            query = {key: values for key, values in params.items()
+                     if key != 'marker'}
+            query['marker'] = [items[-1]['id']]
+            body[collection + '_links'] = [{
+                'rel': 'next',
+                'href': '{}{}?{}'.format(
+                    self.server.fake.url, parse.urlparse(self.path).path,
+                    parse.urlencode(query, doseq=True))}]
+        fields = params.get('fields')
+        body[collection] = [_select_fields(collection, item, fields)
+                            for item in items]
+        return body
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+def _select_fields(collection, item, fields=None):
+    hidden = HIDDEN_ATTRIBUTES.get(collection, ())
+    item = {key: copy.deepcopy(value) for key, value in item.items()
+            if key not in hidden}
+    if not fields:
+        return item
+    return {key: value for key, value in item.items() if key in fields}
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, http_server.HTTPServer):
+
+    daemon_threads = True
+    # Accept the connections of concurrent clients like AsyncClient without
+    # overflowing the listen backlog
+    request_queue_size = 128
+
+
+class FakeNuageServer(object):
+    """Fake Neutron endpoint serving the Nuage API from memory
+
+    :param latency: seconds every request is delayed before it is handled
+    :param sizes: dict of collection to the number of generated resources
+    :param seed: seed of the generated dataset
+    """
+
+    def __init__(self, latency=0.0, sizes=None, seed=0):
+        self.latency = latency
+        self.data = FakeNuageData(sizes=sizes, seed=seed)
+        self.requests = []
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return 'http://{}:{}'.format(host, port)
+
+    def start(self):
+        self._httpd = _HTTPServer(('127.0.0.1', 0), _RequestHandler)
+        self._httpd.fake = self
+        # A short poll interval lets stop() return quickly, e.g. per test
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={'poll_interval': 0.05},
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def record(self, method, path, size):
+        with self._lock:
+            self.requests.append((method, path))
+            self.bytes_sent += size
+
+    def reset_stats(self):
+        with self._lock:
+            self.requests = []
+            self.bytes_sent = 0
+
+    def stats(self):
+        """Return the number of requests served and response bytes sent"""
+        with self._lock:
+            return {'requests': len(self.requests),
+                    'bytes': self.bytes_sent}
+
+    def make_client(self, **kwargs):
+        """Return a Nuage client talking to this server"""
+        return make_client(self.url, **kwargs)
+
+    def make_async_client(self, **kwargs):
+        """Return a Nuage AsyncClient talking to this server"""
+        return make_async_client(self.url, **kwargs)
+
+
+def make_client(url, **kwargs):
+    """Return a Nuage client talking to the fake server at url"""
+    return nuage_client.Client(endpoint_url=url, token='fake-token',
+                               **kwargs)
+
+
+def make_async_client(url, **kwargs):
+    """Return a Nuage AsyncClient talking to the fake server at url"""
+    from nuage_neutronclient.osc.v2 import async_client
+    return async_client.AsyncClient(endpoint_url=url, token='fake-token',
+                                    **kwargs)
+
+
+def make_network_client(url):
+    """Return an openstacksdk network proxy talking to the server at url"""
+    import openstack
+    connection = openstack.connection.Connection(
+        auth_type='none', auth={'endpoint': url},
+        network_endpoint_override=url + API_PREFIX + '/')
+    return connection.network
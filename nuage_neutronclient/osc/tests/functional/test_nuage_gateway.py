@@ -334,6 +334,23 @@ class NuageGatewayTests(base.TestCase):
         self.assertRaisesRegex(Exception, r'.*Unable\ to\ find.*',
                                self.openstack, cmd_delete)
 
+    def test_topology_cache(self):
+        cmd_list = ('nuage gateway port vlan list -f json --gateway {} {}'
+                    .format(self.gw_name, self.gw_port_name))
+        expected = json.loads(self.openstack(cmd_list))
+
+        cmd_output = json.loads(self.openstack('nuage cache refresh -f json'))
+        self.addCleanup(self.openstack, 'nuage cache clear')
+        counts = {row['Resource']: row['Count'] for row in cmd_output}
+        self.assertGreaterEqual(counts['nuage_gateway'], 1)
+        self.assertGreaterEqual(counts['nuage_gateway_port'], 2)
+
+        # Lookups served by the cache return the same output
+        self.assertEqual(expected, json.loads(self.openstack(cmd_list)))
+
+        self.assertEqual('', self.openstack('nuage cache clear'))
+        self.assertEqual(expected, json.loads(self.openstack(cmd_list)))
+
     def _verify_show_list_vlan_values(self, cmd_output, random_vlan,
                                       assigned=False):
         self.assertIsNone(observed=cmd_output['User mnemonic'])
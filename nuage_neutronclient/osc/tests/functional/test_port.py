@@ -246,6 +246,30 @@ class NuagePortTestsVSDManaged(PortTests):
         # delete and verify
         utils.delete_and_verify(self, 'port', port_name)
 
+    def test_port_list_nuage_details(self):
+        pg_name = utils.get_random_name()
+        pg_id = self.l3domain.create_child(vspk.NUPolicyGroup(
+            name=pg_name, type='SOFTWARE'))[0].id
+
+        port_names = [utils.get_random_name() for _ in range(2)]
+        for port_name in port_names:
+            self.openstack('port create -f json --nuage-policy-group {pg} '
+                           '--network {network} {name}'
+                           .format(pg=pg_name, network=self.NETWORK_NAME,
+                                   name=port_name))
+            self.addCleanup(self.openstack,
+                            'port delete {}'.format(port_name))
+
+        cmd_list = ('port list -f json --nuage-details --network {}'
+                    .format(self.NETWORK_NAME))
+        cmd_output = {port['Name']: port
+                      for port in json.loads(self.openstack(cmd_list))}
+        for port_name in port_names:
+            self.assertEqual(expected=osc_utils.format_list([pg_id]),
+                             observed=cmd_output[port_name][
+                                 'Nuage Policy Groups'])
+            self.assertIsNone(cmd_output[port_name]['Nuage Floating IP'])
+
     def test_nuage_redirect_target_option(self):
         # Note that this test only checks one redirect target per port
         # as it is unclear how to add multiple redirect targets at the moment
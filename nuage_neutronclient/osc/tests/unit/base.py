@@ -0,0 +1,71 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import io
+
+import testtools
+
+from nuage_neutronclient.osc.tests import fake_server
+
+
+class FakeClientManager(object):
+
+    def __init__(self, server):
+        self.nuageclient = server.make_client()
+        # The fake server has no Keystone, tests don't look up projects
+        self.identity = None
+
+
+class FakeApp(object):
+
+    def __init__(self, server):
+        self.client_manager = FakeClientManager(server)
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+
+
+class FakeServerTestCase(testtools.TestCase):
+    """Test case running a FakeNuageServer for every test
+
+    Subclasses can set SIZES to the number of resources to generate per
+    collection, see fake_server.DEFAULT_SIZES.
+    """
+
+    SIZES = None
+
+    def setUp(self):
+        super(FakeServerTestCase, self).setUp()
+        self.server = fake_server.FakeNuageServer(sizes=self.SIZES).start()
+        self.addCleanup(self.server.stop)
+        self.data = self.server.data
+
+    def requests_made(self, function, *args, **kwargs):
+        """Call function, return its result and the requests it made"""
+        self.server.reset_stats()
+        result = function(*args, **kwargs)
+        return result, list(self.server.requests)
+
+    def run_command(self, command_class, argv, app=None):
+        """Run an OSC command against the server, return its stdout"""
+        app = app or FakeApp(self.server)
+        app.stdout = io.StringIO()
+        command = command_class(app, None)
+        parsed_args = command.get_parser('openstack').parse_args(argv)
+        command.run(parsed_args)
+        return app.stdout.getvalue()
+
+    def first(self, collection):
+        """Return the generated resource of collection with the lowest ID"""
+        return self.data.collections[collection][
+            min(self.data.collections[collection])]
@@ -0,0 +1,103 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+
+from neutronclient.common import exceptions
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import reference_store
+
+
+class AsyncClientTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 6, 'nuage_gateway_ports': 1,
+             'nuage_gateway_vlans': 0, 'routers': 3}
+
+    def setUp(self):
+        super(AsyncClientTest, self).setUp()
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.client = self.server.make_async_client()
+        self.addCleanup(lambda: self.run_async(self.client.close()))
+        self.gateways = sorted(
+            self.data.collections['nuage_gateways'].values(),
+            key=lambda gateway: gateway['name'])
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def gather(self, coroutines):
+        return self.run_async(asyncio.gather(*coroutines))
+
+    def test_concurrent_lookups(self):
+        found, requests = self.requests_made(self.gather, (
+            self.client.find_resource('nuage_gateway', gateway['name'])
+            for gateway in self.gateways))
+        self.assertEqual([gateway['id'] for gateway in self.gateways],
+                         [gateway['id'] for gateway in found])
+        self.assertEqual(len(self.gateways), len(requests))
+
+        # The resolutions are memoized
+        _found, requests = self.requests_made(
+            self.run_async,
+            self.client.find_resource('nuage_gateway',
+                                      self.gateways[0]['name']))
+        self.assertEqual([], requests)
+
+    def test_concurrent_lookup_errors(self):
+        results = self.run_async(asyncio.gather(
+            self.client.find_resource('nuage_gateway', 'unknown'),
+            self.client.find_resource('nuage_gateway',
+                                      self.gateways[0]['name']),
+            return_exceptions=True))
+        self.assertIsInstance(results[0], exceptions.NotFound)
+        self.assertEqual(self.gateways[0]['id'], results[1]['id'])
+
+    def test_concurrent_l3domains(self):
+        router_ids = sorted(self.data.collections['routers'])
+        domains = self.gather(self.client.get_l3domain(router_id)
+                              for router_id in router_ids)
+        self.assertEqual(router_ids,
+                         [domain['os_router_id'] for domain in domains])
+
+    def test_iter_resources(self):
+        async def collect():
+            gateways = []
+            async for gateway in self.client.iter_nuage_gateways(
+                    page_size=4):
+                gateways.append(gateway)
+            return gateways
+
+        gateways, requests = self.requests_made(self.run_async, collect())
+        self.assertEqual(sorted(self.data.collections['nuage_gateways']),
+                         sorted(gateway['id'] for gateway in gateways))
+        self.assertEqual(2, len(requests))
+
+    def test_lookups_use_the_reference_store(self):
+        store = self.client.reference_store = (
+            reference_store.ReferenceStore())
+        self.run_async(self.client.find_resource(
+            'nuage_gateway', self.gateways[0]['name'], fields=['id']))
+        store.end_command()
+        found, requests = self.requests_made(self.gather, (
+            self.client.find_resource('nuage_gateway', gateway['name'],
+                                      fields=['id'])
+            for gateway in self.gateways))
+        self.assertEqual([gateway['id'] for gateway in self.gateways],
+                         [gateway['id'] for gateway in found])
+        # The collection is loaded once for the concurrent lookups
+        self.assertEqual(1, len(requests))
@@ -0,0 +1,164 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import functools
+from unittest import mock
+
+from neutronclient.common import exceptions
+from neutronclient.v2_0 import client as neutron_client
+import testtools
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2.cache import LRUCache
+from nuage_neutronclient.osc.v2 import client
+from nuage_neutronclient.osc.v2 import nuage_gateway
+from nuage_neutronclient.osc.v2 import profile
+
+
+class LRUCacheTest(testtools.TestCase):
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(max_size=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(1, cache.get('a'))
+        self.assertRaises(KeyError, cache.get, 'b')
+        self.assertEqual(2, len(cache))
+
+    def test_entries_expire(self):
+        cache = LRUCache(max_size=2, ttl=60)
+        with mock.patch('time.monotonic', return_value=0):
+            cache.set('a', 1)
+        with mock.patch('time.monotonic', return_value=61):
+            self.assertRaises(KeyError, cache.get, 'a')
+
+    def test_zero_ttl_disables_the_cache(self):
+        cache = LRUCache(max_size=2, ttl=0)
+        cache.set('a', 1)
+        self.assertRaises(KeyError, cache.get, 'a')
+
+    def test_invalidate(self):
+        cache = LRUCache(max_size=4, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.invalidate(lambda key: key == 'a')
+        self.assertRaises(KeyError, cache.get, 'a')
+        self.assertEqual(2, cache.get('b'))
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+
+
+class ResolutionCacheTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ResolutionCacheTest, self).setUp()
+        self.client = client.Client(endpoint_url='http://neutron:9696',
+                                    token='fake-token')
+        self.net_partition = {'id': 'np-id', 'name': 'np'}
+        self.lister = self.patch_lister(self.net_partition)
+
+    def patch_lister(self, *net_partitions):
+        patcher = mock.patch.object(
+            self.client, 'list_net_partitions',
+            return_value={'net_partitions': list(net_partitions)})
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_repeated_resolution_is_cached(self):
+        self.client.find_net_partition('np')
+        found = self.client.find_net_partition('np')
+        self.assertEqual(self.net_partition, found)
+        self.assertEqual(1, self.lister.call_count)
+
+    def test_cached_resolutions_are_copies(self):
+        self.client.find_net_partition('np')['name'] = 'changed'
+        self.assertEqual('np', self.client.find_net_partition('np')['name'])
+
+    def test_write_invalidates_resolutions(self):
+        self.client.find_net_partition('np')
+        with mock.patch.object(neutron_client.ClientBase, 'do_request'):
+            self.client.delete_net_partition(self.net_partition['id'])
+        self.client.find_net_partition('np')
+        self.assertEqual(2, self.lister.call_count)
+
+    def test_write_invalidates_resolutions_of_other_names(self):
+        mapping = {'id': 'project-id', 'name': 'project'}
+        resolve = functools.partial(self.client.find_resource,
+                                    'project_netpartition_mapping', 'project')
+        with mock.patch.object(
+                self.client, 'list_project_netpartition_mappings',
+                return_value={'project_netpartition_mappings': [mapping]}
+        ) as lister:
+            resolve()
+            with mock.patch.object(neutron_client.ClientBase, 'do_request'):
+                self.client.delete_project_netpartition_mapping('project-id')
+            resolve()
+        self.assertEqual(2, lister.call_count)
+
+    def test_failed_resolutions_are_not_cached(self):
+        self.lister = self.patch_lister()
+        self.assertRaises(exceptions.NotFound,
+                          self.client.find_net_partition, 'np')
+        self.lister = self.patch_lister(self.net_partition)
+        self.assertEqual(self.net_partition,
+                         self.client.find_net_partition('np'))
+
+
+class ShowCacheTest(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(ShowCacheTest, self).setUp()
+        self.profiler = profile.RequestProfiler()
+        self.client = self.server.make_client(profiler=self.profiler)
+        self.gateway = self.first('nuage_gateways')
+
+    def shows(self):
+        return [(r.path, r.status) for r in self.profiler.records
+                if r.path == '/nuage-gateways/{id}']
+
+    def test_projected_show_is_revalidated(self):
+        first = self.client.show_nuage_gateway(self.gateway['id'],
+                                               fields=['id', 'name'])
+        second = self.client.show_nuage_gateway(self.gateway['id'],
+                                                fields=['id', 'name'])
+        self.assertEqual({'id': self.gateway['id'],
+                          'name': self.gateway['name']},
+                         second['nuage_gateway'])
+        self.assertEqual(first, second)
+        self.assertEqual([200, 304],
+                         [status for _path, status in self.shows()])
+
+    def test_changed_resource_is_fetched_again(self):
+        self.client.show_nuage_gateway(self.gateway['id'], fields=['name'])
+        self.data.update('nuage_gateways', self.gateway['id'],
+                         {'name': 'renamed'})
+        shown = self.client.show_nuage_gateway(self.gateway['id'],
+                                               fields=['name'])
+        self.assertEqual({'name': 'renamed'}, shown['nuage_gateway'])
+        self.assertEqual([200, 200],
+                         [status for _path, status in self.shows()])
+
+    def test_repeated_show_command(self):
+        app = base.FakeApp(self.server)
+        app.client_manager.nuageclient = self.client
+        outputs = [self.run_command(nuage_gateway.ShowNuageGateway,
+                                    [self.gateway['name'], '-f', 'json'],
+                                    app=app)
+                   for _i in range(2)]
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertNotIn('revision_number', outputs[1])
+        self.assertEqual([200, 304],
+                         [status for _path, status in self.shows()])
@@ -0,0 +1,96 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from keystoneauth1 import noauth
+from keystoneauth1 import session as ks_session
+import testtools
+
+from nuage_neutronclient.osc import plugin
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import client
+from nuage_neutronclient.osc.v2 import connection_pool
+
+
+class MountAdapterTest(testtools.TestCase):
+
+    def setUp(self):
+        super(MountAdapterTest, self).setUp()
+        self.session = ks_session.Session().session
+
+    def test_adapter_keeps_tcp_alive(self):
+        adapter = connection_pool.mount_adapter(
+            self.session, 'https://neutron:9696/v2.0', 8)
+        self.assertIsInstance(adapter, ks_session.TCPKeepAliveAdapter)
+        self.assertEqual(8, adapter._pool_maxsize)
+        self.assertIs(adapter, self.session.get_adapter(
+            'https://neutron:9696/v2.0/ports'))
+        self.assertIsNot(adapter,
+                         self.session.get_adapter('https://keystone/v3'))
+
+    def test_adapter_of_the_same_size_is_kept(self):
+        url = 'https://neutron:9696'
+        adapter = connection_pool.mount_adapter(self.session, url, 8)
+        self.assertIs(adapter,
+                      connection_pool.mount_adapter(self.session, url, 8))
+        resized = connection_pool.mount_adapter(self.session, url, 16)
+        self.assertIsNot(adapter, resized)
+        self.assertEqual(16, resized.pool_size)
+
+
+class LazyMountTest(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(LazyMountTest, self).setUp()
+        self.session = ks_session.Session(
+            auth=noauth.NoAuth(endpoint=self.server.url))
+
+    def make_client(self, **kwargs):
+        return client.Client(session=self.session, **kwargs)
+
+    def test_mounted_on_the_first_request(self):
+        nuage = self.make_client(connection_pool_size=4)
+        with mock.patch.object(self.session, 'get_endpoint',
+                               wraps=self.session.get_endpoint) as endpoint:
+            nuage.get_resource_plural('nuage_gateway')
+            self.assertFalse(endpoint.called)
+            nuage.list_nuage_gateways()
+        adapter = self.session.session.get_adapter(self.server.url + '/v2.0')
+        self.assertIsInstance(adapter, connection_pool.NeutronHTTPAdapter)
+        self.assertEqual(4, adapter.pool_size)
+
+    def test_mounted_on_a_first_streamed_request(self):
+        nuage = self.make_client(connection_pool_size=4)
+        list(nuage.iter_nuage_gateways())
+        adapter = self.session.session.get_adapter(self.server.url + '/v2.0')
+        self.assertIsInstance(adapter, connection_pool.NeutronHTTPAdapter)
+
+    def test_not_mounted_without_pool_size(self):
+        self.make_client().list_nuage_gateways()
+        self.assertNotIsInstance(
+            self.session.session.get_adapter(self.server.url + '/v2.0'),
+            connection_pool.NeutronHTTPAdapter)
+
+    def test_make_client_does_not_authenticate(self):
+        instance = mock.Mock(
+            session=self.session, region_name=None, interface='public',
+            verify=True, cacert=None, nuage_reference_store=None,
+            _api_version={plugin.API_NAME: plugin.DEFAULT_API_VERSION},
+            _cli_options=mock.Mock(config={'nuageclient_pool_size': '6'}))
+        with mock.patch.object(self.session, 'get_endpoint') as endpoint:
+            nuage = plugin.make_client(instance)
+        self.assertFalse(endpoint.called)
+        self.assertFalse(instance.get_endpoint_for_service_type.called)
+        self.assertEqual(6, nuage.connection_pool_size)
@@ -0,0 +1,70 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from neutronclient.common import exceptions
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2.utils import run_concurrently
+
+
+class FakeNuageServerTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 7}
+
+    def setUp(self):
+        super(FakeNuageServerTest, self).setUp()
+        self.client = self.server.make_client()
+
+    def test_list_filters_and_selects_fields(self):
+        gateway = self.first('nuage_gateways')
+        gateways = self.client.list_nuage_gateways(
+            name=gateway['name'], fields=['id', 'name'])['nuage_gateways']
+        self.assertEqual([{'id': gateway['id'], 'name': gateway['name']}],
+                         gateways)
+
+    def test_list_paginates(self):
+        gateways, requests = self.requests_made(
+            lambda: list(self.client.iter_nuage_gateways(page_size=3)))
+        self.assertEqual(sorted(self.data.collections['nuage_gateways']),
+                         [gateway['id'] for gateway in gateways])
+        self.assertEqual(3, len(requests))
+
+    def test_required_filter(self):
+        self.assertRaises(exceptions.NotFound,
+                          self.client.list_nuage_gateway_ports)
+
+    def test_show_unknown_resource(self):
+        self.assertRaises(exceptions.NotFound,
+                          self.client.show_nuage_gateway, 'unknown')
+
+    def test_conditional_get(self):
+        gateway = self.first('nuage_gateways')
+        e = self.assertRaises(
+            exceptions.NeutronClientException, self.client.get,
+            self.client.nuage_gateway_path.format(id=gateway['id']),
+            headers={'If-None-Match': 'revision_number=0'})
+        self.assertEqual(304, e.status_code)
+
+    def test_update_increments_revision_number(self):
+        gateway = self.first('nuage_gateways')
+        self.client.put(
+            self.client.nuage_gateway_path.format(id=gateway['id']),
+            body={'nuage_gateway': {'name': 'renamed'}})
+        self.assertEqual(1, gateway['revision_number'])
+        self.assertEqual('renamed', gateway['name'])
+
+    def test_concurrent_requests(self):
+        results = run_concurrently(
+            lambda _i: self.client.list_nuage_gateways(), range(32), 16)
+        self.assertEqual([None] * 32, [error for _i, _r, error in results])
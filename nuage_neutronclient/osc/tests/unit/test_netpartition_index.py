@@ -0,0 +1,88 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+from unittest import mock
+
+from neutronclient.v2_0 import client as neutron_client
+import testtools
+
+from nuage_neutronclient import netpartition
+from nuage_neutronclient.netpartition_index import NetpartitionIndex
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import nuage_project_netpartition_mapping
+
+
+class NetpartitionIndexTest(testtools.TestCase):
+
+    def setUp(self):
+        super(NetpartitionIndexTest, self).setUp()
+        self.index = NetpartitionIndex([{'id': 'np1', 'name': 'one'},
+                                        {'id': 'np2', 'name': 'two'}])
+
+    def test_name(self):
+        self.assertEqual(2, len(self.index))
+        self.assertEqual('two', self.index.name('np2'))
+        self.assertIsNone(self.index.name('np3'))
+
+    def test_join(self):
+        mappings = [{'net_partition_id': 'np1'},
+                    {'net_partition_id': 'np3'},
+                    {}]
+        joined = self.index.join(mappings, name_key='name')
+        self.assertEqual({'net_partition_id': 'np1', 'name': 'one'},
+                         next(joined))
+        # The mappings are joined while iterating
+        self.assertEqual({'net_partition_id': 'np3'}, mappings[1])
+        self.assertEqual([{'net_partition_id': 'np3'}, {}], list(joined))
+
+
+class NetpartitionMappingListTest(base.FakeServerTestCase):
+
+    SIZES = {'net_partitions': 3, 'project_net_partition_mappings': 6}
+
+    def expected_rows(self):
+        names = dict((np['id'], np['name']) for np in
+                     self.data.collections['net_partitions'].values())
+        return sorted(
+            (mapping['project'], mapping['net_partition_id'],
+             names[mapping['net_partition_id']]) for mapping in
+            self.data.collections['project_net_partition_mappings'].values())
+
+    def test_osc_list(self):
+        output, requests = self.requests_made(
+            self.run_command,
+            nuage_project_netpartition_mapping
+            .ListNuageProjectNetpartitionMapping, ['-f', 'json'])
+        self.assertEqual(
+            self.expected_rows(),
+            sorted((row['Associated Project'], row['Netpartition ID'],
+                    row['Netpartition Name']) for row in json.loads(output)))
+        self.assertEqual(2, len(requests))
+
+    def test_neutron_cli_list(self):
+        command = netpartition.ProjectNetpartitionMappingList(
+            mock.Mock(), None)
+        self.patch(command, 'get_client', lambda: neutron_client.Client(
+            endpoint_url=self.server.url, token='fake-token'))
+        data = [dict(mapping) for mapping in
+                self.data.collections['project_net_partition_mappings']
+                .values()]
+        _result, requests = self.requests_made(command.extend_list, data,
+                                               None)
+        self.assertEqual(
+            self.expected_rows(),
+            sorted((row['project'], row['associated_netpartition_id'],
+                    row['associated_netpartition_name']) for row in data))
+        self.assertEqual(1, len(requests))
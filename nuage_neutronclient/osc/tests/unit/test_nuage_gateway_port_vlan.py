@@ -0,0 +1,72 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+from unittest import mock
+
+from neutronclient.common import exceptions
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import client
+from nuage_neutronclient.osc.v2 import nuage_gateway_port_vlan
+
+
+class CreateVLANRangeTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 1, 'nuage_gateway_ports': 1,
+             'nuage_gateway_vlans': 0}
+
+    def setUp(self):
+        super(CreateVLANRangeTest, self).setUp()
+        self.gw_port = self.first('nuage_gateway_ports')
+        self.port_args = ['--gateway', self.gw_port['gateway'],
+                          '--gatewayport', self.gw_port['name']]
+
+    def test_parse_vlan_range(self):
+        self.assertEqual(
+            [1, 2, 3, 7, 4094],
+            nuage_gateway_port_vlan.parse_vlan_range('3,1-3, 7,4094'))
+        for vlan_range in ('', '5-3', '4095', 'a-b'):
+            self.assertRaises(exceptions.CommandError,
+                              nuage_gateway_port_vlan.parse_vlan_range,
+                              vlan_range)
+
+    def test_range_is_reported_per_vlan(self):
+        output = self.run_command(
+            nuage_gateway_port_vlan.CreateNuageGatewayPortVLAN,
+            self.port_args + ['--range', '100-102', '-f', 'json'])
+        rows = json.loads(output)
+        self.assertEqual(['VLAN', 'ID', 'Status'], list(rows[0]))
+        self.assertEqual([100, 101, 102], [row['VLAN'] for row in rows])
+        vlans = self.data.collections['nuage_gateway_vlans']
+        self.assertEqual(sorted(vlans), sorted(row['ID'] for row in rows))
+
+    def test_failures_are_counted(self):
+        create = client.Client.create_nuage_gateway_vlan
+
+        def create_odd(self, body):
+            if body['nuage_gateway_vlan']['value'] % 2:
+                raise exceptions.Conflict()
+            return create(self, body)
+
+        with mock.patch.object(client.Client, 'create_nuage_gateway_vlan',
+                               create_odd):
+            self.assertRaisesRegex(
+                exceptions.CommandError, '^2 of 3 nuage gateway port VLAN',
+                self.run_command,
+                nuage_gateway_port_vlan.CreateNuageGatewayPortVLAN,
+                self.port_args + ['--range', '1-3'])
+        self.assertEqual(
+            [2], [vlan['value'] for vlan in
+                  self.data.collections['nuage_gateway_vlans'].values()])
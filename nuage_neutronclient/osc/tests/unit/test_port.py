@@ -0,0 +1,193 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import argparse
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from neutronclient.common import exceptions
+from osc_lib import exceptions as osc_exceptions
+import testtools
+
+from nuage_neutronclient.osc.tests import fake_server
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import port
+
+
+class SetPortPolicyGroupsTest(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(SetPortPolicyGroupsTest, self).setUp()
+        self.client = self.server.make_client()
+        self.policy_group = self.first('nuage_policy_groups')
+        self.port = mock.Mock(id=self.policy_group['ports'][0])
+
+    def nuage_attrs(self, **kwargs):
+        parsed_args = argparse.Namespace(
+            nuage_floatingip=None, nuage_redirect_target=None,
+            no_nuage_policy_groups=False, nuage_policy_group=None)
+        vars(parsed_args).update(kwargs)
+        attrs = {}
+        port.SetPort._handle_nuage_specific_attributes(
+            parsed_args, attrs, self.port, self.client)
+        return attrs
+
+    def test_unchanged_policy_groups_are_not_sent(self):
+        self.assertEqual({}, self.nuage_attrs(
+            nuage_policy_group=[self.policy_group['id']]))
+
+    def test_clear(self):
+        self.assertEqual({'nuage_policy_groups': []},
+                         self.nuage_attrs(no_nuage_policy_groups=True))
+
+    def test_clear_port_without_vport(self):
+        for error in (exceptions.BadRequest, exceptions.NotFound):
+            with mock.patch.object(self.client, 'list_nuage_policy_groups',
+                                   side_effect=error()):
+                self.assertEqual(
+                    {'nuage_policy_groups': []},
+                    self.nuage_attrs(no_nuage_policy_groups=True))
+                self.assertRaises(
+                    error, self.nuage_attrs,
+                    nuage_policy_group=[self.policy_group['id']])
+
+    def test_replace_port_without_vport(self):
+        lookup = self.client.list_nuage_policy_groups
+
+        def list_policy_groups(**params):
+            if 'ports' in params:
+                raise exceptions.BadRequest()
+            return lookup(**params)
+
+        with mock.patch.object(self.client, 'list_nuage_policy_groups',
+                               side_effect=list_policy_groups):
+            self.assertEqual(
+                {'nuage_policy_groups': [self.policy_group['id']]},
+                self.nuage_attrs(
+                    no_nuage_policy_groups=True,
+                    nuage_policy_group=[self.policy_group['name']]))
+
+
+class NuageAttrsForPortsTest(base.FakeServerTestCase):
+
+    SIZES = {'ports': 4, 'nuage_floatingips': 2}
+
+    def setUp(self):
+        super(NuageAttrsForPortsTest, self).setUp()
+        self.client = self.server.make_client()
+        self.port_ids = sorted(self.data.collections['ports'])
+        self.fip = self.first('nuage_floatingips')
+        self.data.update('ports', self.port_ids[1],
+                         {'nuage_floatingip': {'id': self.fip['id']}})
+
+    def test_floating_ips_are_looked_up_per_port(self):
+        nuage_attrs = port.get_nuage_attrs_for_ports(self.client,
+                                                     self.port_ids)
+        self.assertEqual(
+            {'id': self.fip['id'],
+             'floating_ip_address': self.fip['floating_ip_address']},
+            nuage_attrs[self.port_ids[1]]['nuage_floatingip'])
+        for port_id in self.port_ids[:1] + self.port_ids[2:]:
+            self.assertIsNone(nuage_attrs[port_id]['nuage_floatingip'])
+
+    def test_port_without_vport(self):
+        lookup = self.client.list_nuage_policy_groups
+
+        def list_policy_groups(**params):
+            if len(params.get('ports', ())) > 1:
+                raise exceptions.BadRequest()
+            return lookup(**params)
+
+        policy_group = self.first('nuage_policy_groups')
+        with mock.patch.object(self.client, 'list_nuage_policy_groups',
+                               side_effect=list_policy_groups):
+            nuage_attrs = port.get_nuage_attrs_for_ports(self.client,
+                                                         self.port_ids)
+        port_id = policy_group['ports'][0]
+        self.assertIn(policy_group['id'],
+                      nuage_attrs[port_id]['nuage_policy_groups'])
+        self.assertEqual(self.fip['id'], nuage_attrs[self.port_ids[1]][
+            'nuage_floatingip']['id'])
+
+
+class PortManifestTest(base.FakeServerTestCase):
+
+    SIZES = {'ports': 3, 'nuage_floatingips': 2}
+
+    def setUp(self):
+        super(PortManifestTest, self).setUp()
+        port.upstream_patch.ensure_applied()
+        self.client = self.server.make_client()
+        self.network = fake_server.make_network_client(self.server.url)
+        manifest_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, manifest_dir)
+        self.manifest = os.path.join(manifest_dir, 'manifest.yaml')
+        self.ports = self.data.query('ports',
+                                     {'device_owner': ['compute:nova']})
+        self.fip = self.first('nuage_floatingips')
+        self.data.update('ports', self.ports[0]['id'],
+                         {'nuage_floatingip': {'id': self.fip['id']}})
+
+    def write_manifest(self, content):
+        with open(self.manifest, 'w') as manifest_file:
+            manifest_file.write(content)
+
+    def update_ports(self):
+        _result, requests = self.requests_made(
+            port.update_ports_from_manifest, self.network, self.client,
+            self.manifest)
+        return [path for method, path in requests if method == 'PUT']
+
+    def test_unchanged_floating_ip_is_not_updated(self):
+        self.write_manifest('{}:\n  nuage_floatingip: {}\n'.format(
+            self.ports[0]['name'], self.fip['floating_ip_address']))
+        self.assertEqual([], self.update_ports())
+
+    def test_changed_floating_ip_is_updated(self):
+        self.write_manifest('{}:\n  nuage_floatingip: {}\n'.format(
+            self.ports[1]['name'], self.fip['floating_ip_address']))
+        updates = self.update_ports()
+        self.assertEqual(1, len(updates))
+        self.assertIn(self.ports[1]['id'], updates[0])
+
+    def test_attributes_must_be_a_mapping(self):
+        for content in ('port-0: 5\n', 'port-0: [nuage_floatingip]\n',
+                        'port-0:\n  name: port\n'):
+            self.write_manifest(content)
+            self.assertRaises(osc_exceptions.CommandError,
+                              port.load_nuage_manifest, self.manifest)
+
+
+class SetPortFromFileTest(testtools.TestCase):
+
+    def run_set(self, argv):
+        command = port.SetPort(mock.Mock(), None)
+        parsed_args = command.get_parser('openstack').parse_args(argv)
+        with mock.patch.object(port, 'update_ports_from_manifest') as update:
+            command.take_action(parsed_args)
+        return update
+
+    def test_other_options_are_rejected(self):
+        for argv in (['port-0'], ['--name', 'port'],
+                     ['--fixed-ip', 'ip-address=10.0.0.2'],
+                     ['--nuage-policy-group', 'policygroup-0'],
+                     ['--no-nuage-policy-groups']):
+            self.assertRaises(osc_exceptions.CommandError, self.run_set,
+                              ['--nuage-from-file', 'manifest.yaml'] + argv)
+
+    def test_manifest_alone(self):
+        update = self.run_set(['--nuage-from-file', 'manifest.yaml'])
+        self.assertTrue(update.called)
@@ -0,0 +1,93 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import io
+import json
+from unittest import mock
+
+import testtools
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import nuage_gateway
+from nuage_neutronclient.osc.v2 import profile
+
+
+class PathTemplateTest(testtools.TestCase):
+
+    def test_ids_are_replaced(self):
+        self.assertEqual(
+            '/ports/{id}/bindings/{id}',
+            profile.path_template('/ports/6d16ee18-5521-46dd-aba4-b180cb69ca38'
+                                  '/bindings/6d16ee18552146ddaba4b180cb69ca38'
+                                  '?fields=id'))
+        self.assertEqual('/nuage-gateways/gw1',
+                         profile.path_template('/nuage-gateways/gw1'))
+
+
+class RequestProfilerTest(base.FakeServerTestCase):
+
+    def setUp(self):
+        super(RequestProfilerTest, self).setUp()
+        self.profiler = profile.RequestProfiler()
+        self.client = self.server.make_client(profiler=self.profiler)
+
+    def test_requests_are_recorded(self):
+        gateway = self.first('nuage_gateways')
+        self.client.show_nuage_gateway(gateway['id'])
+        self.client.list_nuage_gateways()
+        self.assertEqual(
+            [('GET', '/nuage-gateways/{id}', 200),
+             ('GET', '/nuage-gateways', 200)],
+            [(r.method, r.path, r.status) for r in self.profiler.records])
+        totals = self.profiler.totals()
+        self.assertEqual(2, totals['requests'])
+        self.assertEqual(sum(r.size for r in self.profiler.records),
+                         totals['size'])
+
+    def test_reports(self):
+        self.client.list_nuage_gateways()
+        stream = io.StringIO()
+        self.profiler.report(stream, 'json')
+        report = json.loads(stream.getvalue())
+        self.assertEqual(1, report['totals']['requests'])
+        self.assertEqual('/nuage-gateways', report['requests'][0]['path'])
+
+        stream = io.StringIO()
+        self.profiler.report(stream)
+        self.assertIn('1 Nuage requests', stream.getvalue())
+
+    def test_reset(self):
+        self.client.list_nuage_gateways()
+        self.profiler.reset()
+        self.assertEqual([], self.profiler.records)
+        self.assertEqual(0, self.profiler.totals()['requests'])
+
+    def test_every_command_is_reported(self):
+        app = base.FakeApp(self.server)
+        client_manager = app.client_manager
+        client_manager.nuageclient = self.client
+        client_manager.nuage_profiler = self.profiler
+        client_manager._cli_options = mock.Mock(
+            config={'nuage_profile': 'json'})
+        reports = []
+        for gateway in list(self.data.collections['nuage_gateways'])[:2]:
+            with mock.patch('sys.stderr', new=io.StringIO()) as stderr:
+                self.run_command(nuage_gateway.ShowNuageGateway, [gateway],
+                                 app=app)
+            reports.append(json.loads(stderr.getvalue()))
+        # The second report has the requests of the second command only
+        self.assertNotEqual(0, reports[0]['totals']['requests'])
+        self.assertEqual(reports[0]['totals']['requests'],
+                         reports[1]['totals']['requests'])
+        self.assertEqual([], self.profiler.records)
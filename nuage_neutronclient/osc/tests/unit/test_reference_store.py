@@ -0,0 +1,135 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from neutronclient.common import exceptions
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import nuage_netpartition
+from nuage_neutronclient.osc.v2 import reference_store
+
+NET_PARTITION = 'net_partition'
+
+
+class ReferenceStoreTest(base.FakeServerTestCase):
+
+    SIZES = {'net_partitions': 4}
+
+    def setUp(self):
+        super(ReferenceStoreTest, self).setUp()
+        self.store = reference_store.ReferenceStore()
+        self.client = self.server.make_client(reference_store=self.store)
+        self.net_partitions = sorted(
+            self.data.collections['net_partitions'].values(),
+            key=lambda net_partition: net_partition['name'])
+
+    def find(self, name_or_id, fields=('id',)):
+        """Resolve a net partition, return it and the requests made"""
+        return self.requests_made(
+            self.client.find_resource, NET_PARTITION, name_or_id,
+            fields=list(fields) if fields else None)
+
+    def load(self):
+        self.find(self.net_partitions[0]['name'])
+        self.store.end_command()
+        self.find(self.net_partitions[1]['name'])
+
+    def test_not_loaded_within_a_command(self):
+        app = base.FakeApp(self.server)
+        app.client_manager.nuageclient = self.client
+        app.client_manager.nuage_reference_store = self.store
+        names = [net_partition['name']
+                 for net_partition in self.net_partitions[:3]]
+        _output, requests = self.requests_made(
+            self.run_command, nuage_netpartition.DeleteNuageNetpartition,
+            names, app=app)
+        gets = [path for method, path in requests if method == 'GET']
+        self.assertEqual(3, len(gets))
+        self.assertTrue(all('name=' in path for path in gets))
+        self.assertEqual(1, len(self.data.collections['net_partitions']))
+
+        # The next command of the shell loads the collection
+        remaining = self.net_partitions[3]
+        found, requests = self.find(remaining['name'])
+        self.assertEqual(remaining['id'], found['id'])
+        self.assertEqual(1, len(requests))
+        self.assertNotIn('name=', requests[0][1])
+
+    def test_loaded_names_are_resolved_from_memory(self):
+        self.load()
+        for net_partition in self.net_partitions:
+            found, requests = self.find(net_partition['name'],
+                                        fields=('id', 'name'))
+            self.assertEqual({'id': net_partition['id'],
+                              'name': net_partition['name']}, found)
+            self.assertEqual([], requests)
+        found, requests = self.find(self.net_partitions[2]['id'])
+        self.assertEqual(self.net_partitions[2]['id'], found['id'])
+        self.assertEqual([], requests)
+
+    def test_full_resources_are_found_by_the_server(self):
+        self.load()
+        net_partition = self.net_partitions[2]
+        found, requests = self.find(net_partition['name'], fields=None)
+        self.assertEqual(net_partition, found)
+        self.assertEqual(1, len(requests))
+
+    def test_revision_check(self):
+        self.store.check_interval = 0
+        self.load()
+        renamed, deleted = self.net_partitions[2:]
+        self.data.update('net_partitions', renamed['id'],
+                         {'name': 'renamed'})
+        self.data.delete('net_partitions', deleted['id'])
+        found, requests = self.find('renamed')
+        self.assertEqual(renamed['id'], found['id'])
+        # The revisions, then the changed net partition
+        self.assertEqual(2, len(requests))
+        self.assertIn(renamed['id'], requests[1][1])
+
+        # Unchanged net partitions are not fetched again
+        found, requests = self.find(self.net_partitions[0]['name'],
+                                    fields=('id', 'name'))
+        self.assertEqual(self.net_partitions[0]['id'], found['id'])
+        self.assertEqual(1, len(requests))
+        self.assertRaises(exceptions.NotFound,
+                          self.client.find_resource, NET_PARTITION,
+                          deleted['name'], fields=['id'])
+
+    def test_writes_expire_the_collection(self):
+        self.load()
+        created = self.client.create_net_partition('created')[NET_PARTITION]
+        found, requests = self.find('created')
+        self.assertEqual(created['id'], found['id'])
+        self.assertEqual(2, len(requests))
+
+        found, requests = self.find(self.net_partitions[0]['name'],
+                                    fields=('id', 'name'))
+        self.assertEqual([], requests)
+
+    def test_ambiguous_names_are_resolved_by_the_server(self):
+        self.load()
+        name = self.net_partitions[2]['name']
+        self.data.add('net_partitions', {'name': name})
+        self.store.expire([NET_PARTITION])
+        self.assertRaises(exceptions.NeutronClientNoUniqueMatch,
+                          self.client.find_resource, NET_PARTITION, name,
+                          fields=['id'])
+
+    def test_unknown_names_are_resolved_by_the_server(self):
+        self.load()
+        added = self.data.add('net_partitions', {'name': 'added'})
+        found, requests = self.find('added')
+        self.assertEqual(added['id'], found['id'])
+        self.assertEqual(1, len(requests))
+        self.assertIn('name=added', requests[0][1])
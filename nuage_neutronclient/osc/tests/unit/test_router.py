@@ -0,0 +1,94 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from nuage_neutronclient.osc.tests import fake_server
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import router
+
+
+class RouterNuageAttrsTest(base.FakeServerTestCase):
+
+    SIZES = {'routers': 3, 'subnets': 1}
+
+    def setUp(self):
+        super(RouterNuageAttrsTest, self).setUp()
+        self.client = self.server.make_client()
+        self.network = fake_server.make_network_client(self.server.url)
+        self.router_ids = sorted(self.data.collections['routers'])
+
+    def nuage_attrs(self):
+        return self.requests_made(
+            router.get_nuage_attrs_for_routers, self.network, self.client,
+            self.router_ids)
+
+    def test_interfaces_are_the_ports_but_the_gateway(self):
+        router_id = self.router_ids[0]
+        for owner in ('network:router_ha_interface',
+                      'network:router_gateway'):
+            self.data.add('ports', {'name': '', 'device_owner': owner,
+                                    'device_id': router_id,
+                                    'fixed_ips': [{'subnet_id': 's',
+                                                   'ip_address': owner}]})
+        attrs, _requests = self.nuage_attrs()
+        self.assertEqual(
+            ['10.0.0.1', 'network:router_ha_interface'],
+            sorted(info['ip_address']
+                   for info in attrs[router_id]['interfaces_info']))
+        for router_id in self.router_ids[1:]:
+            self.assertEqual(1, len(attrs[router_id]['interfaces_info']))
+
+    def test_domains(self):
+        attrs, requests = self.nuage_attrs()
+        domains = dict((domain['os_router_id'], domain) for domain in
+                       self.data.collections['vsd_domains'].values())
+        for router_id in self.router_ids:
+            self.assertEqual(domains[router_id]['rd'],
+                             attrs[router_id]['nuage_rd'])
+        self.assertEqual(2, len(requests))
+
+    def test_domains_without_router_id(self):
+        # Filtered on the router ID still, but without it in the response
+        domains = {}
+        for domain in self.data.collections['vsd_domains'].values():
+            domain['router'] = domain.pop('os_router_id')
+            domains[domain['router']] = domain
+        self.patch(fake_server, 'FILTER_ALIASES', dict(
+            fake_server.FILTER_ALIASES,
+            vsd_domains={'os_router_ids': 'router'}))
+
+        # matched by their name
+        attrs, requests = self.nuage_attrs()
+        for router_id in self.router_ids:
+            self.assertEqual(domains[router_id]['rt'],
+                             attrs[router_id]['nuage_rt'])
+        self.assertEqual(2, len(requests))
+
+        # looked up router by router
+        for domain in domains.values():
+            domain['name'] = 'unnamed'
+        attrs, requests = self.nuage_attrs()
+        for router_id in self.router_ids:
+            self.assertEqual(domains[router_id]['rt'],
+                             attrs[router_id]['nuage_rt'])
+        self.assertEqual(2 + len(self.router_ids), len(requests))
+
+        # a single unknown domain is looked up as well, rather than being
+        # assigned to the single router left
+        for router_id, domain in domains.items():
+            domain['name'] = router_id
+        domains[self.router_ids[0]]['name'] = 'unnamed'
+        attrs, requests = self.nuage_attrs()
+        self.assertEqual(domains[self.router_ids[0]]['rt'],
+                         attrs[self.router_ids[0]]['nuage_rt'])
+        self.assertEqual(3, len(requests))
@@ -0,0 +1,79 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from neutronclient import client as http_client
+from neutronclient.common import exceptions
+from neutronclient.v2_0 import client as neutron_client
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient import secgroup_index
+
+
+class SecurityGroupIndexTest(base.FakeServerTestCase):
+
+    SIZES = {'security_groups': 5}
+
+    def setUp(self):
+        super(SecurityGroupIndexTest, self).setUp()
+        self.client = neutron_client.Client(endpoint_url=self.server.url,
+                                            token='fake-token')
+        self.index = secgroup_index.SecurityGroupIndex(self.client)
+        self.names = dict(
+            (sg['id'], sg['name']) for sg in
+            self.data.collections['security_groups'].values())
+
+    def test_names(self):
+        unknown = self.data.new_id()
+        names, requests = self.requests_made(self.index.names,
+                                             list(self.names) + [unknown])
+        self.assertEqual(self.names, names)
+        self.assertEqual(1, len(requests))
+
+        # Known and missing IDs are not looked up again
+        names, requests = self.requests_made(self.index.names, [unknown])
+        self.assertEqual({}, names)
+        self.assertEqual([], requests)
+
+    def test_chunks_shrink_to_the_uri_length(self):
+        with mock.patch.object(http_client, 'MAX_URI_LEN', 200):
+            names, requests = self.requests_made(self.index.names,
+                                                 list(self.names))
+        self.assertEqual(self.names, names)
+        self.assertLess(1, len(requests))
+
+    def test_single_id_too_long_is_raised(self):
+        with mock.patch.object(http_client, 'MAX_URI_LEN', 10):
+            self.assertRaises(exceptions.RequestURITooLong,
+                              self.index.names, list(self.names))
+
+    def test_failed_lookup_is_not_remembered(self):
+        with mock.patch.object(self.index, '_list',
+                               side_effect=exceptions.ServiceUnavailable()):
+            self.assertRaises(exceptions.ServiceUnavailable,
+                              self.index.names, list(self.names))
+        names, requests = self.requests_made(self.index.names,
+                                             list(self.names))
+        self.assertEqual(self.names, names)
+        self.assertEqual(1, len(requests))
+
+    def test_replace_ids(self):
+        sg_id = sorted(self.names)[0]
+        rules = [{'remote_group_id': sg_id, 'origin_group_id': None},
+                 {'remote_group_id': 'unknown'}]
+        self.index.replace_ids(rules, ['remote_group_id', 'origin_group_id'])
+        self.assertEqual([{'remote_group_id': self.names[sg_id],
+                           'origin_group_id': None},
+                          {'remote_group_id': 'unknown'}], rules)
@@ -0,0 +1,160 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import json
+from unittest import mock
+
+from keystoneauth1 import noauth
+from keystoneauth1 import session as ks_session
+from neutronclient.common import exceptions
+import requests
+import testtools
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import client
+from nuage_neutronclient.osc.v2 import streaming
+
+
+def _chunked(body, size):
+    data = body.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class CollectionStreamTest(testtools.TestCase):
+
+    RESPONSE = {
+        'nuage_gateways_links': [{'rel': 'next', 'href': 'http://x/?a=1'}],
+        'nuage_gateways': [{'id': 'gw1', 'name': u'gwé', 'port': 12345},
+                           {'id': 'gw2', 'name': 'gw2', 'port': -1.5e3},
+                           {'id': 'gw3', 'name': None, 'port': []}],
+        'count': 3,
+    }
+
+    def test_every_chunk_size(self):
+        body = json.dumps(self.RESPONSE, indent=1)
+        for size in (1, 2, 3, 7, len(body)):
+            stream = streaming.CollectionStream(_chunked(body, size),
+                                                'nuage_gateways')
+            self.assertEqual(self.RESPONSE['nuage_gateways'], list(stream))
+            self.assertEqual(
+                {'nuage_gateways_links':
+                    self.RESPONSE['nuage_gateways_links'], 'count': 3},
+                stream.others)
+
+    def test_elements_are_decoded_lazily(self):
+        body = json.dumps({'items': [1, 2], 'tail': 'x' * 100})
+        chunks = iter(_chunked(body, 10))
+        stream = iter(streaming.CollectionStream(chunks, 'items'))
+        self.assertEqual(1, next(stream))
+        self.assertNotEqual([], list(chunks))
+
+    def test_empty_responses(self):
+        for body in ('{}', '{"items": []}', ' { "items" : [ ] } '):
+            stream = streaming.CollectionStream(_chunked(body, 1), 'items')
+            self.assertEqual([], list(stream))
+
+    def test_malformed_response(self):
+        for body in ('', '[]', '{"items": [1 2]}', '{"items": [1,'):
+            stream = streaming.CollectionStream(_chunked(body, 3), 'items')
+            self.assertRaises(ValueError, list, stream)
+
+
+class IterResourcesTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 7}
+
+    def setUp(self):
+        super(IterResourcesTest, self).setUp()
+        self.client = self.server.make_client()
+
+    def test_pages_are_followed(self):
+        gateways, requests = self.requests_made(
+            list, self.client.iter_nuage_gateways(page_size=3,
+                                                  fields=['id']))
+        self.assertEqual(sorted(self.data.collections['nuage_gateways']),
+                         sorted(gateway['id'] for gateway in gateways))
+        self.assertEqual(3, len(requests))
+
+    def test_without_pagination(self):
+        gateways, requests = self.requests_made(
+            list, self.client.iter_nuage_gateways(page_size=None))
+        self.assertEqual(7, len(gateways))
+        self.assertEqual(1, len(requests))
+
+    def test_errors_are_raised(self):
+        self.assertRaises(exceptions.NotFound, list,
+                          self.client.iter_nuage_gateway_vlans())
+
+
+def _failing_once(send):
+    calls = []
+
+    def request(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise requests.exceptions.ConnectionError('connection reset')
+        return send(*args, **kwargs)
+    return request
+
+
+class StreamRequestTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 3}
+
+    def setUp(self):
+        super(StreamRequestTest, self).setUp()
+        self.session = ks_session.Session(
+            auth=noauth.NoAuth(endpoint=self.server.url))
+
+    def make_client(self, **kwargs):
+        nuage = client.Client(retries=1, **kwargs)
+        nuage.retry_interval = 0
+        return nuage
+
+    def test_session_client(self):
+        nuage = self.make_client(session=self.session)
+        with mock.patch.object(self.session, 'request',
+                               wraps=self.session.request) as request:
+            gateways, requests_made = self.requests_made(
+                list, nuage.iter_nuage_gateways(page_size=2))
+        self.assertEqual(3, len(gateways))
+        self.assertEqual(2, len(requests_made))
+        self.assertEqual(2, request.call_count)
+        self.assertTrue(all(call[1]['stream']
+                            for call in request.call_args_list))
+
+    def test_session_client_retries(self):
+        nuage = self.make_client(session=self.session)
+        requests_session = self.session.session
+        with mock.patch.object(requests_session, 'request',
+                               side_effect=_failing_once(
+                                   requests_session.request)):
+            self.assertEqual(3, len(list(nuage.iter_nuage_gateways())))
+
+    def test_http_client_retries(self):
+        nuage = self.make_client(endpoint_url=self.server.url,
+                                 token='fake-token')
+        with mock.patch.object(client.requests, 'request',
+                               side_effect=_failing_once(requests.request)):
+            self.assertEqual(3, len(list(nuage.iter_nuage_gateways())))
+
+    def test_retries_are_exhausted(self):
+        nuage = self.make_client(endpoint_url=self.server.url,
+                                 token='fake-token')
+        with mock.patch.object(
+                client.requests, 'request',
+                side_effect=requests.exceptions.ConnectionError()) as send:
+            self.assertRaises(exceptions.ConnectionFailed, list,
+                              nuage.iter_nuage_gateways())
+        self.assertEqual(2, send.call_count)
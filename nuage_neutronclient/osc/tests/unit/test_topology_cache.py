@@ -0,0 +1,122 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from nuage_neutronclient.osc.tests import fake_server
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import nuage_gateway_port_vlan
+from nuage_neutronclient.osc.v2 import topology_cache
+
+
+class TopologyCacheTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 2, 'nuage_gateway_ports': 2,
+             'nuage_gateway_vlans': 3}
+
+    def setUp(self):
+        super(TopologyCacheTest, self).setUp()
+        cache_home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_home)
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = self.server.make_client()
+        self.cache = topology_cache.TopologyCache(self.client)
+        self.gateway = self.first('nuage_gateways')
+        self.gw_port = self.data.query(
+            'nuage_gateway_ports', {'gateway': [self.gateway['id']]})[0]
+        self.vlan = self.data.query(
+            'nuage_gateway_vlans', {'gatewayport': [self.gw_port['id']]})[0]
+
+    def test_path_is_scoped_by_endpoint_and_project(self):
+        url = self.server.url
+        paths = set(
+            topology_cache.TopologyCache(client).path for client in (
+                fake_server.make_client(url),
+                fake_server.make_client(url, project_id='project-a'),
+                fake_server.make_client(url, project_id='project-b'),
+                fake_server.make_client(url + '/other')))
+        self.assertEqual(4, len(paths))
+        self.assertEqual(
+            self.cache.path,
+            topology_cache.TopologyCache(fake_server.make_client(url)).path)
+
+    def test_refresh(self):
+        counts = self.cache.refresh()
+        self.assertEqual({'nuage_gateway': 2, 'nuage_gateway_port': 4,
+                          'nuage_gateway_vlan': 12}, counts)
+        self.assertTrue(topology_cache.TopologyCache(self.client).is_fresh())
+
+    def test_not_consulted_before_refresh(self):
+        found, requests = self.requests_made(
+            self.cache.find_id, 'nuage_gateway', self.gateway['name'])
+        self.assertIsNone(found)
+        self.assertEqual([], requests)
+
+    def test_find_is_revalidated(self):
+        self.cache.refresh()
+        found, requests = self.requests_made(
+            self.cache.find_nested_id, 'nuage_gateway_port',
+            self.gw_port['name'], 'nuage_gateway', self.gateway['name'])
+        self.assertEqual(self.gw_port['id'], found)
+        self.assertEqual(['GET', 'GET'],
+                         [method for method, _path in requests])
+
+    def test_deleted_resource_is_dropped(self):
+        self.cache.refresh()
+        self.data.delete('nuage_gateways', self.gateway['id'])
+        self.assertIsNone(
+            self.cache.find_id('nuage_gateway', self.gateway['name']))
+        found, requests = self.requests_made(
+            self.cache.find_id, 'nuage_gateway', self.gateway['name'])
+        self.assertIsNone(found)
+        self.assertEqual([], requests)
+
+    def test_renamed_resource_is_dropped(self):
+        self.cache.refresh()
+        self.data.update('nuage_gateways', self.gateway['id'],
+                         {'name': 'renamed'})
+        self.assertIsNone(
+            self.cache.find_id('nuage_gateway', self.gateway['name']))
+        self.assertIsNone(self.cache.find_id('nuage_gateway', 'renamed'))
+
+    def test_vlan_without_port_bypasses_the_cache(self):
+        self.cache.refresh()
+        value = str(self.vlan['value'])
+        with mock.patch.object(
+                nuage_gateway_port_vlan, 'find_nested_resource',
+                return_value={'id': 'found-by-server'}):
+            self.assertEqual('found-by-server',
+                             nuage_gateway_port_vlan.find_vlan_id(
+                                 self.client, value))
+        self.assertEqual(self.vlan['id'],
+                         nuage_gateway_port_vlan.find_vlan_id(
+                             self.client, value, self.gw_port['id']))
+
+    def test_created_vlan_is_recorded(self):
+        self.cache.refresh()
+        vlan = self.client.create_nuage_gateway_vlan(
+            {'nuage_gateway_vlan': {'value': 100,
+                                    'gatewayport': self.gw_port['id']}}
+        )['nuage_gateway_vlan']
+        self.cache.record('nuage_gateway_vlan', [vlan], self.gw_port['id'])
+        found, requests = self.requests_made(
+            self.cache.find_id, 'nuage_gateway_vlan', '100',
+            self.gw_port['id'])
+        self.assertEqual(vlan['id'], found)
+        self.assertEqual(1, len(requests))
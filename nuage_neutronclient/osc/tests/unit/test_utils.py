@@ -0,0 +1,45 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import argparse
+
+import testtools
+
+from nuage_neutronclient.osc.v2 import utils
+
+
+class _ArgumentParser(argparse.ArgumentParser):
+
+    def error(self, message):
+        raise ValueError(message)
+
+
+class ParallelArgumentTest(testtools.TestCase):
+
+    def setUp(self):
+        super(ParallelArgumentTest, self).setUp()
+        self.parser = _ArgumentParser()
+        utils.add_parallel_argument(self.parser)
+
+    def test_default(self):
+        self.assertEqual(1, self.parser.parse_args([]).parallel)
+
+    def test_positive(self):
+        self.assertEqual(
+            8, self.parser.parse_args(['--parallel', '8']).parallel)
+
+    def test_not_positive_is_rejected(self):
+        for value in ('0', '-2', 'x', '1.5'):
+            self.assertRaises(ValueError, self.parser.parse_args,
+                              ['--parallel', value])
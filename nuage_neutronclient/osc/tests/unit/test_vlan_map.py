@@ -0,0 +1,96 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from neutronclient.common import exceptions
+import testtools
+
+from nuage_neutronclient.osc.tests.unit import base
+from nuage_neutronclient.osc.v2 import vlan_map
+
+
+class VLANMapTest(testtools.TestCase):
+
+    def test_empty_map(self):
+        port_map = vlan_map.VLANMap()
+        self.assertEqual(0, port_map.used_count)
+        self.assertEqual(4095, port_map.free_count)
+        self.assertEqual([(0, 4094)], port_map.free_ranges())
+        self.assertEqual([], port_map.used_ranges())
+        self.assertEqual(0.0, port_map.utilization)
+
+    def test_ranges(self):
+        port_map = vlan_map.VLANMap.from_values([0, 1, 2, 10, '11', 4094])
+        self.assertEqual(6, port_map.used_count)
+        self.assertEqual([(0, 2), (10, 11), (4094, 4094)],
+                         port_map.used_ranges())
+        self.assertEqual([(3, 9), (12, 4093)], port_map.free_ranges())
+        self.assertFalse(port_map.is_free(10))
+        self.assertTrue(port_map.is_free(12))
+
+    def test_full_map(self):
+        port_map = vlan_map.VLANMap.from_values(range(vlan_map.VLAN_COUNT))
+        self.assertEqual([], port_map.free_ranges())
+        self.assertEqual(100.0, port_map.utilization)
+        self.assertEqual([], port_map.next_free(3))
+
+    def test_next_free(self):
+        port_map = vlan_map.VLANMap.from_values([0, 1, 3, 5, 6])
+        self.assertEqual([2], port_map.next_free())
+        self.assertEqual([2, 4, 7, 8], port_map.next_free(4))
+        self.assertEqual([7, 8], port_map.next_free(2, start=5))
+        self.assertEqual([4094], port_map.next_free(5, start=4094))
+        self.assertEqual([], port_map.next_free(0))
+
+    def test_format_ranges(self):
+        self.assertEqual('0-99,101', vlan_map.format_ranges([(0, 99),
+                                                             (101, 101)]))
+        self.assertEqual('', vlan_map.format_ranges([]))
+
+
+class BuildVLANMapsTest(base.FakeServerTestCase):
+
+    SIZES = {'nuage_gateways': 1, 'nuage_gateway_ports': 3,
+             'nuage_gateway_vlans': 5}
+
+    def setUp(self):
+        super(BuildVLANMapsTest, self).setUp()
+        self.client = self.server.make_client()
+        self.gw_ports = sorted(
+            self.data.collections['nuage_gateway_ports'].values(),
+            key=lambda gw_port: gw_port['name'])
+
+    def test_maps_of_the_ports(self):
+        vlan = self.data.query(
+            'nuage_gateway_vlans',
+            {'gatewayport': [self.gw_ports[1]['id']]})[0]
+        self.data.delete('nuage_gateway_vlans', vlan['id'])
+
+        maps, requests = self.requests_made(
+            vlan_map.build_vlan_maps, self.client, self.gw_ports)
+        self.assertEqual(self.gw_ports, [gw_port for gw_port, _map in maps])
+        used = [port_map.used_ranges() for _gw_port, port_map in maps]
+        remaining = [value for value in range(1, 6) if value != vlan['value']]
+        self.assertEqual([[(1, 5)],
+                          vlan_map.VLANMap.from_values(remaining)
+                          .used_ranges(),
+                          [(1, 5)]], used)
+        self.assertEqual(3, len(requests))
+
+    def test_listing_errors_are_raised(self):
+        with mock.patch.object(self.client, 'iter_nuage_gateway_vlans',
+                               side_effect=exceptions.NotFound()):
+            self.assertRaises(exceptions.NotFound, vlan_map.build_vlan_maps,
+                              self.client, self.gw_ports)
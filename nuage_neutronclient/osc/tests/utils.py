@@ -11,14 +11,12 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import configparser
 import json
 import random
 import sys
 from uuid import uuid4 as uuid
 
-from six import moves
-from vspk import v6 as vspk
-
 from openstackclient.tests.functional.base import ADMIN_CLOUD
 from openstackclient.tests.functional.base import execute
 
@@ -35,7 +33,7 @@ def is_dhcp_agent_present():
 
 
 def get_vsd_api_url():
-    config = moves.configparser.ConfigParser()
+    config = configparser.ConfigParser()
     try:
         config.read('/etc/neutron/plugins/nuage/plugin.ini')
         return 'https://' + config.get(section='restproxy', option='server')
@@ -46,7 +44,7 @@ def get_vsd_api_url():
 
 
 def get_vsd_net_parition_name():
-    config = moves.configparser.ConfigParser()
+    config = configparser.ConfigParser()
     try:
         config.read('/etc/neutron/plugins/nuage/plugin.ini')
         return config.get(section='restproxy',
@@ -59,6 +57,7 @@ def get_vsd_net_parition_name():
 
 
 def create_new_vspk_session():
+    from vspk import v6 as vspk
     session = vspk.NUVSDSession(
         username='csproot',
         password='csproot',
@@ -69,6 +68,7 @@ def create_new_vspk_session():
 
 
 def create_l2_domain(cleanup_registry, enterprise, address, netmask, gateway):
+    from vspk import v6 as vspk
     domain_template = enterprise.create_child(vspk.NUL2DomainTemplate(
         name=get_random_name(), dhcp_managed=True,
         address=address, netmask=netmask, gateway=gateway))[0]
@@ -82,6 +82,7 @@ def create_l2_domain(cleanup_registry, enterprise, address, netmask, gateway):
 
 
 def create_l3_domain(cleanup_registry, enterprise):
+    from vspk import v6 as vspk
     domain_template = enterprise.create_child(vspk.NUDomainTemplate(
         name=get_random_name()))[0]
     cleanup_registry.addCleanup(lambda: domain_template.delete())
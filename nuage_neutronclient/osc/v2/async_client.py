@@ -0,0 +1,408 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""asyncio variant of the Nuage client
+
+AsyncClient exposes the list_*, iter_*, show_*, create_*, update_* and
+delete_* methods of Client as coroutines, sent over a pool of aiohttp
+connections, so that many Nuage lookups can run concurrently on a single
+event loop:
+
+    async with AsyncClient(session=keystone_session) as nuage:
+        domains = await asyncio.gather(
+            *(nuage.get_l3domain(router_id) for router_id in router_ids))
+
+The client is authenticated like Client, with a keystone session or with a
+token and endpoint URL. aiohttp is an optional dependency, installed with
+the 'async' extra.
+"""
+
+import asyncio
+import collections
+import copy
+import json
+import logging
+import re
+import ssl
+import time
+import urllib.parse as urlparse
+
+from neutronclient import client as http_client
+from neutronclient.common import exceptions
+from neutronclient.common import utils
+from neutronclient.v2_0.client import UUID_PATTERN
+import requests
+
+from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2 import client
+
+LOG = logging.getLogger(__name__)
+
+# Maximum number of connections to Neutron kept open by an AsyncClient
+ASYNC_POOL_SIZE = 100
+
+_SUCCESS_CODES = (requests.codes.ok, requests.codes.created,
+                  requests.codes.accepted, requests.codes.no_content)
+
+
+def _ssl_context(verify, cert):
+    """Return the aiohttp ssl argument for requests style verify and cert"""
+    if verify is False:
+        return False
+    context = ssl.create_default_context(
+        cafile=verify if isinstance(verify, str) else None)
+    if cert:
+        if isinstance(cert, tuple):
+            context.load_cert_chain(*cert)
+        else:
+            context.load_cert_chain(cert)
+    return context
+
+
+class _ResourceIterator(object):
+    """Asynchronous iterator over the resources of a collection
+
+    The pages are listed one at a time, when the resources of the previous
+    page have been consumed.
+    """
+
+    def __init__(self, client, collection, path, params):
+        self._client = client
+        self._collection = collection
+        self._path = path
+        self._params = params
+        self._linkrel = 'previous' if params.get('page_reverse') else 'next'
+        self._items = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._items:
+            if self._params is None:
+                raise StopAsyncIteration
+            page = await self._client.get(self._path, params=self._params)
+            self._items.extend(page.get(self._collection, ()))
+            self._params = None
+            for link in page.get(self._collection + '_links', ()):
+                if link['rel'] == self._linkrel:
+                    self._params = urlparse.parse_qs(
+                        urlparse.urlparse(link['href']).query)
+                    break
+        return self._items.popleft()
+
+
+class _BlockingClient(object):
+    """Client of which the list_* methods wait for those of an AsyncClient
+
+    It is meant to be used outside of the thread of the event loop, by the
+    reference store.
+    """
+
+    def __init__(self, client, loop):
+        self._client = client
+        self._loop = loop
+
+    def get_resource_plural(self, resource):
+        return self._client.get_resource_plural(resource)
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def call(*args, **kwargs):
+            return asyncio.run_coroutine_threadsafe(
+                method(*args, **kwargs), self._loop).result()
+        return call
+
+
+class AsyncClient(client.Client):
+    """Nuage client of which the resource methods are coroutines
+
+    The resource methods of Client only build the path and body of a request
+    and return what get, post, put or delete return. Here those send the
+    request asynchronously, so the inherited list_*, show_*, create_*,
+    update_* and delete_* methods return awaitables, and the iter_* methods
+    asynchronous iterators. The resolution and response caches of Client
+    apply as well.
+
+    A client is bound to the event loop it is first used in. Close it, or use
+    it as an asynchronous context manager, to release its connections.
+
+    :param pool_size: maximum number of concurrent connections to Neutron
+    """
+
+    def __init__(self, pool_size=ASYNC_POOL_SIZE, **kwargs):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError(_("AsyncClient requires aiohttp, install "
+                                "nuage-openstack-neutronclient[async]"))
+        self._aiohttp = aiohttp
+        self.pool_size = pool_size
+        self._http = None
+        self._auth = None
+        # Created in the event loop of the client, as a lock is bound to
+        # the loop it is created in before Python 3.10
+        self._auth_lock = None
+        super(AsyncClient, self).__init__(**kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    def _get_http(self):
+        """Return the aiohttp session, created on first use"""
+        if self._http is None:
+            httpclient = self.httpclient
+            if isinstance(httpclient, http_client.SessionClient):
+                session = httpclient.session
+                verify, cert = session.verify, session.cert
+                timeout = session.timeout
+            else:
+                verify, cert = httpclient.verify_cert, None
+                timeout = httpclient.timeout
+            aiohttp = self._aiohttp
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size, ssl=_ssl_context(verify, cert)),
+                timeout=aiohttp.ClientTimeout(total=timeout))
+        return self._http
+
+    def _authenticate(self, reauthenticate):
+        """Return the endpoint URL and authentication headers
+
+        Authenticating may need requests to keystone, so this is run in an
+        executor.
+        """
+        httpclient = self.httpclient
+        if isinstance(httpclient, http_client.SessionClient):
+            if reauthenticate:
+                httpclient.invalidate()
+            return (httpclient.endpoint_url,
+                    httpclient.session.get_auth_headers(
+                        auth=httpclient.auth) or {})
+        if reauthenticate:
+            httpclient.authenticate()
+        httpclient.authenticate_and_fetch_endpoint_url()
+        return (httpclient.endpoint_url,
+                {'X-Auth-Token': httpclient.auth_token or ''})
+
+    async def _get_auth(self, rejected=None):
+        """Return the endpoint URL and authentication headers
+
+        :param rejected: authentication which Neutron answered with 401,
+                         which is replaced by a new one
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self._auth is None or self._auth is rejected:
+                self._auth = await asyncio.get_event_loop().run_in_executor(
+                    None, self._authenticate, rejected is not None)
+            return self._auth
+
+    def _convert_into_with_meta(self, item, resp):
+        # The request ID is taken from the aiohttp response here, the entity
+        # tag is read from the response by the callers that need it
+        request_id = resp.headers.get(http_client.REQ_ID_HEADER)
+        return super(client.Client, self)._convert_into_with_meta(
+            item, request_id)
+
+    async def _send_once(self, method, action, body, headers, auth):
+        endpoint_url, auth_headers = auth
+        uri_len = len(endpoint_url) + len(action)
+        if uri_len > http_client.MAX_URI_LEN:
+            raise exceptions.RequestURITooLong(
+                excess=uri_len - http_client.MAX_URI_LEN)
+        request_headers = {'Accept': 'application/json',
+                           'User-Agent': http_client.USER_AGENT}
+        if body:
+            request_headers['Content-Type'] = 'application/json'
+        request_headers.update(auth_headers)
+        request_headers.update(headers or {})
+        try:
+            async with self._get_http().request(
+                    method, endpoint_url + action, data=body,
+                    headers=request_headers) as resp:
+                return resp, await resp.read()
+        except self._aiohttp.ClientSSLError as e:
+            raise exceptions.SslCertificateValidationError(reason=str(e))
+        except (self._aiohttp.ClientError, asyncio.TimeoutError) as e:
+            LOG.debug("%s %s failed: %s", method, action, e)
+            raise exceptions.ConnectionFailed(reason=str(e))
+
+    async def _send(self, method, action, body=None, headers=None):
+        """Send a request, return the response and its body
+
+        A request rejected with 401 is sent once more after authenticating
+        again, as the token may have expired.
+        """
+        auth = await self._get_auth()
+        resp, replybody = await self._send_once(method, action, body,
+                                                headers, auth)
+        if resp.status == requests.codes.unauthorized:
+            auth = await self._get_auth(rejected=auth)
+            resp, replybody = await self._send_once(method, action, body,
+                                                    headers, auth)
+        return resp, replybody
+
+    async def _request(self, method, action, body=None, headers=None,
+                       params=None):
+        """Send a request, return the response and its deserialized body"""
+        if method != 'GET':
+            self._invalidate_caches(action)
+        path = action
+        action = self.action_prefix + action
+        if isinstance(params, dict) and params:
+            action += '?' + urlparse.urlencode(
+                utils.safe_encode_dict(params), doseq=1)
+        if body:
+            body = self.serialize(body)
+
+        start = time.monotonic()
+        status = size = None
+        try:
+            resp, replybody = await self._send(method, action, body=body,
+                                               headers=headers)
+            status, size = resp.status, len(replybody)
+        finally:
+            if self.profiler:
+                self.profiler.record(method, path, status,
+                                     time.monotonic() - start, size)
+
+        replybody = replybody.decode('utf-8', 'replace')
+        if resp.status not in _SUCCESS_CODES:
+            self._handle_fault_response(resp.status,
+                                        replybody or resp.reason, resp)
+        data = json.loads(replybody) if replybody else None
+        return resp, self._convert_into_with_meta(data, resp)
+
+    async def _retry(self, method, action, **kwargs):
+        """Call _request with the retry configuration of the client
+
+        Only idempotent requests should retry failed connection attempts.
+        """
+        max_attempts = self.retries + 1
+        for i in range(max_attempts):
+            try:
+                return await self._request(method, action, **kwargs)
+            except exceptions.ConnectionFailed:
+                if i < self.retries:
+                    LOG.debug('Retrying connection to Neutron service')
+                    await asyncio.sleep(self.retry_interval)
+                elif self.raise_errors:
+                    raise
+
+        if self.retries:
+            msg = (_("Failed to connect to Neutron server after %d attempts")
+                   % max_attempts)
+        else:
+            msg = _("Failed to connect Neutron server")
+        raise exceptions.ConnectionFailed(reason=msg)
+
+    async def do_request(self, method, action, body=None, headers=None,
+                         params=None):
+        _resp, data = await self._request(method, action, body=body,
+                                          headers=headers, params=params)
+        return data
+
+    async def retry_request(self, method, action, body=None, headers=None,
+                            params=None):
+        _resp, data = await self._retry(method, action, body=body,
+                                        headers=headers, params=params)
+        return data
+
+    async def find_resource(self, resource, name_or_id, project_id=None,
+                            cmd_resource=None, parent_id=None, fields=None):
+        """Find a resource by ID or else by name, memoizing the result"""
+        key = (resource, name_or_id, project_id, cmd_resource, parent_id,
+               tuple(fields) if fields else None)
+        try:
+            return copy.deepcopy(self._resolution_cache.get(key))
+        except KeyError:
+            pass
+        if self._uses_reference_store(resource, project_id, cmd_resource,
+                                      parent_id, fields):
+            # The store lists with blocking calls, so it is consulted from
+            # an executor thread while its requests run on the event loop
+            loop = asyncio.get_event_loop()
+            item = await loop.run_in_executor(
+                None, self.reference_store.find,
+                _BlockingClient(self, loop), resource, name_or_id)
+            if item is not None:
+                self._resolution_cache.set(key, copy.deepcopy(item))
+                return item
+        collection = self.get_resource_plural(resource)
+        lister = getattr(self, 'list_%s' % self.get_resource_plural(
+            cmd_resource or resource))
+        parent_args = (parent_id,) if parent_id else ()
+        params = {'fields': fields} if fields else {}
+        items = []
+        if re.match(UUID_PATTERN, name_or_id):
+            data = await lister(*parent_args, id=name_or_id, **params)
+            items = data[collection]
+        if not items:
+            if project_id:
+                params['tenant_id'] = project_id
+            data = await lister(*parent_args, name=name_or_id, **params)
+            items = data[collection]
+            if len(items) > 1:
+                raise exceptions.NeutronClientNoUniqueMatch(
+                    resource=resource, name=name_or_id)
+        if not items:
+            raise exceptions.NotFound(
+                message=_("Unable to find %(resource)s with name or id "
+                          "'%(name_or_id)s'") % {'resource': resource,
+                                                 'name_or_id': name_or_id})
+        self._resolution_cache.set(key, copy.deepcopy(items[0]))
+        return items[0]
+
+    async def _show_resource(self, resource, path, **_params):
+        params, projected = client._show_params(_params)
+        key, tag, cached = self._cached_response(path, params)
+        try:
+            resp, data = await self._retry(
+                'GET', path, params=params,
+                headers={'If-None-Match': tag} if tag else None)
+        except exceptions.NeutronClientException as e:
+            if cached is None or e.status_code != requests.codes.not_modified:
+                raise
+            data = copy.deepcopy(cached)
+        else:
+            self._cache_response(key, resource, data,
+                                 resp.headers.get('ETag'))
+        return client._strip_revision_number(data, resource, projected)
+
+    def _iter_resources(self, collection, path,
+                        page_size=client.ITER_PAGE_SIZE, **_params):
+        """Return an asynchronous iterator over the resources of a collection
+        """
+        if page_size:
+            _params.setdefault('limit', page_size)
+        return _ResourceIterator(self, collection, path, _params)
+
+    async def get_l3domain(self, router_id):
+        domains = await self.get(self.nuage_vsd_resource,
+                                 params={'os_router_ids': [router_id]})
+        try:
+            return domains['vsd_domains'][0]
+        except Exception:
+            return None
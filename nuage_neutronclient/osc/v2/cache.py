@@ -0,0 +1,68 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Caches used by the Nuage client to avoid repeated requests"""
+
+import collections
+import threading
+import time
+
+
+class LRUCache(object):
+    """Thread safe LRU cache of which the entries expire after a TTL
+
+    :param max_size: maximum number of entries, the least recently used
+                     entry is evicted when more entries are added
+    :param ttl: time in seconds an entry stays valid, 0 disables the cache
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the value stored for key
+
+        :raises: KeyError when there is no valid entry for key
+        """
+        with self._lock:
+            expiry, value = self._entries[key]
+            if expiry < time.monotonic():
+                del self._entries[key]
+                raise KeyError(key)
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate=None):
+        """Drop all entries, or only those for which predicate(key) holds"""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
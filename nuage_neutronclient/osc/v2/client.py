@@ -14,7 +14,84 @@
 #    under the License.
 #
 
+import contextlib
+import copy
+import threading
+import time
+import urllib.parse as urlparse
+
+from keystoneauth1 import adapter
+from keystoneauth1 import exceptions as ksa_exc
+from neutronclient import client as http_client
+from neutronclient.common import exceptions
+from neutronclient.common import utils
 from neutronclient.v2_0 import client
+import requests
+
+from nuage_neutronclient.osc.v2.cache import LRUCache
+from nuage_neutronclient.osc.v2 import connection_pool
+from nuage_neutronclient.osc.v2 import reference_store
+from nuage_neutronclient.osc.v2 import streaming
+
+# Defaults for the name or ID resolution cache of the client
+RESOLUTION_CACHE_SIZE = 256
+RESOLUTION_CACHE_TTL = 60
+
+# Defaults for the conditional GET cache of the show_* methods
+RESPONSE_CACHE_SIZE = 128
+RESPONSE_CACHE_TTL = 300
+
+# Number of resources requested per page by the iter_* methods
+ITER_PAGE_SIZE = 500
+
+
+def _revision_tag(revision_number):
+    """Entity tag of a revision, as understood by Neutron in If-Match"""
+    return 'revision_number={}'.format(revision_number)
+
+
+def _show_params(params):
+    """Add the revision number to the fields a show is restricted to
+
+    The revision number is the entity tag of a response without an ETag, so
+    it is needed to revalidate the response. Returns the params and whether
+    it was added.
+    """
+    fields = params.get('fields')
+    if not fields:
+        return params, False
+    fields = [fields] if isinstance(fields, str) else list(fields)
+    if 'revision_number' in fields:
+        return params, False
+    return dict(params, fields=fields + ['revision_number']), True
+
+
+def _strip_revision_number(data, resource, projected):
+    """Remove the revision number which _show_params added from data"""
+    if projected:
+        data.get(resource, {}).pop('revision_number', None)
+    return data
+
+
+def _action_collections(action):
+    return set(segment.replace('-', '_')
+               for segment in action.split('?')[0].split('/') if segment)
+
+
+def _collection_names(collections):
+    """Names under which collections of paths and resource plurals match
+
+    Paths and resource plurals do not agree on separators and on the nuage
+    prefix, e.g. project_net_partition_mappings is the collection of the
+    nuage_project_netpartition_mapping resources, so both are left out.
+    """
+    names = set()
+    for collection in collections:
+        name = collection.replace('-', '_')
+        if name.startswith('nuage_'):
+            name = name[len('nuage_'):]
+        names.add(name.replace('_', ''))
+    return names
 
 
 class Client(client.ClientBase):
@@ -50,8 +127,8 @@ class Client(client.ClientBase):
     # API has no way to report plurals, so we have to hard code them
     EXTED_PLURALS = {'nuage_l2bridges': 'nuage_l2bridge',
                      'nuage_policy_groups': 'nuage_policy_group',
-                     'nuage_project_netpartition_mapping':
-                         'nuage_project_netpartition_mappings',
+                     'nuage_project_netpartition_mappings':
+                         'nuage_project_netpartition_mapping',
                      'nuage_floating_ips': 'nuage_floating_ip',
                      'nuage_redirect_targets': 'nuage_redirect_target',
                      'vsd_domains': 'vsd_domain',
@@ -59,15 +136,284 @@ class Client(client.ClientBase):
 
     def __init__(self, **kwargs):
         """Initialize a new client via the Neutron v2.0 API."""
+        self._resolution_cache = LRUCache(
+            max_size=kwargs.pop('resolution_cache_size',
+                                RESOLUTION_CACHE_SIZE),
+            ttl=kwargs.pop('resolution_cache_ttl', RESOLUTION_CACHE_TTL))
+        self._response_cache = LRUCache(
+            max_size=kwargs.pop('response_cache_size', RESPONSE_CACHE_SIZE),
+            ttl=kwargs.pop('response_cache_ttl', RESPONSE_CACHE_TTL))
+        # RequestProfiler recording every request, see osc.v2.profile
+        self.profiler = kwargs.pop('profiler', None)
+        self._last_response = threading.local()
+        # ReferenceStore of the openstack shell, see osc.v2.reference_store
+        self.reference_store = kwargs.pop('reference_store', None)
+        # Connections to Neutron kept open, see osc.v2.connection_pool
+        self.connection_pool_size = kwargs.pop('connection_pool_size', None)
+        self._pool_lock = threading.Lock()
+        self._pool_mounted = False
         super(Client, self).__init__(**kwargs)
 
+    def _mount_connection_pool(self):
+        """Mount the connection pool on the session, before a first request
+
+        Called before every request, whether its response is streamed or
+        not. The endpoint of a session client is only looked up here, as
+        that authenticates the session.
+        """
+        if not self.connection_pool_size or self._pool_mounted:
+            return
+        with self._pool_lock:
+            if self._pool_mounted:
+                return
+            httpclient = self.httpclient
+            if isinstance(httpclient, http_client.SessionClient):
+                connection_pool.mount_adapter(
+                    httpclient.session.session, httpclient.endpoint_url,
+                    self.connection_pool_size)
+            self._pool_mounted = True
+
+    def do_request(self, method, action, body=None, headers=None,
+                   params=None):
+        self._mount_connection_pool()
+        if method != 'GET':
+            self._invalidate_caches(action)
+        if not self.profiler:
+            return super(Client, self).do_request(
+                method, action, body=body, headers=headers, params=params)
+
+        self._last_response.info = (None, None)
+        start = time.monotonic()
+        try:
+            return super(Client, self).do_request(
+                method, action, body=body, headers=headers, params=params)
+        finally:
+            status, size = self._last_response.info
+            self.profiler.record(method, action, status,
+                                 time.monotonic() - start, size)
+
+    def deserialize(self, data, status_code):
+        # Remember status and size of the response for the profiler
+        self._last_response.info = (status_code,
+                                    len(data) if data else 0)
+        return super(Client, self).deserialize(data, status_code)
+
+    def _convert_into_with_meta(self, item, resp):
+        # Remember the entity tag of the response for the response cache
+        self._last_response.etag = resp.headers.get('ETag')
+        return super(Client, self)._convert_into_with_meta(item, resp)
+
+    def _invalidate_caches(self, action):
+        """Forget the cached resources of the type modified by action"""
+        collections = _action_collections(action)
+        names = _collection_names(collections)
+
+        def listed_by_action(*resources):
+            return not names.isdisjoint(_collection_names(
+                self.get_resource_plural(resource)
+                for resource in resources if resource))
+
+        # Keyed by resource and cmd_resource, see find_resource
+        self._resolution_cache.invalidate(
+            lambda key: listed_by_action(key[0], key[3]))
+        self._response_cache.invalidate(
+            lambda key: not collections.isdisjoint(
+                _action_collections(key[0])))
+        if self.reference_store is not None:
+            self.reference_store.expire(
+                resource for resource in reference_store.RESOURCES
+                if listed_by_action(resource))
+
+    def find_resource(self, resource, name_or_id, project_id=None,
+                      cmd_resource=None, parent_id=None, fields=None):
+        """Find a resource by name or ID, memoizing the result
+
+        Successful resolutions are kept for the lifetime of the client,
+        bounded by the TTL and size of the resolution cache. Creating,
+        updating or deleting a resource through this client invalidates the
+        resolutions of that resource type.
+        """
+        key = (resource, name_or_id, project_id, cmd_resource, parent_id,
+               tuple(fields) if fields else None)
+        try:
+            return copy.deepcopy(self._resolution_cache.get(key))
+        except KeyError:
+            pass
+        item = None
+        if self._uses_reference_store(resource, project_id, cmd_resource,
+                                      parent_id, fields):
+            item = self.reference_store.find(self, resource, name_or_id)
+        if item is None:
+            item = super(Client, self).find_resource(
+                resource, name_or_id, project_id=project_id,
+                cmd_resource=cmd_resource, parent_id=parent_id,
+                fields=fields)
+        self._resolution_cache.set(key, copy.deepcopy(item))
+        return item
+
+    def _uses_reference_store(self, resource, project_id, cmd_resource,
+                              parent_id, fields):
+        """Whether a find_resource can be answered by the reference store
+
+        The store only has the ID and name of the resources, so only the
+        lookups asking for no other fields are answered from it.
+        """
+        return bool(self.reference_store is not None and
+                    self.reference_store.holds(resource) and
+                    not (project_id or cmd_resource or parent_id) and
+                    fields and set(fields).issubset(('id', 'name')))
+
     def _update_resource(self, path, **kwargs):
         revision_number = kwargs.pop('revision_number', None)
         if revision_number:
             headers = kwargs.setdefault('headers', {})
-            headers['If-Match'] = 'revision_number={}'.format(revision_number)
+            headers['If-Match'] = _revision_tag(revision_number)
         return self.put(path, **kwargs)
 
+    def _show_resource(self, resource, path, **_params):
+        """Show a resource, revalidating the response of a previous show
+
+        Responses are cached with their ETag, or else with the revision
+        number of the resource. A repeated show sends it in If-None-Match
+        and a 304 Not Modified response is served from the cache.
+        """
+        params, projected = _show_params(_params)
+        key, tag, cached = self._cached_response(path, params)
+        self._last_response.etag = None
+        try:
+            data = self.get(path, params=params,
+                            headers={'If-None-Match': tag} if tag else None)
+        except exceptions.NeutronClientException as e:
+            if cached is None or e.status_code != requests.codes.not_modified:
+                raise
+            data = copy.deepcopy(cached)
+        else:
+            self._cache_response(key, resource, data,
+                                 self._last_response.etag)
+        return _strip_revision_number(data, resource, projected)
+
+    def _cached_response(self, path, params):
+        """Return the cache key, entity tag and cached response of a show"""
+        key = (path, repr(sorted(params.items())))
+        try:
+            tag, cached = self._response_cache.get(key)
+        except KeyError:
+            tag = cached = None
+        return key, tag, cached
+
+    def _cache_response(self, key, resource, data, tag):
+        revision_number = data.get(resource, {}).get('revision_number')
+        if not tag and revision_number is not None:
+            tag = _revision_tag(revision_number)
+        if tag:
+            self._response_cache.set(key, (tag, copy.deepcopy(data)))
+
+    def _iter_resources(self, collection, path, page_size=ITER_PAGE_SIZE,
+                        **_params):
+        """Yield the resources of a collection one at a time
+
+        Pages of page_size resources are requested lazily, following the
+        pagination links returned by Neutron. Each page is decoded while it
+        is received, so a server that ignores the page size and returns the
+        whole collection at once does not make the response body, nor all
+        of its resources, be held in memory.
+        """
+        if page_size:
+            _params.setdefault('limit', page_size)
+        linkrel = 'previous' if _params.get('page_reverse') else 'next'
+        params = _params
+        while params is not None:
+            page = self._stream_resources(collection, path, params)
+            for item in page:
+                yield item
+            params = None
+            for link in page.others.get(collection + '_links', ()):
+                if link['rel'] == linkrel:
+                    params = urlparse.parse_qs(
+                        urlparse.urlparse(link['href']).query)
+                    break
+
+    def _stream_resources(self, collection, path, params):
+        """Send a list request and return its streamed CollectionStream"""
+        action = self.action_prefix + path
+        if params:
+            action += '?' + urlparse.urlencode(
+                utils.safe_encode_dict(params), doseq=1)
+        start = time.monotonic()
+        response = self._stream_request(action)
+        received = []
+
+        def chunks():
+            try:
+                with contextlib.closing(response):
+                    for chunk in response.iter_content(streaming.CHUNK_SIZE):
+                        received.append(len(chunk))
+                        yield chunk
+            finally:
+                if self.profiler:
+                    self.profiler.record(
+                        'GET', path, response.status_code,
+                        time.monotonic() - start, sum(received))
+
+        if response.status_code != requests.codes.ok:
+            body = b''.join(chunks()).decode('utf-8', 'replace')
+            self._handle_fault_response(response.status_code,
+                                        body or response.reason, response)
+        return streaming.CollectionStream(chunks(), collection)
+
+    def _stream_request(self, action):
+        """Send a GET request without reading its response body yet
+
+        The HTTP clients of neutronclient always read the whole body, so the
+        request is sent the way they send it, but with a streamed response.
+        Failed connections are retried like by retry_request.
+        """
+        self._mount_connection_pool()
+        attempts = self.retries + 1
+        for attempt in range(1, attempts + 1):
+            try:
+                return self._send_stream_request(action)
+            except (exceptions.ConnectionFailed, ksa_exc.ConnectionError):
+                if attempt == attempts:
+                    raise
+                time.sleep(self.retry_interval)
+
+    def _send_stream_request(self, action):
+        httpclient = self.httpclient
+        headers = {'Accept': 'application/json',
+                   'User-Agent': http_client.USER_AGENT}
+        if isinstance(httpclient, http_client.SessionClient):
+            httpclient._check_uri_length(action)
+            return adapter.Adapter.request(
+                httpclient, action, 'GET', headers=headers,
+                authenticated=True, raise_exc=False, stream=True)
+
+        httpclient.authenticate_and_fetch_endpoint_url()
+        httpclient._check_uri_length(action)
+        if httpclient.global_request_id:
+            headers[http_client.REQ_ID_HEADER] = (
+                httpclient.global_request_id)
+        response = self._send_http_stream_request(action, headers)
+        if response.status_code == requests.codes.unauthorized:
+            # The token may have expired, like in HTTPClient.do_request
+            response.close()
+            httpclient.authenticate()
+            response = self._send_http_stream_request(action, headers)
+        return response
+
+    def _send_http_stream_request(self, action, headers):
+        httpclient = self.httpclient
+        headers['X-Auth-Token'] = httpclient.auth_token or ''
+        try:
+            return requests.request(
+                'GET', httpclient.endpoint_url + action, headers=headers,
+                verify=httpclient.verify_cert, timeout=httpclient.timeout,
+                stream=True)
+        except requests.exceptions.SSLError as e:
+            raise exceptions.SslCertificateValidationError(reason=str(e))
+        except requests.exceptions.RequestException as e:
+            raise exceptions.ConnectionFailed(reason=str(e))
+
     def show_nuage_l2bridge(self, l2bridge, **_params):
         return self.get(self.nuage_l2bridge_path.format(id=l2bridge),
                         params=_params)
@@ -75,6 +421,10 @@ class Client(client.ClientBase):
     def list_nuage_l2bridges(self, **_params):
         return self.get(self.nuage_l2bridges_path, params=_params)
 
+    def iter_nuage_l2bridges(self, **_params):
+        return self._iter_resources(
+            'nuage_l2bridges', self.nuage_l2bridges_path, **_params)
+
     def create_nuage_l2bridge(self, body):
         return self.post(self.nuage_l2bridges_path, body=body)
 
@@ -97,6 +447,11 @@ class Client(client.ClientBase):
     def list_switchport_mappings(self, **_params):
         return self.get(self.nuage_switchport_mappings_path, params=_params)
 
+    def iter_switchport_mappings(self, **_params):
+        return self._iter_resources(
+            'switchport_mappings', self.nuage_switchport_mappings_path,
+            **_params)
+
     def show_switchport_mapping(self, id, **_params):
         return self.get(self.nuage_switchport_mapping_path.format(id=id),
                         params=_params)
@@ -104,6 +459,11 @@ class Client(client.ClientBase):
     def list_switchport_bindings(self, **_params):
         return self.get(self.nuage_switchport_bindings_path, params=_params)
 
+    def iter_switchport_bindings(self, **_params):
+        return self._iter_resources(
+            'switchport_bindings', self.nuage_switchport_bindings_path,
+            **_params)
+
     def show_switchport_binding(self, id, **_params):
         return self.get(self.nuage_switchport_binding_path.format(id=id),
                         params=_params)
@@ -117,16 +477,25 @@ class Client(client.ClientBase):
     def list_nuage_gateways(self, **_params):
         return self.get(self.nuage_gateways_path, params=_params)
 
+    def iter_nuage_gateways(self, **_params):
+        return self._iter_resources(
+            'nuage_gateways', self.nuage_gateways_path, **_params)
+
     def show_nuage_gateway(self, id, **_params):
-        return self.get(self.nuage_gateway_path.format(id=id),
-                        params=_params)
+        return self._show_resource(
+            'nuage_gateway', self.nuage_gateway_path.format(id=id), **_params)
 
     def list_nuage_gateway_ports(self, **_params):
         return self.get(self.nuage_gateway_ports_path, params=_params)
 
+    def iter_nuage_gateway_ports(self, **_params):
+        return self._iter_resources(
+            'nuage_gateway_ports', self.nuage_gateway_ports_path, **_params)
+
     def show_nuage_gateway_port(self, id, **_params):
-        return self.get(self.nuage_gateway_port_path.format(id=id),
-                        params=_params)
+        return self._show_resource(
+            'nuage_gateway_port', self.nuage_gateway_port_path.format(id=id),
+            **_params)
 
     def create_nuage_gateway_vport(self, body):
         return self.post(self.nuage_gateway_vports_path, body=body)
@@ -138,12 +507,20 @@ class Client(client.ClientBase):
     def list_nuage_gateway_vports(self, **_params):
         return self.get(self.nuage_gateway_vports_path, params=_params)
 
+    def iter_nuage_gateway_vports(self, **_params):
+        return self._iter_resources(
+            'nuage_gateway_vports', self.nuage_gateway_vports_path, **_params)
+
     def delete_nuage_gateway_vport(self, vport_id):
         return self.delete(self.nuage_gateway_vport_path.format(id=vport_id))
 
     def list_nuage_gateway_vlans(self, **_params):
         return self.get(self.nuage_gateway_vlans_path, params=_params)
 
+    def iter_nuage_gateway_vlans(self, **_params):
+        return self._iter_resources(
+            'nuage_gateway_vlans', self.nuage_gateway_vlans_path, **_params)
+
     def show_nuage_gateway_vlan(self, id, **_params):
         return self.get(self.nuage_gateway_vlan_path.format(id=id),
                         params=_params)
@@ -162,12 +539,14 @@ class Client(client.ClientBase):
         net_partition = {'net_partition': {'name': name}}
         return self.post(self.nuage_netpartitions_path, body=net_partition)
 
-    def find_net_partition(self, name_or_id):
+    def find_net_partition(self, name_or_id, fields=None):
         return self.find_resource(resource='net_partition',
-                                  name_or_id=name_or_id)
+                                  name_or_id=name_or_id, fields=fields)
 
-    def show_net_partition(self, id):
-        return self.get(self.nuage_netpartition_path.format(id=id))
+    def show_net_partition(self, id, **_params):
+        return self._show_resource(
+            'net_partition', self.nuage_netpartition_path.format(id=id),
+            **_params)
 
     def delete_net_partition(self, id):
         return self.delete(self.nuage_netpartition_path.format(id=id))
@@ -175,6 +554,10 @@ class Client(client.ClientBase):
     def list_net_partitions(self, **params):
         return self.get(self.nuage_netpartitions_path, params=params)
 
+    def iter_net_partitions(self, **params):
+        return self._iter_resources(
+            'net_partitions', self.nuage_netpartitions_path, **params)
+
     def create_project_netpartition_mapping(self, body):
         return self.post(self.nuage_project_netpartition_mappings_path,
                          body=body)
@@ -187,19 +570,35 @@ class Client(client.ClientBase):
         return self.get(self.nuage_project_netpartition_mappings_path,
                         params=params)
 
-    def show_project_netpartition_mapping(self, id):
+    def iter_project_netpartition_mappings(self, **params):
+        return self._iter_resources(
+            'project_net_partition_mappings',
+            self.nuage_project_netpartition_mappings_path, **params)
+
+    def show_project_netpartition_mapping(self, id, **_params):
         return self.get(
-            self.nuage_project_netpartition_mapping_path.format(id=id))
+            self.nuage_project_netpartition_mapping_path.format(id=id),
+            params=_params)
 
     def list_nuage_policy_groups(self, **_params):
         return self.get(self.nuage_policy_groups_path, params=_params)
 
-    def show_nuage_policy_group(self, id):
-        return self.get(self.nuage_policy_group_path.format(id=id))
+    def iter_nuage_policy_groups(self, **_params):
+        return self._iter_resources(
+            'nuage_policy_groups', self.nuage_policy_groups_path, **_params)
+
+    def show_nuage_policy_group(self, id, **_params):
+        return self._show_resource(
+            'nuage_policy_group', self.nuage_policy_group_path.format(id=id),
+            **_params)
 
     def list_nuage_floatingips(self, **_params):
         return self.get(self.nuage_floatingips_path, params=_params)
 
+    def iter_nuage_floatingips(self, **_params):
+        return self._iter_resources(
+            'nuage_floatingips', self.nuage_floatingips_path, **_params)
+
     def show_nuage_floatingip(self, id, **_params):
         return self.get(self.nuage_floatingip_path.format(id=id),
                         params=_params)
@@ -207,9 +606,18 @@ class Client(client.ClientBase):
     def list_nuage_redirect_targets(self, **_params):
         return self.get(self.nuage_redirect_targets_path, params=_params)
 
+    def iter_nuage_redirect_targets(self, **_params):
+        return self._iter_resources(
+            'nuage_redirect_targets', self.nuage_redirect_targets_path,
+            **_params)
+
     def show_nuage_redirect_target(self, id, **_params):
-        return self.get(self.nuage_redirect_target_path.format(id=id),
-                        params=_params)
+        return self._show_resource(
+            'nuage_redirect_target',
+            self.nuage_redirect_target_path.format(id=id), **_params)
+
+    def list_vsd_domains(self, **_params):
+        return self.get(self.nuage_vsd_resource, params=_params)
 
     def get_l3domain(self, router_id):
         domains = self.get(self.nuage_vsd_resource,
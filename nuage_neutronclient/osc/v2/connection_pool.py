@@ -0,0 +1,69 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Connection pool of the requests to the Neutron endpoint
+
+The requests library keeps at most 10 connections per host. Commands that
+send their requests concurrently, like the deletes with --parallel, open more
+connections than that, and the connections over the limit are closed after
+a single request, so their TCP and TLS handshakes are repeated for every
+request. A dedicated adapter, mounted for the Neutron endpoint on the
+session of the openstack client when the Nuage client sends its first
+request, keeps as many connections open as the configured pool size, for as
+long as the session lives, which is across the commands of an interactive
+openstack shell. Like the adapters keystoneauth mounts on its sessions, it
+enables TCP keep-alive on the connections.
+"""
+
+import logging
+import urllib.parse as urlparse
+
+from keystoneauth1 import session as ks_session
+
+LOG = logging.getLogger(__name__)
+
+
+class NeutronHTTPAdapter(ks_session.TCPKeepAliveAdapter):
+    """Transport adapter of the Neutron endpoint
+
+    :param pool_size: maximum number of connections kept open to Neutron
+    """
+
+    def __init__(self, pool_size):
+        self.pool_size = pool_size
+        super(NeutronHTTPAdapter, self).__init__(
+            pool_connections=1, pool_maxsize=pool_size)
+
+
+def mount_adapter(session, endpoint_url, pool_size):
+    """Mount a NeutronHTTPAdapter for an endpoint on a requests session
+
+    An adapter of the same pool size that is mounted already is kept, with
+    its open connections.
+
+    :param session: requests.Session to mount the adapter on
+    :param endpoint_url: URL of the Neutron endpoint
+    :param pool_size: maximum number of connections kept open to it
+    :returns: the adapter mounted for the endpoint
+    """
+    url = urlparse.urlsplit(endpoint_url)
+    prefix = '{}://{}/'.format(url.scheme, url.netloc)
+    adapter = session.adapters.get(prefix)
+    if (not isinstance(adapter, NeutronHTTPAdapter) or
+            adapter.pool_size != pool_size):
+        LOG.debug('Mounting an adapter of %d connections for %s',
+                  pool_size, prefix)
+        adapter = NeutronHTTPAdapter(pool_size)
+        session.mount(prefix, adapter)
+    return adapter
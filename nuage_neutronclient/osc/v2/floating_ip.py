@@ -13,6 +13,7 @@
 #    under the License.
 
 from nuage_neutronclient.osc.v2.utils import update_dict
+from nuage_neutronclient.osc.v2.utils import UpstreamPatch
 from openstack.network.v2.floating_ip import FloatingIP as OpenstackFloatingIP
 from openstack import resource
 from openstackclient.i18n import _
@@ -20,12 +21,6 @@ from openstackclient.network.v2 import floating_ip
 
 openstack_get_attrs = floating_ip._get_attrs
 
-# Add Nuage specific attributes to Openstack Floating IP
-OpenstackFloatingIP.nuage_ingress_fip_rate_kbps = \
-    resource.Body('nuage_ingress_fip_rate_kbps', type=int)
-OpenstackFloatingIP.nuage_egress_fip_rate_kbps = \
-    resource.Body('nuage_egress_fip_rate_kbps', type=int)
-
 
 def nuage_get_attrs(client_manager, parsed_args):
     attrs = openstack_get_attrs(client_manager, parsed_args)
@@ -49,9 +44,20 @@ def add_nuage_arguments(parser):
                'egress direction. Can be -1 for unlimited.'))
 
 
-floating_ip._get_attrs = nuage_get_attrs
+def _patch_upstream():
+    # Add Nuage specific attributes to Openstack Floating IP
+    OpenstackFloatingIP.nuage_ingress_fip_rate_kbps = \
+        resource.Body('nuage_ingress_fip_rate_kbps', type=int)
+    OpenstackFloatingIP.nuage_egress_fip_rate_kbps = \
+        resource.Body('nuage_egress_fip_rate_kbps', type=int)
+
+    floating_ip._get_attrs = nuage_get_attrs
+
+
+upstream_patch = UpstreamPatch(_patch_upstream)
 
 
+@upstream_patch
 class CreateFloatingIP(floating_ip.CreateFloatingIP):
 
     def update_parser_common(self, parser):
@@ -60,6 +66,7 @@ class CreateFloatingIP(floating_ip.CreateFloatingIP):
         return parser
 
 
+@upstream_patch
 class SetFloatingIP(floating_ip.SetFloatingIP):
 
     def get_parser(self, prog_name):
@@ -106,5 +113,6 @@ class SetFloatingIP(floating_ip.SetFloatingIP):
         floating_ip._tag.update_tags_for_set(client, obj, parsed_args)
 
 
+@upstream_patch
 class ShowFloatingIP(floating_ip.ShowFloatingIP):
     pass
@@ -16,14 +16,22 @@ from openstack.network.v2.network import Network as network_resource
 from openstack import resource
 from openstackclient.network.v2 import network
 
+from nuage_neutronclient.osc.v2.utils import UpstreamPatch
 
-# Add Nuage specific attributes to Openstack Subnet
-network_resource.nuage_l2bridge = resource.Body('nuage_l2bridge')
 
+def _patch_upstream():
+    # Add Nuage specific attributes to Openstack Network
+    network_resource.nuage_l2bridge = resource.Body('nuage_l2bridge')
 
+
+upstream_patch = UpstreamPatch(_patch_upstream)
+
+
+@upstream_patch
 class CreateNetwork(network.CreateNetwork):
     pass
 
 
+@upstream_patch
 class ShowNetwork(network.ShowNetwork):
     pass
@@ -0,0 +1,43 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import logging
+
+from osc_lib.command import command
+
+from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2 import topology_cache
+from nuage_neutronclient.osc.v2.utils import NuageCommand
+
+LOG = logging.getLogger(__name__)
+
+
+class RefreshNuageCache(NuageCommand, command.Lister):
+    """Refresh the local cache of the Nuage gateway topology"""
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.nuageclient
+        cache = topology_cache.TopologyCache(client)
+        counts = cache.refresh()
+        LOG.debug('Refreshed nuage topology cache %s', cache.path)
+
+        headers = (_('Resource'), _('Count'))
+        return headers, sorted(counts.items())
+
+
+class ClearNuageCache(NuageCommand, command.Command):
+    """Remove the local cache of the Nuage gateway topology"""
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.nuageclient
+        topology_cache.TopologyCache(client).clear()
@@ -17,8 +17,11 @@ import logging
 from openstackclient.network import sdk_utils
 from osc_lib.command import command
 from osc_lib import utils
+from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -26,9 +29,11 @@ LOG = logging.getLogger(__name__)
 # This is not a dict because order is important in Nuage floating ip list/show
 _column_map = [('ID', 'id'), ('Floating_ip_address', 'floating_ip_address'),
                ('Assigned', 'assigned')]
+_attr_map = [(attr, header, column_util.LIST_BOTH)
+             for header, attr in _column_map]
 
 
-class ListNuageFloatingIP(command.Lister):
+class ListNuageFloatingIP(NuageCommand, command.Lister):
     """List Nuage Floating IPs"""
 
     def get_parser(self, prog_name):
@@ -62,13 +67,13 @@ class ListNuageFloatingIP(command.Lister):
             parsed_args=parsed_args)
 
         floatingips = (self.app.client_manager.nuageclient
-                       .list_nuage_floatingips(**filters)['nuage_floatingips'])
+                       .iter_nuage_floatingips(fields=attrs, **filters))
 
         return (headers, (utils.get_dict_properties(
             s, attrs) for s in floatingips))
 
 
-class ShowNuageFloatingIP(command.ShowOne):
+class ShowNuageFloatingIP(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Floating IP"""
 
     def get_parser(self, prog_name):
@@ -86,7 +91,8 @@ class ShowNuageFloatingIP(command.ShowOne):
         client = self.app.client_manager.nuageclient
 
         obj = client.show_nuage_floatingip(
-            parsed_args.nuage_floatingip)['nuage_floatingip']
+            parsed_args.nuage_floatingip,
+            fields=get_fields(_attr_map, parsed_args))['nuage_floatingip']
         columns = sdk_utils.get_osc_show_columns_for_sdk_resource(
             obj, dict(_column_map))
         return columns[0], utils.get_dict_properties(obj, columns[1])
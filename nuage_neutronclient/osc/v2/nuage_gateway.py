@@ -18,6 +18,8 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -35,13 +37,14 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class ListNuageGateway(command.Lister):
+class ListNuageGateway(NuageCommand, command.Lister):
     """List Nuage Gateway"""
 
-    def take_action(self, _):
+    def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
 
-        items = client.list_nuage_gateways()[RESOURCE_NAME_PLURAL]
+        items = client.iter_nuage_gateways(
+            fields=get_fields(_attr_map, parsed_args, long_listing=False))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
@@ -49,7 +52,7 @@ class ListNuageGateway(command.Lister):
                           for obj in items))
 
 
-class ShowNuageGateway(command.ShowOne):
+class ShowNuageGateway(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Gateway"""
 
     def get_parser(self, prog_name):
@@ -65,8 +68,10 @@ class ShowNuageGateway(command.ShowOne):
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
         gw_id = client.find_resource(RESOURCE_NAME,
-                                     parsed_args.nuage_gateway)['id']
-        obj = client.show_nuage_gateway(gw_id)[RESOURCE_NAME]
+                                     parsed_args.nuage_gateway,
+                                     fields=['id'])['id']
+        obj = client.show_nuage_gateway(
+            gw_id, fields=get_fields(_attr_map, parsed_args))[RESOURCE_NAME]
         columns, display_columns = column_util.get_columns(obj, _attr_map)
         data = utils.get_dict_properties(obj, columns)
         return display_columns, data
@@ -18,9 +18,11 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
 from nuage_neutronclient.osc.v2.nuage_gateway \
     import RESOURCE_NAME as GW_RESOURCE_NAME
 from nuage_neutronclient.osc.v2.utils import find_nested_resource
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -37,7 +39,7 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class ListNuageGatewayPort(command.Lister):
+class ListNuageGatewayPort(NuageCommand, command.Lister):
     """List Nuage Gateway Port"""
 
     def get_parser(self, prog_name):
@@ -53,10 +55,12 @@ class ListNuageGatewayPort(command.Lister):
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
         gw_id = client.find_resource(GW_RESOURCE_NAME,
-                                     parsed_args.nuage_gateway)['id']
+                                     parsed_args.nuage_gateway,
+                                     fields=['id'])['id']
 
-        items = client.list_nuage_gateway_ports(
-            gateway=gw_id)[RESOURCE_NAME_PLURAL]
+        items = client.iter_nuage_gateway_ports(
+            gateway=gw_id,
+            fields=get_fields(_attr_map, parsed_args, long_listing=False))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
@@ -64,7 +68,7 @@ class ListNuageGatewayPort(command.Lister):
                           for obj in items))
 
 
-class ShowNuageGatewayPort(command.ShowOne):
+class ShowNuageGatewayPort(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Gateway Port"""
 
     def get_parser(self, prog_name):
@@ -86,17 +90,20 @@ class ShowNuageGatewayPort(command.ShowOne):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
+        fields = get_fields(_attr_map, parsed_args)
 
         obj = find_nested_resource(
             name_or_id=parsed_args.nuage_gateway_port,
             parent_name_or_id=parsed_args.gateway,
             resource_finder=(
-                lambda x: client.show_nuage_gateway_port(x)[RESOURCE_NAME]),
+                lambda x: client.show_nuage_gateway_port(
+                    x, fields=fields)[RESOURCE_NAME]),
             resource_lister=(
                 lambda **kwargs: client.list_nuage_gateway_ports(
-                    **kwargs)[RESOURCE_NAME_PLURAL]),
+                    fields=fields, **kwargs)[RESOURCE_NAME_PLURAL]),
             parent_resource_finder=(
-                lambda x: client.find_resource(GW_RESOURCE_NAME, x)),
+                lambda x: client.find_resource(GW_RESOURCE_NAME, x,
+                                               fields=['id'])),
             resource_name='gatewayport',
             parent_resource_name='gateway'
         )
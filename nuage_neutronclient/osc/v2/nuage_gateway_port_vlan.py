@@ -26,13 +26,21 @@ from nuage_neutronclient.osc.v2.nuage_gateway_port \
     import RESOURCE_NAME as GW_PORT_RESOURCE
 from nuage_neutronclient.osc.v2.nuage_gateway_port \
     import RESOURCE_NAME_PLURAL as GW_PORT_RESOURCE_PLURAL
+from nuage_neutronclient.osc.v2 import topology_cache
+from nuage_neutronclient.osc.v2 import vlan_map
 from nuage_neutronclient.osc.v2.utils import find_nested_resource
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
+from nuage_neutronclient.osc.v2.utils import run_concurrently
 
 LOG = logging.getLogger(__name__)
 
 RESOURCE_NAME = 'nuage_gateway_vlan'
 RESOURCE_NAME_PLURAL = 'nuage_gateway_vlans'
 
+# Number of VLANs created at the same time by vlan create --range
+VLAN_CREATE_WORKERS = 8
+
 
 _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              ('usermnemonic', 'User mnemonic', column_util.LIST_BOTH),
@@ -46,6 +54,11 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
 
 
 def find_gw_port_id(client, gw_port_name_or_id, gw_name_or_id=None):
+    gw_port_id = topology_cache.TopologyCache(client).find_nested_id(
+        GW_PORT_RESOURCE, gw_port_name_or_id,
+        GW_RESOURCE_NAME, gw_name_or_id)
+    if gw_port_id:
+        return gw_port_id
     return find_nested_resource(
         name_or_id=gw_port_name_or_id,
         parent_name_or_id=gw_name_or_id,
@@ -54,12 +67,19 @@ def find_gw_port_id(client, gw_port_name_or_id, gw_name_or_id=None):
             lambda **kwargs: client.list_nuage_gateway_ports(
                 **kwargs)[GW_PORT_RESOURCE_PLURAL]),
         parent_resource_finder=(
-            lambda x: client.find_resource(GW_RESOURCE_NAME, x)),
+            lambda x: client.find_resource(GW_RESOURCE_NAME, x,
+                                           fields=['id'])),
         resource_name='gateway-port',
         parent_resource_name='gateway')['id']
 
 
 def find_vlan_id(client, vlan_name_or_id, gw_port_id=None):
+    # VLAN numbers are only unique within a gateway port
+    if gw_port_id:
+        vlan_id = topology_cache.TopologyCache(client).find_id(
+            RESOURCE_NAME, vlan_name_or_id, gw_port_id)
+        if vlan_id:
+            return vlan_id
     return find_nested_resource(
         name_or_id=vlan_name_or_id,
         parent_name_or_id=gw_port_id,
@@ -72,7 +92,29 @@ def find_vlan_id(client, vlan_name_or_id, gw_port_id=None):
         parent_resource_name='gatewayport')['id']
 
 
-class ListNuageGatewayPortVLAN(command.Lister):
+def parse_vlan_range(vlan_range):
+    """Parse a VLAN range expression like '100-199,300,400-4094'
+
+    :returns: sorted list of the unique VLAN values in the expression
+    """
+    vlans = set()
+    try:
+        for part in vlan_range.split(','):
+            start, _sep, end = part.strip().partition('-')
+            start = int(start)
+            end = int(end) if end else start
+            if not 0 <= start <= end <= vlan_map.MAX_VLAN:
+                raise ValueError()
+            vlans.update(range(start, end + 1))
+    except ValueError:
+        message = (_("Invalid VLAN range '{}', expected a comma separated "
+                     "list of VLANs or VLAN ranges in 0-4094 range")
+                   .format(vlan_range))
+        raise exceptions.CommandError(message=message)
+    return sorted(vlans)
+
+
+class ListNuageGatewayPortVLAN(NuageCommand, command.Lister):
     """List Nuage Gateway Port VLAN"""
 
     def get_parser(self, prog_name):
@@ -98,10 +140,9 @@ class ListNuageGatewayPortVLAN(command.Lister):
             gatewayport=find_gw_port_id(
                 client, parsed_args.nuage_gatewayport, parsed_args.gateway)
         )
-        items = client.list_nuage_gateway_vlans(
-            **params)[RESOURCE_NAME_PLURAL]
-        for item in items:
-            del item['tenant_id']
+        items = client.iter_nuage_gateway_vlans(
+            fields=get_fields(_attr_map, parsed_args, long_listing=False),
+            **params)
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
@@ -109,6 +150,68 @@ class ListNuageGatewayPortVLAN(command.Lister):
                           for obj in items))
 
 
+class ListNuageGatewayPortVLANMap(NuageCommand, command.Lister):
+    """List the VLAN allocation of the ports of a Nuage Gateway"""
+
+    def get_parser(self, prog_name):
+        parser = super(ListNuageGatewayPortVLANMap, self).get_parser(
+            prog_name)
+        parser.add_argument(
+            'nuage_gateway', metavar='<nuage-gateway>',
+            help=_('Nuage gateway for which to map the port VLANs '
+                   '(name or ID)'))
+        parser.add_argument(
+            '--gatewayport', metavar='<nuage-gateway-port>',
+            help=_('Only map the VLANs of this gateway port (name or ID)'))
+        parser.add_argument(
+            '--next-free', metavar='<count>', type=int, default=1,
+            help=_('Number of free VLANs to show per gateway port '
+                   '(default: 1)'))
+        parser.add_argument(
+            '--start', metavar='<vlan>', type=int, default=0,
+            help=_('Lowest VLAN to consider as next free VLAN (default: 0)'))
+        return parser
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.nuageclient
+        if parsed_args.next_free < 0:
+            raise exceptions.CommandError(
+                message=_('--next-free should not be negative'))
+        if not 0 <= parsed_args.start <= vlan_map.MAX_VLAN:
+            raise exceptions.CommandError(
+                message=_('--start should be in 0-{} range').format(
+                    vlan_map.MAX_VLAN))
+
+        if parsed_args.gatewayport:
+            gw_port_id = find_gw_port_id(client, parsed_args.gatewayport,
+                                         parsed_args.nuage_gateway)
+            gw_ports = [client.show_nuage_gateway_port(
+                gw_port_id, fields=['id', 'name'])[GW_PORT_RESOURCE]]
+        else:
+            gw_id = topology_cache.TopologyCache(client).find_id(
+                GW_RESOURCE_NAME, parsed_args.nuage_gateway)
+            if not gw_id:
+                gw_id = client.find_resource(
+                    GW_RESOURCE_NAME, parsed_args.nuage_gateway,
+                    fields=['id'])['id']
+            gw_ports = list(client.iter_nuage_gateway_ports(
+                gateway=gw_id, fields=['id', 'name']))
+
+        headers = ('ID', 'Name', 'Used', 'Free', 'Utilization (%)',
+                   'Free ranges', 'Next free')
+        data = []
+        for gw_port, port_map in vlan_map.build_vlan_maps(client, gw_ports):
+            next_free = port_map.next_free(parsed_args.next_free,
+                                           parsed_args.start)
+            data.append((
+                gw_port['id'], gw_port.get('name'),
+                port_map.used_count, port_map.free_count,
+                '{:.1f}'.format(port_map.utilization),
+                vlan_map.format_ranges(port_map.free_ranges()),
+                ','.join(str(vlan) for vlan in next_free)))
+        return headers, data
+
+
 def add_vlan_arguments(parser):
     parser.add_argument(
         'nuage_gateway_port_vlan',
@@ -128,7 +231,7 @@ def add_vlan_arguments(parser):
     )
 
 
-class ShowNuageGatewayPortVLAN(command.ShowOne):
+class ShowNuageGatewayPortVLAN(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Gateway Port VLAN"""
 
     def get_parser(self, prog_name):
@@ -150,24 +253,35 @@ class ShowNuageGatewayPortVLAN(command.ShowOne):
 
         vlan_id = find_vlan_id(client, parsed_args.nuage_gateway_port_vlan,
                                parsed_args.gatewayport)
-        obj = client.show_nuage_gateway_vlan(vlan_id)[RESOURCE_NAME]
-        del obj['tenant_id']
+        obj = client.show_nuage_gateway_vlan(
+            vlan_id, fields=get_fields(_attr_map, parsed_args))[RESOURCE_NAME]
+        obj.pop('tenant_id', None)
 
         columns, display_columns = column_util.get_columns(obj, _attr_map)
         data = utils.get_dict_properties(obj, columns)
         return display_columns, data
 
 
-class CreateNuageGatewayPortVLAN(command.ShowOne):
+class CreateNuageGatewayPortVLAN(NuageCommand, command.ShowOne):
     """Create Nuage Gateway Port VLAN"""
 
     def get_parser(self, prog_name):
         parser = super(CreateNuageGatewayPortVLAN, self).get_parser(prog_name)
-        parser.add_argument(
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument(
             'nuage_gateway_port_vlan',
             metavar='<nuage-gateway-port-vlan>',
+            nargs='?',
             help=_("VLAN ID or VLAN number if --gatewayport is provided.")
         )
+        group.add_argument(
+            '--range',
+            metavar='<vlan-range>',
+            dest='vlan_range',
+            help=_("Create all VLANs of a range expression, e.g. "
+                   "'100-199,300,400-4094'. The result of each VLAN is "
+                   "reported as a row of a list.")
+        )
         parser.add_argument(
             '--gatewayport', metavar='<nuage-gateway-port>',
             help=_("Nuage gateway port the VLAN belongs to. "
@@ -180,17 +294,74 @@ class CreateNuageGatewayPortVLAN(command.ShowOne):
         )
         return parser
 
+    def run(self, parsed_args):
+        self.failed = self.total = 0
+        result = super(CreateNuageGatewayPortVLAN, self).run(parsed_args)
+        if self.failed:
+            msg = (_("{failed} of {total} nuage gateway port VLAN(s) failed "
+                     "to create.").format(failed=self.failed,
+                                          total=self.total))
+            raise exceptions.CommandError(message=msg)
+        return result
+
+    def produce_output(self, parsed_args, column_names, data):
+        if not parsed_args.vlan_range:
+            return super(CreateNuageGatewayPortVLAN, self).produce_output(
+                parsed_args, column_names, data)
+        # The VLANs of a range are reported as the rows of a list
+        if not hasattr(self.formatter, 'emit_list'):
+            raise exceptions.CommandError(
+                message=_('--range can not be shown as {}').format(
+                    parsed_args.formatter))
+        columns, selector = self._generate_columns_and_selector(
+            parsed_args, column_names)
+        if selector:
+            data = [list(self._compress_iterable(row, selector))
+                    for row in data]
+        self.formatter.emit_list(columns, data, self.app.stdout, parsed_args)
+        return 0
+
+    def _create_vlan_range(self, client, gw_port_id, vlan_range):
+        vlans = parse_vlan_range(vlan_range)
+        self.total = len(vlans)
+        results = run_concurrently(
+            lambda vlan: client.create_nuage_gateway_vlan(
+                {RESOURCE_NAME: {'value': vlan,
+                                 'gatewayport': gw_port_id}})[RESOURCE_NAME],
+            vlans, max_workers=VLAN_CREATE_WORKERS)
+
+        data = []
+        created = []
+        for vlan, item, error in results:
+            if error:
+                self.failed += 1
+                LOG.error(_("Failed to create nuage gateway port VLAN "
+                            "'{}': {}").format(vlan, error))
+                data.append((vlan, None, _('Error: {}').format(error)))
+            else:
+                created.append(item)
+                data.append((vlan, item['id'], item.get('status')))
+        topology_cache.TopologyCache(client).record(RESOURCE_NAME, created,
+                                                    gw_port_id)
+        return ('VLAN', 'ID', 'Status'), data
+
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
+        gw_port_id = find_gw_port_id(client, parsed_args.gatewayport,
+                                     parsed_args.gateway)
+
+        if parsed_args.vlan_range:
+            return self._create_vlan_range(client, gw_port_id,
+                                           parsed_args.vlan_range)
 
         body = {RESOURCE_NAME: {
             'value': parsed_args.nuage_gateway_port_vlan,
-            'gatewayport': find_gw_port_id(client,
-                                           parsed_args.gatewayport,
-                                           parsed_args.gateway)
+            'gatewayport': gw_port_id
         }}
 
         item = client.create_nuage_gateway_vlan(body)[RESOURCE_NAME]
+        topology_cache.TopologyCache(client).record(RESOURCE_NAME, [item],
+                                                    gw_port_id)
         del item['tenant_id']
 
         columns, display_columns = column_util.get_columns(
@@ -200,7 +371,7 @@ class CreateNuageGatewayPortVLAN(command.ShowOne):
         return display_columns, data
 
 
-class DeleteNuageGatewayPortVLAN(command.Command):
+class DeleteNuageGatewayPortVLAN(NuageCommand, command.Command):
     """Delete Nuage Gateway Port VLAN"""
 
     def get_parser(self, prog_name):
@@ -218,9 +389,11 @@ class DeleteNuageGatewayPortVLAN(command.Command):
                 client, parsed_args.nuage_gateway_port_vlan,
                 parsed_args.gatewayport)
         client.delete_nuage_gateway_vlan(parsed_args.nuage_gateway_port_vlan)
+        topology_cache.TopologyCache(client).forget(
+            RESOURCE_NAME, parsed_args.nuage_gateway_port_vlan)
 
 
-class NuageGatewayPortVLANProjectCommand(command.Command):
+class NuageGatewayPortVLANProjectCommand(NuageCommand, command.Command):
 
     action = None
 
@@ -19,6 +19,8 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 
 LOG = logging.getLogger(__name__)
@@ -40,7 +42,7 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class CreateNuageGatewayVPort(command.ShowOne):
+class CreateNuageGatewayVPort(NuageCommand, command.ShowOne):
     """Create Nuage Gateway vPort"""
 
     def get_parser(self, prog_name):
@@ -98,7 +100,7 @@ class CreateNuageGatewayVPort(command.ShowOne):
         return display_columns, data
 
 
-class DeleteNuageGatewayVPort(command.Command):
+class DeleteNuageGatewayVPort(NuageCommand, command.Command):
     """Delete Nuage Gateway vPort"""
 
     def get_parser(self, prog_name):
@@ -114,7 +116,7 @@ class DeleteNuageGatewayVPort(command.Command):
         client.delete_nuage_gateway_vport(parsed_args.nuage_gateway_vport_id)
 
 
-class ShowNuageGatewayVPort(command.ShowOne):
+class ShowNuageGatewayVPort(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Gateway vPort"""
 
     def get_parser(self, prog_name):
@@ -128,14 +130,15 @@ class ShowNuageGatewayVPort(command.ShowOne):
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
         obj = client.show_nuage_gateway_vport(
-            parsed_args.nuage_gateway_vport_id)[RESOURCE_NAME]
+            parsed_args.nuage_gateway_vport_id,
+            fields=get_fields(_attr_map, parsed_args))[RESOURCE_NAME]
 
         columns, display_columns = column_util.get_columns(obj, _attr_map)
         data = utils.get_dict_properties(obj, columns)
         return display_columns, data
 
 
-class ListNuageGatewayVPort(command.Lister):
+class ListNuageGatewayVPort(NuageCommand, command.Lister):
     """List Nuage Gateway vPort"""
 
     def get_parser(self, prog_name):
@@ -162,8 +165,9 @@ class ListNuageGatewayVPort(command.Lister):
 
         client = self.app.client_manager.nuageclient
 
-        items = client.list_nuage_gateway_vports(
-            **params)[RESOURCE_NAME_PLURAL]
+        items = client.iter_nuage_gateway_vports(
+            fields=get_fields(_attr_map, parsed_args, long_listing=False),
+            **params)
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
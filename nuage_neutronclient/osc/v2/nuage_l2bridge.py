@@ -14,7 +14,11 @@
 import logging
 
 from neutronclient.common import utils as neutron_utils
+from nuage_neutronclient.osc.v2.utils import add_parallel_argument
+from nuage_neutronclient.osc.v2.utils import delete_concurrently
 from nuage_neutronclient.osc.v2.utils import format_list_of_dicts
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 from openstackclient.network import sdk_utils
 from osc_lib.command import command
@@ -37,6 +41,8 @@ _formatters = {
 _column_map = [('ID', 'id'), ('Name', 'name'),
                ('Nuage_subnet_id', 'nuage_subnet_id'),
                ('Physnets', 'physnets')]
+_attr_map = [(attr, header, column_util.LIST_BOTH)
+             for header, attr in _column_map]
 
 
 def _get_columns(item):
@@ -75,7 +81,7 @@ def add_physnet_argument(parser):
                'You can repeat this option.'))
 
 
-class CreateNuageL2Bridge(command.ShowOne):
+class CreateNuageL2Bridge(NuageCommand, command.ShowOne):
     """Create a new Nuage L2bridge"""
 
     def get_parser(self, prog_name):
@@ -95,7 +101,7 @@ class CreateNuageL2Bridge(command.ShowOne):
         return display_columns, data
 
 
-class DeleteNuageL2Bridge(command.Command):
+class DeleteNuageL2Bridge(NuageCommand, command.Command):
     """Delete a given Nuage L2bridge"""
 
     def get_parser(self, prog_name):
@@ -105,22 +111,25 @@ class DeleteNuageL2Bridge(command.Command):
             metavar='<nuage-l2bridge>',
             nargs='+',
             help=_('Nuage L2bridge to delete (name or ID)'))
+        add_parallel_argument(parser)
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
-        result = 0
-        for l2bridge in parsed_args.nuage_l2bridges:
-            try:
-                l2bridge_id = client.find_resource(
-                    L2BRIDGE_RESOURCE, l2bridge)['id']
-                client.delete_nuage_l2bridge(l2bridge_id)
-            except Exception as e:
-                result += 1
-                LOG.error(_("Failed to delete nuage l2bridge with "
-                            "name or ID '%(nuage_l2bridge)s': %(e)s"),
-                          {L2BRIDGE_RESOURCE: l2bridge, 'e': e})
 
+        def delete(l2bridge):
+            l2bridge_id = client.find_resource(
+                L2BRIDGE_RESOURCE, l2bridge)['id']
+            client.delete_nuage_l2bridge(l2bridge_id)
+
+        failures = delete_concurrently(delete, parsed_args.nuage_l2bridges,
+                                       parsed_args.parallel)
+        for l2bridge, e in failures:
+            LOG.error(_("Failed to delete nuage l2bridge with "
+                        "name or ID '%(nuage_l2bridge)s': %(e)s"),
+                      {L2BRIDGE_RESOURCE: l2bridge, 'e': e})
+
+        result = len(failures)
         if result > 0:
             total = len(parsed_args.nuage_l2bridges)
             msg = (_("%(result)s of %(total)s nuage l2bridge(s) "
@@ -128,7 +137,7 @@ class DeleteNuageL2Bridge(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class SetNuageL2Bridge(command.Command):
+class SetNuageL2Bridge(NuageCommand, command.Command):
     """Set Nuage L2bridge properties"""
 
     def get_parser(self, prog_name):
@@ -172,7 +181,7 @@ class SetNuageL2Bridge(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListNuageL2Bridge(command.Lister):
+class ListNuageL2Bridge(NuageCommand, command.Lister):
     """List Nuage L2bridges"""
 
     def take_action(self, parsed_args):
@@ -183,12 +192,12 @@ class ListNuageL2Bridge(command.Lister):
             attrs=[x[1] for x in _column_map],
             parsed_args=parsed_args)
 
-        obj = client.list_nuage_l2bridges()[L2BRIDGES_RESOURCE]
+        obj = client.iter_nuage_l2bridges(fields=attrs)
         return (headers, (utils.get_dict_properties(
             s, attrs, formatters=_formatters) for s in obj))
 
 
-class ShowNuageL2Bridge(command.ShowOne):
+class ShowNuageL2Bridge(NuageCommand, command.ShowOne):
     """Show information of a given Nuage l2bridge"""
 
     def get_parser(self, prog_name):
@@ -209,7 +218,9 @@ class ShowNuageL2Bridge(command.ShowOne):
         # upstream we can reduce the number of calls
         l2bridge_id = client.find_resource(L2BRIDGE_RESOURCE,
                                            parsed_args.nuage_l2bridge)['id']
-        obj = client.show_nuage_l2bridge(l2bridge_id)[L2BRIDGE_RESOURCE]
+        obj = client.show_nuage_l2bridge(
+            l2bridge_id,
+            fields=get_fields(_attr_map, parsed_args))[L2BRIDGE_RESOURCE]
         display_columns, columns = _get_columns(obj)
         data = utils.get_dict_properties(obj, columns, formatters=_formatters)
         return display_columns, data
@@ -20,6 +20,10 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import add_parallel_argument
+from nuage_neutronclient.osc.v2.utils import delete_concurrently
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -28,7 +32,7 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class CreateNuageNetpartition(command.ShowOne):
+class CreateNuageNetpartition(NuageCommand, command.ShowOne):
     """Create a new Nuage netpartition"""
 
     def get_parser(self, prog_name):
@@ -55,7 +59,7 @@ class CreateNuageNetpartition(command.ShowOne):
         return display_columns, utils.get_dict_properties(item, columns)
 
 
-class DeleteNuageNetpartition(command.Command):
+class DeleteNuageNetpartition(NuageCommand, command.Command):
     """Delete a given Nuage Netpartition"""
 
     def get_parser(self, prog_name):
@@ -65,24 +69,24 @@ class DeleteNuageNetpartition(command.Command):
             metavar='<nuage-netpartition>',
             nargs='+',
             help=_('Nuage Netpartitions to delete (name or ID)'))
+        add_parallel_argument(parser)
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
-        result = 0
-
-        # TODO() Upstream contribution idea: below code is standard for delete
-        # ..and copied throughout all resources upstream and downstream
-        for netpartition in parsed_args.nuage_netpartition:
-            try:
-                netpartition_id = client.find_net_partition(
-                    name_or_id=netpartition)['id']
-                client.delete_net_partition(netpartition_id)
-            except Exception as e:
-                result += 1
-                LOG.error(_("Failed to delete nuage netpartition with "
-                            "name or ID '{}': {}").format(netpartition, e))
 
+        def delete(netpartition):
+            netpartition_id = client.find_net_partition(
+                name_or_id=netpartition, fields=['id'])['id']
+            client.delete_net_partition(netpartition_id)
+
+        failures = delete_concurrently(delete, parsed_args.nuage_netpartition,
+                                       parsed_args.parallel)
+        for netpartition, e in failures:
+            LOG.error(_("Failed to delete nuage netpartition with "
+                        "name or ID '{}': {}").format(netpartition, e))
+
+        result = len(failures)
         if result > 0:
             total = len(parsed_args.nuage_netpartition)
             msg = (_("{result} of {total} nuage netpartition(s) failed "
@@ -90,13 +94,14 @@ class DeleteNuageNetpartition(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListNuageNetpartition(command.Lister):
+class ListNuageNetpartition(NuageCommand, command.Lister):
     """List Nuage Netpartitions"""
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
 
-        net_partitions = client.list_net_partitions()['net_partitions']
+        net_partitions = client.iter_net_partitions(
+            fields=get_fields(_attr_map, parsed_args))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=True)
@@ -104,7 +109,7 @@ class ListNuageNetpartition(command.Lister):
                           for obj in net_partitions))
 
 
-class ShowNuageNetPartition(command.ShowOne):
+class ShowNuageNetPartition(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Netpartition"""
 
     def get_parser(self, prog_name):
@@ -128,8 +133,10 @@ class ShowNuageNetPartition(command.ShowOne):
         # of show, that's why we have to do two calls. Once this is fixed
         # upstream we can reduce the number of calls
         netpartition_id = client.find_net_partition(
-            name_or_id=parsed_args.nuage_netpartition)['id']
-        item = client.show_net_partition(netpartition_id)['net_partition']
+            name_or_id=parsed_args.nuage_netpartition, fields=['id'])['id']
+        item = client.show_net_partition(
+            netpartition_id,
+            fields=get_fields(_attr_map, parsed_args))['net_partition']
 
         column_getter = sdk_utils.get_osc_show_columns_for_sdk_resource
         osc_column_map = {k: v for v, k, _ in _attr_map}
@@ -19,6 +19,8 @@ from osc_lib.utils import columns as column_util
 from osc_lib.utils import format_list
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -37,7 +39,7 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class ListNuagePolicyGroup(command.Lister):
+class ListNuagePolicyGroup(NuageCommand, command.Lister):
     """List Nuage Policy groups"""
 
     def get_parser(self, prog_name):
@@ -74,8 +76,9 @@ class ListNuagePolicyGroup(command.Lister):
         elif parsed_args.ports:
             attrs['ports'] = parsed_args.ports
 
-        nuage_policy_groups = (
-            client.list_nuage_policy_groups(**attrs)['nuage_policy_groups'])
+        nuage_policy_groups = client.iter_nuage_policy_groups(
+            fields=get_fields(_attr_map, parsed_args, long_listing=False),
+            **attrs)
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
@@ -84,7 +87,7 @@ class ListNuagePolicyGroup(command.Lister):
                           for obj in nuage_policy_groups))
 
 
-class ShowNuagePolicyGroup(command.ShowOne):
+class ShowNuagePolicyGroup(NuageCommand, command.ShowOne):
     """Show information of a given Nuage policy group"""
 
     def get_parser(self, prog_name):
@@ -104,8 +107,10 @@ class ShowNuagePolicyGroup(command.ShowOne):
         # of show, that's why we have to do two calls. Once this is fixed
         # upstream we can reduce the number of calls
         policy_group_id = client.find_resource(
-            'nuage_policy_group', parsed_args.nuage_policy_group)['id']
-        obj = client.show_nuage_policy_group(policy_group_id)
+            'nuage_policy_group', parsed_args.nuage_policy_group,
+            fields=['id'])['id']
+        obj = client.show_nuage_policy_group(
+            policy_group_id, fields=get_fields(_attr_map, parsed_args))
         columns, display_columns = column_util.get_columns(
             obj['nuage_policy_group'], _attr_map)
         data = utils.get_dict_properties(
@@ -21,6 +21,12 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.netpartition_index import NETPARTITION_FIELDS
+from nuage_neutronclient.netpartition_index import NetpartitionIndex
+from nuage_neutronclient.osc.v2.utils import add_parallel_argument
+from nuage_neutronclient.osc.v2.utils import delete_concurrently
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -34,7 +40,14 @@ RESOURCE_NAME = 'project_net_partition_mapping'
 RESOURCE_PLURAL_NAME = 'project_net_partition_mappings'
 
 
-class NuageProjectNetpartitionMapping(object):
+def _get_server_fields(parsed_args):
+    # The netpartition name is not an attribute of the mapping, it is
+    # looked up using the netpartition id
+    fields = get_fields(_attr_map, parsed_args, required=['net_partition_id'])
+    return [field for field in fields if field != 'net_partition_name']
+
+
+class NuageProjectNetpartitionMapping(NuageCommand):
 
     def _find_project_id(self, name_or_id):
         manager = self.app.client_manager.identity.projects
@@ -62,7 +75,8 @@ class CreateNuageProjectNetpartitionMapping(NuageProjectNetpartitionMapping,
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
         np = client.find_resource('net_partition',
-                                  parsed_args.net_partition)
+                                  parsed_args.net_partition,
+                                  fields=['id', 'name'])
         project_id = self._find_project_id(parsed_args.project)
         body = {RESOURCE_NAME: {
             'project': project_id,
@@ -91,23 +105,25 @@ class DeleteNuageProjectNetpartitionMapping(NuageProjectNetpartitionMapping,
             metavar='<project>',
             nargs='+',
             help=_('Project to delete mapping for (name or ID)'))
+        add_parallel_argument(parser)
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
-        result = 0
 
-        for project in parsed_args.project:
-            try:
-                project_id = self._find_project_id(project)
-                client.delete_project_netpartition_mapping(project_id)
-            except Exception as e:
-                result += 1
-                LOG.error(_("Failed netpartition remove project with "
-                            "name or ID '{}': {}").format(project, e))
+        def delete(project):
+            project_id = self._find_project_id(project)
+            client.delete_project_netpartition_mapping(project_id)
 
+        failures = delete_concurrently(delete, parsed_args.project,
+                                       parsed_args.parallel)
+        for project, e in failures:
+            LOG.error(_("Failed netpartition remove project with "
+                        "name or ID '{}': {}").format(project, e))
+
+        result = len(failures)
         if result > 0:
-            total = len(parsed_args.nuage_netpartition)
+            total = len(parsed_args.project)
             msg = (_("{result} of {total} nuage project to netpartition "
                      "mapping(s) failed to delete.").format(result=result,
                                                             total=total))
@@ -121,14 +137,14 @@ class ListNuageProjectNetpartitionMapping(NuageProjectNetpartitionMapping,
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
 
-        mappings = client.list_project_netpartition_mappings()[
-            RESOURCE_PLURAL_NAME]
-        netpartitions = client.list_net_partitions()['net_partitions']
-        netpartitions = {netpart['id']: netpart for netpart in netpartitions}
-        for map in mappings:
-            np = netpartitions[map['net_partition_id']]
-            if np:
-                map['net_partition_name'] = np['name']
+        mappings = client.iter_project_netpartition_mappings(
+            fields=_get_server_fields(parsed_args))
+        fields = get_fields(_attr_map, parsed_args)
+        if not fields or 'net_partition_name' in fields:
+            index = NetpartitionIndex(client.iter_net_partitions(
+                fields=NETPARTITION_FIELDS))
+            mappings = index.join(mappings)
+
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=True)
         return (headers, (utils.get_dict_properties(obj, columns)
@@ -156,14 +172,16 @@ class ShowNuageProjectNetpartitionMapping(NuageProjectNetpartitionMapping,
         project_id = self._find_project_id(parsed_args.project)
         try:
             obj = client.show_project_netpartition_mapping(
-                project_id)[RESOURCE_NAME]
+                project_id,
+                fields=_get_server_fields(parsed_args))[RESOURCE_NAME]
         except neutron_exc.NotFound:
             raise neutron_exc.NotFound('No Project netpartition '
                                        'mapping was found for Project '
                                        '{}.'.format(parsed_args.project))
         try:
             obj['net_partition_name'] = client.show_net_partition(
-                obj['net_partition_id'])['net_partition']['name']
+                obj['net_partition_id'],
+                fields=['name'])['net_partition']['name']
         except neutron_exc.NotFound:
             pass
 
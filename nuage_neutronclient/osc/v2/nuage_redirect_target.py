@@ -20,6 +20,8 @@ from osc_lib.utils import format_list
 
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -38,7 +40,7 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class ListNuageRedirectTarget(command.Lister):
+class ListNuageRedirectTarget(NuageCommand, command.Lister):
     """List Nuage Redirect Target"""
 
     def get_parser(self, prog_name):
@@ -54,8 +56,9 @@ class ListNuageRedirectTarget(command.Lister):
 
         subnet_id = neutronclient.find_resource('subnet',
                                                 parsed_args.subnet)['id']
-        nuage_redirect_targets = nuageclient.list_nuage_redirect_targets(
-            subnet=subnet_id)['nuage_redirect_targets']
+        nuage_redirect_targets = nuageclient.iter_nuage_redirect_targets(
+            subnet=subnet_id,
+            fields=get_fields(_attr_map, parsed_args, long_listing=False))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=False)
@@ -64,7 +67,7 @@ class ListNuageRedirectTarget(command.Lister):
                           for obj in nuage_redirect_targets))
 
 
-class ShowNuageRedirectTarget(command.ShowOne):
+class ShowNuageRedirectTarget(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Redirect Target"""
 
     def get_parser(self, prog_name):
@@ -84,9 +87,11 @@ class ShowNuageRedirectTarget(command.ShowOne):
         # of show, that's why we have to do two calls. Once this is fixed
         # upstream we can reduce the number of calls
         redirect_target_id = client.find_resource(
-            'nuage_redirect_target', parsed_args.nuage_redirect_target)['id']
+            'nuage_redirect_target', parsed_args.nuage_redirect_target,
+            fields=['id'])['id']
 
-        obj = client.show_nuage_redirect_target(redirect_target_id)
+        obj = client.show_nuage_redirect_target(
+            redirect_target_id, fields=get_fields(_attr_map, parsed_args))
         columns, display_columns = column_util.get_columns(
             obj['nuage_redirect_target'], _attr_map)
         data = utils.get_dict_properties(
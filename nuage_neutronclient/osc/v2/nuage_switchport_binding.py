@@ -19,6 +19,8 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 
 LOG = logging.getLogger(__name__)
 
@@ -34,13 +36,14 @@ _attr_map = (('id', 'ID', column_util.LIST_BOTH),
              )
 
 
-class ListNuageSwitchportBinding(command.Lister):
+class ListNuageSwitchportBinding(NuageCommand, command.Lister):
     """List Nuage Switchport Bindings"""
 
-    def take_action(self, _):
+    def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
 
-        items = client.list_switchport_bindings()[RESOURCE_NAME_PLURAL]
+        items = client.iter_switchport_bindings(
+            fields=get_fields(_attr_map, parsed_args))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=True)
@@ -48,7 +51,7 @@ class ListNuageSwitchportBinding(command.Lister):
                           for obj in items))
 
 
-class ShowNuageSwitchportBinding(command.ShowOne):
+class ShowNuageSwitchportBinding(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Switchport Binding"""
 
     def get_parser(self, prog_name):
@@ -67,7 +70,8 @@ class ShowNuageSwitchportBinding(command.ShowOne):
 
         client = self.app.client_manager.nuageclient
         item = client.show_switchport_binding(
-            parsed_args.nuage_switchport_binding)[RESOURCE_NAME]
+            parsed_args.nuage_switchport_binding,
+            fields=get_fields(_attr_map, parsed_args))[RESOURCE_NAME]
 
         column_getter = sdk_utils.get_osc_show_columns_for_sdk_resource
         osc_column_map = {k: v for v, k, _ in _attr_map}
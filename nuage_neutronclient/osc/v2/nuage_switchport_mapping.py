@@ -20,6 +20,10 @@ from osc_lib import utils
 from osc_lib.utils import columns as column_util
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import add_parallel_argument
+from nuage_neutronclient.osc.v2.utils import delete_concurrently
+from nuage_neutronclient.osc.v2.utils import get_fields
+from nuage_neutronclient.osc.v2.utils import NuageCommand
 from nuage_neutronclient.osc.v2.utils import update_dict
 
 LOG = logging.getLogger(__name__)
@@ -81,7 +85,7 @@ def get_body_update_create(parsed_args):
     return body
 
 
-class CreateNuageSwitchportMapping(command.ShowOne):
+class CreateNuageSwitchportMapping(NuageCommand, command.ShowOne):
     """Create a new Nuage Switchport Mapping"""
 
     def get_parser(self, prog_name):
@@ -104,7 +108,7 @@ class CreateNuageSwitchportMapping(command.ShowOne):
         return display_columns, utils.get_dict_properties(item, columns)
 
 
-class DeleteNuageSwitchportMapping(command.Command):
+class DeleteNuageSwitchportMapping(NuageCommand, command.Command):
     """Delete a given Nuage Switchport Mapping"""
 
     def get_parser(self, prog_name):
@@ -115,20 +119,20 @@ class DeleteNuageSwitchportMapping(command.Command):
             metavar='<nuage-switchport-mapping>',
             nargs='+',
             help=_('Nuage switchport mappings to delete (ID)'))
+        add_parallel_argument(parser)
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
-        result = 0
 
-        for mapping_id in parsed_args.nuage_switchport_mapping:
-            try:
-                client.delete_switchport_mapping(mapping_id)
-            except Exception as e:
-                result += 1
-                LOG.error(_("Failed to delete nuage switchport mapping with "
-                            "name or ID '{}': {}").format(mapping_id, e))
+        failures = delete_concurrently(client.delete_switchport_mapping,
+                                       parsed_args.nuage_switchport_mapping,
+                                       parsed_args.parallel)
+        for mapping_id, e in failures:
+            LOG.error(_("Failed to delete nuage switchport mapping with "
+                        "name or ID '{}': {}").format(mapping_id, e))
 
+        result = len(failures)
         if result > 0:
             total = len(parsed_args.nuage_switchport_mapping)
             msg = (_("{result} of {total} nuage switchport mapping(s) failed "
@@ -136,13 +140,14 @@ class DeleteNuageSwitchportMapping(command.Command):
             raise exceptions.CommandError(msg)
 
 
-class ListNuageSwitchportMapping(command.Lister):
+class ListNuageSwitchportMapping(NuageCommand, command.Lister):
     """List Nuage Switchport Mappings"""
 
-    def take_action(self, _):
+    def take_action(self, parsed_args):
         client = self.app.client_manager.nuageclient
 
-        items = client.list_switchport_mappings()[RESOURCE_NAME_PLURAL]
+        items = client.iter_switchport_mappings(
+            fields=get_fields(_attr_map, parsed_args))
 
         headers, columns = column_util.get_column_definitions(
             _attr_map, long_listing=True)
@@ -150,7 +155,7 @@ class ListNuageSwitchportMapping(command.Lister):
                           for obj in items))
 
 
-class ShowNuageSwitchportMapping(command.ShowOne):
+class ShowNuageSwitchportMapping(NuageCommand, command.ShowOne):
     """Show information of a given Nuage Switchport Mapping"""
 
     def get_parser(self, prog_name):
@@ -169,7 +174,8 @@ class ShowNuageSwitchportMapping(command.ShowOne):
 
         client = self.app.client_manager.nuageclient
         item = client.show_switchport_mapping(
-            parsed_args.nuage_switchport_mapping)[RESOURCE_NAME]
+            parsed_args.nuage_switchport_mapping,
+            fields=get_fields(_attr_map, parsed_args))[RESOURCE_NAME]
 
         column_getter = sdk_utils.get_osc_show_columns_for_sdk_resource
         osc_column_map = {k: v for v, k, _ in _attr_map}
@@ -179,7 +185,7 @@ class ShowNuageSwitchportMapping(command.ShowOne):
         return display_columns, utils.get_dict_properties(item, columns)
 
 
-class SetNuageSwitchportMapping(command.Command):
+class SetNuageSwitchportMapping(NuageCommand, command.Command):
     """Set Nuage L2bridge properties"""
 
     def get_parser(self, prog_name):
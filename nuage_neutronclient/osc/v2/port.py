@@ -12,7 +12,10 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import collections
+from concurrent import futures
 import copy
+import logging
 import re
 
 from neutronclient.common import exceptions as neutron_exceptions
@@ -27,21 +30,34 @@ from osc_lib.utils import tags as _tag
 from oslo_utils import netutils
 
 from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc.v2.utils import NuageCommand
+from nuage_neutronclient.osc.v2.utils import run_concurrently
+from nuage_neutronclient.osc.v2.utils import UpstreamPatch
 
+LOG = logging.getLogger(__name__)
 
-# Add Nuage specific attributes to Openstack port
-port_resource.nuage_floatingip = resource.Body('nuage_floatingip')
-port_resource.nuage_policy_groups = resource.Body('nuage_policy_groups',
-                                                  type=list)
-port_resource.nuage_redirect_targets = resource.Body('nuage_redirect_targets')
+super_get_attrs = port._get_attrs
 
-# Formatters for Nuage specific attributes
-port._formatters.update({'nuage_floatingip': osc_utils.format_dict,
-                         'nuage_policy_groups': osc_utils.format_list,
-                        # for historic reasons, rtarget is a list in plugin api
-                         'nuage_redirect_targets': osc_utils.format_list})
+# Upper bound on the number of concurrent requests issued for a single port:
+# find_port and the three Nuage lookups of ShowPort
+NUAGE_LOOKUP_WORKERS = 4
 
-super_get_attrs = port._get_attrs
+# Maximum number of port IDs or names passed as filter in a single list
+# request, which keeps the request URL well below the usual 8k limit of web
+# servers
+PORT_FILTER_CHUNK_SIZE = 100
+
+# Number of ports updated at the same time by port set --nuage-from-file
+NUAGE_UPDATE_WORKERS = 8
+
+# Attributes of a port in a --nuage-from-file manifest
+MANIFEST_ATTRIBUTES = ('nuage_policy_groups', 'nuage_redirect_target',
+                       'nuage_floatingip')
+
+# Nuage attributes of a port, in the order they are listed
+_nuage_attr_map = (('nuage_policy_groups', 'Nuage Policy Groups'),
+                   ('nuage_redirect_targets', 'Nuage Redirect Targets'),
+                   ('nuage_floatingip', 'Nuage Floating IP'))
 
 
 def add_arguments_for_set_create(parser):
@@ -63,16 +79,76 @@ def add_arguments_for_set_create(parser):
                'port.'))
 
 
+def _ids_by_name(list_resources, names):
+    """Look up the IDs of resources by name
+
+    :param list_resources: function returning the resources matching its name
+                           and fields filters
+    :returns: dict of name to the list of IDs of the resources with that name
+    """
+    names = sorted(names)
+    ids_by_name = collections.defaultdict(list)
+    for i in range(0, len(names), PORT_FILTER_CHUNK_SIZE):
+        for item in list_resources(name=names[i:i + PORT_FILTER_CHUNK_SIZE],
+                                   fields=['id', 'name']):
+            ids_by_name[item['name']].append(item['id'])
+    return ids_by_name
+
+
+def _convert_names_to_ids(list_resources, resource, names_or_ids):
+    """Convert resource names or ids to only ids
+
+    IDs are passed through untouched, the names are resolved with a list
+    request per PORT_FILTER_CHUNK_SIZE names.
+    """
+    names_or_ids = list(names_or_ids)
+    names = set(name_or_id for name_or_id in names_or_ids
+                if not re.match(UUID_PATTERN, name_or_id))
+    ids_by_name = _ids_by_name(list_resources, names) if names else {}
+
+    ids = []
+    for name_or_id in names_or_ids:
+        if name_or_id not in names:
+            ids.append(name_or_id)
+        elif len(ids_by_name[name_or_id]) == 1:
+            ids.append(ids_by_name[name_or_id][0])
+        elif ids_by_name[name_or_id]:
+            raise neutron_exceptions.NeutronClientNoUniqueMatch(
+                resource=resource, name=name_or_id)
+        else:
+            not_found_message = (
+                _("Unable to find {} with name or id "
+                  "'{}'").format(resource, name_or_id))
+            raise neutron_exceptions.NotFound(message=not_found_message)
+    return ids
+
+
 def convert_pg_names_to_ids(nuageclient, policy_group_name_or_ids):
-    """Convert nuage policygroup name or ids to only ids"""
-    return (nuageclient.find_resource('nuage_policy_group', name_or_id)['id']
-            for name_or_id in policy_group_name_or_ids)
+    """Convert nuage policygroup name or ids to only ids
+
+    IDs are passed through untouched, all names are resolved with a single
+    list request (per PORT_FILTER_CHUNK_SIZE names), or from the reference
+    store of the client.
+    """
+    store = getattr(nuageclient, 'reference_store', None)
+    if store is not None:
+        policy_group_name_or_ids = list(policy_group_name_or_ids)
+        found = store.find_all(nuageclient, 'nuage_policy_group',
+                               policy_group_name_or_ids)
+        policy_group_name_or_ids = [
+            found[name_or_id]['id'] if found[name_or_id] else name_or_id
+            for name_or_id in policy_group_name_or_ids]
+    return _convert_names_to_ids(
+        lambda **kwargs: nuageclient.list_nuage_policy_groups(
+            **kwargs)['nuage_policy_groups'],
+        'nuage_policy_group', policy_group_name_or_ids)
 
 
 def convert_rt_name_to_id(nuageclient, redirect_target_name_or_id):
     """Convert nuage redirect target name or ids to only ids"""
     return nuageclient.find_resource('nuage_redirect_target',
-                                     redirect_target_name_or_id)['id']
+                                     redirect_target_name_or_id,
+                                     fields=['id'])['id']
 
 
 def get_nuage_floating_ip(nuageclient, nuage_floating_ip_parsed_arg):
@@ -116,6 +192,312 @@ def get_nuage_redirect_target(nuageclient, port_id):
     return rt[0] if rt else None
 
 
+def get_nuage_floatingip(nuageclient, port_id):
+    """Get Nuage floating ip that is attached to a specific port"""
+    fips = nuageclient.list_nuage_floatingips(
+        ports=[port_id], fields=['id', 'floating_ip_address'])
+    return (fips['nuage_floatingips'][0]
+            if fips['nuage_floatingips'] else None)
+
+
+def submit_nuage_port_lookups(executor, nuageclient, port_id):
+    """Start the Nuage lookups of a specific port on the executor
+
+    :returns: futures for the policygroup ids, the redirect target and
+              the floating ip of the port
+    """
+    return (executor.submit(lambda: list(get_nuage_policygroups(nuageclient,
+                                                                port_id))),
+            executor.submit(get_nuage_redirect_target, nuageclient, port_id),
+            executor.submit(get_nuage_floatingip, nuageclient, port_id))
+
+
+def _get_nuage_floatingip_of_port(nuageclient, port_id):
+    """Get the Nuage floating ip of a port, None for a port without vport"""
+    try:
+        return get_nuage_floatingip(nuageclient, port_id)
+    except (neutron_exceptions.BadRequest, neutron_exceptions.NotFound):
+        return None
+
+
+def _get_nuage_attrs_for_port_chunk(nuageclient, port_ids):
+    """Get Nuage policygroups and redirect targets of a chunk of ports
+
+    Both are fetched with a bulk list request and joined by the ports they
+    list.
+    """
+    port_attrs = {port_id: {'nuage_policy_groups': [],
+                            'nuage_redirect_targets': []}
+                  for port_id in port_ids}
+
+    def attached_ports(item):
+        return (port_id for port_id in item.get('ports') or []
+                if port_id in port_attrs)
+
+    pgs = nuageclient.list_nuage_policy_groups(
+        ports=port_ids, fields=['id', 'ports'])['nuage_policy_groups']
+    for pg in pgs:
+        for port_id in attached_ports(pg):
+            port_attrs[port_id]['nuage_policy_groups'].append(pg['id'])
+
+    rts = nuageclient.list_nuage_redirect_targets(
+        ports=port_ids, fields=['id', 'ports'])['nuage_redirect_targets']
+    for rt in rts:
+        for port_id in attached_ports(rt):
+            port_attrs[port_id]['nuage_redirect_targets'].append(rt['id'])
+
+    for attrs in port_attrs.values():
+        attrs['nuage_policy_groups'] = attrs['nuage_policy_groups'] or None
+        attrs['nuage_redirect_targets'] = (attrs['nuage_redirect_targets'] or
+                                           None)
+    return port_attrs
+
+
+def _get_nuage_attrs_per_port(nuageclient, port_ids, executor):
+    """Get Nuage policygroups and redirect targets of single ports"""
+    lookups = {port_id: (
+        executor.submit(lambda port_id: list(get_nuage_policygroups(
+            nuageclient, port_id)), port_id),
+        executor.submit(get_nuage_redirect_target, nuageclient, port_id))
+        for port_id in port_ids}
+    port_attrs = {}
+    for port_id, (pgs, rt) in lookups.items():
+        attrs = port_attrs[port_id] = {'nuage_policy_groups': None,
+                                       'nuage_redirect_targets': None}
+        try:
+            attrs['nuage_policy_groups'] = pgs.result() or None
+            rt = rt.result()
+            attrs['nuage_redirect_targets'] = [rt['id']] if rt else None
+        except (neutron_exceptions.BadRequest, neutron_exceptions.NotFound):
+            # Same as ShowPort: port without vport
+            pass
+    return port_attrs
+
+
+def get_nuage_attrs_for_ports(nuageclient, port_ids):
+    """Get the Nuage attributes of many ports at once
+
+    The ports are queried in chunks of PORT_FILTER_CHUNK_SIZE, with one list
+    request per Nuage resource and chunk, and joined client-side by port ID.
+    A chunk the plugin refuses to handle in bulk, e.g. because it holds a
+    port without vport, falls back to the single port lookups of ShowPort.
+    Nuage floating IPs don't list the ports they are attached to, so they
+    are always looked up port by port.
+
+    :returns: dict of port ID to a dict with the nuage_policy_groups,
+              nuage_redirect_targets and nuage_floatingip of the port
+    """
+    port_ids = list(port_ids)
+    chunks = [port_ids[i:i + PORT_FILTER_CHUNK_SIZE]
+              for i in range(0, len(port_ids), PORT_FILTER_CHUNK_SIZE)]
+    port_attrs = {}
+    with futures.ThreadPoolExecutor(
+            max_workers=NUAGE_LOOKUP_WORKERS) as executor:
+        bulk_lookups = [(chunk, executor.submit(
+            _get_nuage_attrs_for_port_chunk, nuageclient, chunk))
+            for chunk in chunks]
+        fip_lookups = [(port_id, executor.submit(
+            _get_nuage_floatingip_of_port, nuageclient, port_id))
+            for port_id in port_ids]
+        for chunk, bulk_lookup in bulk_lookups:
+            try:
+                port_attrs.update(bulk_lookup.result())
+            except (neutron_exceptions.BadRequest,
+                    neutron_exceptions.NotFound):
+                port_attrs.update(_get_nuage_attrs_per_port(
+                    nuageclient, chunk, executor))
+        for port_id, fip_lookup in fip_lookups:
+            port_attrs[port_id]['nuage_floatingip'] = fip_lookup.result()
+    return port_attrs
+
+
+def diff_nuage_attrs(current, desired):
+    """Return the Nuage attributes to update to get a port in desired state
+
+    :param current: Nuage attributes of the port, as returned by
+                    get_nuage_attrs_for_ports
+    :param desired: Nuage attributes in the format of update_port, only the
+                    attributes which are present are compared
+    :returns: the attributes of desired which differ from current
+    """
+    attrs = {}
+    for attr in ('nuage_policy_groups', 'nuage_redirect_targets'):
+        if (attr in desired and
+                set(desired[attr] or ()) != set(current.get(attr) or ())):
+            attrs[attr] = desired[attr]
+    if 'nuage_floatingip' in desired:
+        current_fip = current.get('nuage_floatingip') or {}
+        desired_fip = desired['nuage_floatingip'] or {}
+        if current_fip.get('id') != desired_fip.get('id'):
+            attrs['nuage_floatingip'] = desired['nuage_floatingip']
+    return attrs
+
+
+def load_nuage_manifest(path):
+    """Load a manifest of the Nuage attributes of ports
+
+    The manifest is a YAML (or JSON) mapping of port name or ID to the
+    nuage_policy_groups, nuage_redirect_target and nuage_floatingip of the
+    port, by name, IP or ID. Attributes which are left out are not changed,
+    null (or an empty list) removes them from the port.
+    """
+    import yaml
+
+    try:
+        with open(path) as manifest_file:
+            manifest = yaml.safe_load(manifest_file)
+    except (IOError, yaml.YAMLError) as e:
+        raise exceptions.CommandError(
+            _("Unable to load manifest {}: {}").format(path, e))
+
+    if not isinstance(manifest, dict):
+        raise exceptions.CommandError(
+            _("Manifest {} should map ports to their Nuage "
+              "attributes").format(path))
+    for port_name_or_id, attrs in manifest.items():
+        if (not isinstance(attrs, dict) or
+                set(attrs) - set(MANIFEST_ATTRIBUTES)):
+            raise exceptions.CommandError(
+                _("Invalid Nuage attributes for port '{}' in manifest {}, "
+                  "expected a mapping with {}").format(
+                    port_name_or_id, path, ', '.join(MANIFEST_ATTRIBUTES)))
+        # YAML turns names like 100 into numbers
+        pgs = attrs.get('nuage_policy_groups')
+        if pgs is not None:
+            attrs['nuage_policy_groups'] = [
+                str(pg) for pg in (pgs if isinstance(pgs, list) else [pgs])]
+        for attr in ('nuage_redirect_target', 'nuage_floatingip'):
+            if attrs.get(attr) is not None:
+                attrs[attr] = str(attrs[attr])
+    return {str(port_name_or_id): attrs
+            for port_name_or_id, attrs in manifest.items()}
+
+
+def _convert_floating_ips_to_ids(nuageclient, floating_ips):
+    """Convert Nuage floating IP addresses or ids to ids in bulk"""
+    addresses = set(fip for fip in floating_ips
+                    if netutils.is_valid_ipv4(fip))
+    ids_by_address = collections.defaultdict(list)
+    addresses = sorted(addresses)
+    for i in range(0, len(addresses), PORT_FILTER_CHUNK_SIZE):
+        for fip in nuageclient.list_nuage_floatingips(
+                floating_ip_address=addresses[i:i + PORT_FILTER_CHUNK_SIZE],
+                fields=['id', 'floating_ip_address'])['nuage_floatingips']:
+            ids_by_address[fip['floating_ip_address']].append(fip['id'])
+
+    fip_ids = {}
+    for fip in floating_ips:
+        if not netutils.is_valid_ipv4(fip):
+            # Validates the ID the same way as port set --nuage-floatingip
+            fip_ids[fip] = get_nuage_floating_ip(nuageclient, fip)
+        elif len(ids_by_address[fip]) == 1:
+            fip_ids[fip] = ids_by_address[fip][0]
+        elif ids_by_address[fip]:
+            raise exceptions.CommandError(
+                _("Multiple Nuage Floating IP exist with IP {}").format(fip))
+        else:
+            raise exceptions.CommandError(
+                _("No Nuage Floating IP available with IP {}").format(fip))
+    return fip_ids
+
+
+def resolve_nuage_manifest(client, nuageclient, manifest):
+    """Resolve all names of a manifest as returned by load_nuage_manifest
+
+    Ports, policy groups, redirect targets and floating IPs are resolved
+    with a list request per PORT_FILTER_CHUNK_SIZE names of each.
+
+    :returns: dict of port ID to its desired Nuage attributes, in the
+              format of update_port
+    """
+    def list_ports(name, fields):
+        return ({'id': p.id, 'name': p.name} for p in client.ports(name=name))
+
+    def values(attr):
+        return set(value for attrs in manifest.values()
+                   for value in (attrs.get(attr) or ()))
+
+    port_ids = _convert_names_to_ids(list_ports, 'port', manifest)
+    pg_names = sorted(values('nuage_policy_groups'))
+    pg_ids = dict(zip(pg_names, convert_pg_names_to_ids(nuageclient,
+                                                        pg_names)))
+    rt_names = sorted(set(attrs['nuage_redirect_target']
+                          for attrs in manifest.values()
+                          if attrs.get('nuage_redirect_target')))
+    rt_ids = dict(zip(rt_names, _convert_names_to_ids(
+        lambda **kwargs: nuageclient.list_nuage_redirect_targets(
+            **kwargs)['nuage_redirect_targets'],
+        'nuage_redirect_target', rt_names)))
+    fip_ids = _convert_floating_ips_to_ids(
+        nuageclient, set(attrs['nuage_floatingip']
+                         for attrs in manifest.values()
+                         if attrs.get('nuage_floatingip')))
+
+    desired = {}
+    for port_id, attrs in zip(port_ids, manifest.values()):
+        port_attrs = desired.setdefault(port_id, {})
+        if 'nuage_policy_groups' in attrs:
+            port_attrs['nuage_policy_groups'] = [
+                pg_ids[pg] for pg in attrs['nuage_policy_groups'] or ()]
+        if 'nuage_redirect_target' in attrs:
+            rt = attrs['nuage_redirect_target']
+            port_attrs['nuage_redirect_targets'] = [rt_ids[rt]] if rt else []
+        if 'nuage_floatingip' in attrs:
+            fip = attrs['nuage_floatingip']
+            port_attrs['nuage_floatingip'] = ({'id': fip_ids[fip]}
+                                              if fip else None)
+    return desired
+
+
+def update_ports_from_manifest(client, nuageclient, path):
+    """Bring the Nuage attributes of the ports of a manifest in line
+
+    Only the ports of which the attributes differ from the manifest are
+    updated, NUAGE_UPDATE_WORKERS at the same time.
+    """
+    desired = resolve_nuage_manifest(client, nuageclient,
+                                     load_nuage_manifest(path))
+    current = get_nuage_attrs_for_ports(nuageclient, desired)
+    updates = [(port_id, diff_nuage_attrs(current[port_id], attrs))
+               for port_id, attrs in desired.items()]
+    updates = [(port_id, attrs) for port_id, attrs in updates if attrs]
+    LOG.debug('Updating %d of the %d ports of manifest %s',
+              len(updates), len(desired), path)
+
+    results = run_concurrently(
+        lambda update: client.update_port(update[0], **update[1]),
+        updates, NUAGE_UPDATE_WORKERS)
+    failures = [(port_id, e) for (port_id, _attrs), _port, e in results if e]
+    for port_id, e in failures:
+        LOG.error(_("Failed to set Nuage attributes of port '{}': "
+                    "{}").format(port_id, e))
+    if failures:
+        msg = (_("{failed} of {total} port(s) failed to update.")
+               .format(failed=len(failures), total=len(updates)))
+        raise exceptions.CommandError(msg)
+
+
+def _patch_upstream():
+    # Add Nuage specific attributes to Openstack port
+    port_resource.nuage_floatingip = resource.Body('nuage_floatingip')
+    port_resource.nuage_policy_groups = resource.Body('nuage_policy_groups',
+                                                      type=list)
+    port_resource.nuage_redirect_targets = resource.Body(
+        'nuage_redirect_targets')
+
+    # Formatters for Nuage specific attributes
+    port._formatters.update({
+        'nuage_floatingip': osc_utils.format_dict,
+        'nuage_policy_groups': osc_utils.format_list,
+        # for historic reasons, rtarget is a list in plugin api
+        'nuage_redirect_targets': osc_utils.format_list})
+
+    port._get_attrs = get_nuage_attrs_port_create
+
+
+upstream_patch = UpstreamPatch(_patch_upstream)
+
+
 def get_nuage_attrs_port_create(client_manager, parsed_args):
     attrs = super_get_attrs(client_manager, parsed_args)
 
@@ -140,42 +522,67 @@ def get_nuage_attrs_port_create(client_manager, parsed_args):
     return attrs
 
 
-class ShowPort(port.ShowPort):
+@upstream_patch
+class ShowPort(NuageCommand, port.ShowPort):
 
     def __init__(self, *args, **kwargs):
         super(ShowPort, self).__init__(*args, **kwargs)
 
-    def _handle_nuage_specific_attributes(self, port):
-        """Fetch extra Nuage attributes for the port that we have to show"""
+    def _handle_nuage_specific_attributes(self, port, lookups=None):
+        """Fetch extra Nuage attributes for the port that we have to show
+
+        :param port: the port to enrich with the Nuage attributes
+        :param lookups: futures as returned by submit_nuage_port_lookups in
+                        case the lookups for this port are already running
+        """
 
         if not port:
             return
 
-        nuageclient = self.app.client_manager.nuageclient
+        if lookups is None:
+            nuageclient = self.app.client_manager.nuageclient
+            with futures.ThreadPoolExecutor(
+                    max_workers=NUAGE_LOOKUP_WORKERS) as executor:
+                lookups = submit_nuage_port_lookups(executor, nuageclient,
+                                                    port.id)
+        pgs, rt, fip = lookups
 
         try:
-            # Fetch Nuage policy groups
-            pgs = get_nuage_policygroups(nuageclient, port.id)
-            port.nuage_policy_groups = list(pgs) or None
+            # Nuage policy groups
+            port.nuage_policy_groups = pgs.result() or None
 
-            # Fetch Nuage redirect target
-            rt = get_nuage_redirect_target(nuageclient, port.id)
+            # Nuage redirect target
+            rt = rt.result()
             port.nuage_redirect_targets = [rt['id']] if rt else None
 
-            # Fetch Nuage floating ip
-            fips = nuageclient.list_nuage_floatingips(
-                ports=[port.id], fields=['id', 'floating_ip_address'])
-            port.nuage_floatingip = (fips['nuage_floatingips'][0]
-                                     if fips['nuage_floatingips'] else None)
+            # Nuage floating ip
+            port.nuage_floatingip = fip.result()
         except (neutron_exceptions.BadRequest, neutron_exceptions.NotFound):
             # TODO(glenn) Can we find better way to detect a port with no vport
             pass
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        obj = client.find_port(parsed_args.port, ignore_missing=False)
+        nuageclient = self.app.client_manager.nuageclient
 
-        self._handle_nuage_specific_attributes(obj)
+        with futures.ThreadPoolExecutor(
+                max_workers=NUAGE_LOOKUP_WORKERS) as executor:
+            port_lookup = executor.submit(client.find_port, parsed_args.port,
+                                          ignore_missing=False)
+            # When the port is given by ID the Nuage lookups do not have to
+            # wait for find_port, so all requests are issued at the same time
+            lookups = None
+            if re.match(UUID_PATTERN, parsed_args.port):
+                lookups = submit_nuage_port_lookups(executor, nuageclient,
+                                                    parsed_args.port)
+            obj = port_lookup.result()
+            # A port can be named like the ID of another port, in which case
+            # the lookups started from parsed_args.port are for the wrong one
+            if obj and (lookups is None or obj.id != parsed_args.port):
+                lookups = submit_nuage_port_lookups(executor, nuageclient,
+                                                    obj.id)
+
+            self._handle_nuage_specific_attributes(obj, lookups)
 
         display_columns, columns = port._get_columns(obj)
         data = osc_utils.get_item_properties(obj, columns,
@@ -183,7 +590,48 @@ class ShowPort(port.ShowPort):
         return display_columns, data
 
 
-class UnsetPort(port.UnsetPort):
+@upstream_patch
+class ListPort(NuageCommand, port.ListPort):
+
+    def get_parser(self, prog_name):
+        parser = super(ListPort, self).get_parser(prog_name)
+        parser.add_argument(
+            '--nuage-details',
+            action='store_true',
+            default=False,
+            help=_('List the Nuage policy groups, redirect target and '
+                   'floating IP of the ports as well.'))
+        return parser
+
+    def take_action(self, parsed_args):
+        if not parsed_args.nuage_details:
+            return super(ListPort, self).take_action(parsed_args)
+
+        # The port ID is needed to join the Nuage attributes, so fetch all
+        # port columns and leave the column selection to the formatter.
+        selected_columns = parsed_args.columns
+        parsed_args.columns = []
+        headers, data = super(ListPort, self).take_action(parsed_args)
+        parsed_args.columns = selected_columns
+
+        rows = list(data)
+        id_index = headers.index('ID')
+        nuage_attrs = get_nuage_attrs_for_ports(
+            self.app.client_manager.nuageclient,
+            (row[id_index] for row in rows))
+
+        columns = tuple(attr for attr, _ in _nuage_attr_map)
+        headers = tuple(headers) + tuple(
+            header for _, header in _nuage_attr_map)
+        return (headers, (
+            tuple(row) + osc_utils.get_dict_properties(
+                nuage_attrs[row[id_index]], columns,
+                formatters=port._formatters)
+            for row in rows))
+
+
+@upstream_patch
+class UnsetPort(NuageCommand, port.UnsetPort):
 
     def get_parser(self, prog_name):
         parser = super(UnsetPort, self).get_parser(prog_name)
@@ -223,14 +671,15 @@ class UnsetPort(port.UnsetPort):
 
         if parsed_args.nuage_policy_group:
             # get current policygroups
-            pg_ids = get_nuage_policygroups(nuageclient, port.id)
+            current = {'nuage_policy_groups': list(
+                get_nuage_policygroups(nuageclient, port.id))}
 
             # remove the passed policygroups from the list
             excluded_pg_ids = set(convert_pg_names_to_ids(
                 nuageclient, parsed_args.nuage_policy_group))
-            attrs['nuage_policy_groups'] = [
-                pg_id for pg_id in pg_ids
-                if pg_id not in excluded_pg_ids]
+            attrs.update(diff_nuage_attrs(current, {'nuage_policy_groups': [
+                pg_id for pg_id in current['nuage_policy_groups']
+                if pg_id not in excluded_pg_ids]}))
 
     def take_action(self, parsed_args):
         # Copied from overwritten method!
@@ -239,14 +688,11 @@ class UnsetPort(port.UnsetPort):
         obj = client.find_port(parsed_args.port, ignore_missing=False)
         # SDK ignores update() if it receives a modified obj and attrs
         # To handle the same tmp_obj is created in all take_action of
-        # Unset* classes
-        tmp_fixed_ips = copy.deepcopy(obj.fixed_ips)
-        tmp_binding_profile = copy.deepcopy(obj.binding_profile)
-        tmp_secgroups = copy.deepcopy(obj.security_group_ids)
-        tmp_addr_pairs = copy.deepcopy(obj.allowed_address_pairs)
+        # Unset* classes, for the attributes which are unset only
         port._prepare_fixed_ips(self.app.client_manager, parsed_args)
         attrs = {}
         if parsed_args.fixed_ip:
+            tmp_fixed_ips = copy.deepcopy(obj.fixed_ips)
             try:
                 for ip in parsed_args.fixed_ip:
                     tmp_fixed_ips.remove(ip)
@@ -255,6 +701,7 @@ class UnsetPort(port.UnsetPort):
                 raise exceptions.CommandError(msg)
             attrs['fixed_ips'] = tmp_fixed_ips
         if parsed_args.binding_profile:
+            tmp_binding_profile = copy.deepcopy(obj.binding_profile)
             try:
                 for key in parsed_args.binding_profile:
                     del tmp_binding_profile[key]
@@ -263,6 +710,7 @@ class UnsetPort(port.UnsetPort):
                 raise exceptions.CommandError(msg)
             attrs['binding:profile'] = tmp_binding_profile
         if parsed_args.security_group_ids:
+            tmp_secgroups = copy.deepcopy(obj.security_group_ids)
             try:
                 for sg in parsed_args.security_group_ids:
                     sg_id = client.find_security_group(
@@ -273,6 +721,7 @@ class UnsetPort(port.UnsetPort):
                 raise exceptions.CommandError(msg)
             attrs['security_group_ids'] = tmp_secgroups
         if parsed_args.allowed_address_pairs:
+            tmp_addr_pairs = copy.deepcopy(obj.allowed_address_pairs)
             try:
                 for addr in port._convert_address_pairs(parsed_args):
                     tmp_addr_pairs.remove(addr)
@@ -296,7 +745,8 @@ class UnsetPort(port.UnsetPort):
         _tag.update_tags_for_unset(client, obj, parsed_args)
 
 
-class SetPort(port.SetPort):
+@upstream_patch
+class SetPort(NuageCommand, port.SetPort):
 
     def get_parser(self, prog_name):
         parser = super(SetPort, self).get_parser(prog_name)
@@ -310,6 +760,26 @@ class SetPort(port.SetPort):
                    "--no-nuage-policygroup to overwrite the current Nuage "
                    "policygroups")
         )
+        parser.add_argument(
+            '--nuage-from-file',
+            metavar='<manifest>',
+            help=_("Set the Nuage policy groups, redirect target and "
+                   "floating IP of many ports at once, from a YAML file "
+                   "mapping each port (name or ID) to its "
+                   "nuage_policy_groups, nuage_redirect_target and "
+                   "nuage_floatingip. Only the ports which differ from the "
+                   "file are updated. Replaces the <port> argument and "
+                   "can not be combined with the other options.")
+        )
+        # The port is given by the manifest in case of --nuage-from-file,
+        # which excludes the other options of port set
+        self._port_options = []
+        for action in parser._actions:
+            if action.dest == 'port':
+                action.nargs = '?'
+            elif action.option_strings and action.dest not in (
+                    'help', 'nuage_from_file'):
+                self._port_options.append(action)
 
         return parser
 
@@ -333,23 +803,60 @@ class SetPort(port.SetPort):
             if rt_id:
                 attrs['nuage_redirect_targets'] = [rt_id]
 
-        if parsed_args.no_nuage_policy_groups:
-            # overwrite the existing Nuage policygroups
-            attrs['nuage_policy_groups'] = []
-        elif parsed_args.nuage_policy_group:
-            # start from the existing policygroups
-            attrs['nuage_policy_groups'] = list(
-                get_nuage_policygroups(nuageclient, port.id))
-
-        if parsed_args.nuage_policy_group:
-            # extend with the new policygroups
-            new_pgs = convert_pg_names_to_ids(
-                nuageclient, parsed_args.nuage_policy_group)
-            attrs['nuage_policy_groups'].extend(new_pgs)
+        if (parsed_args.no_nuage_policy_groups or
+                parsed_args.nuage_policy_group):
+            # Policygroups are only sent when the membership changes
+            try:
+                current = {'nuage_policy_groups': list(
+                    get_nuage_policygroups(nuageclient, port.id))}
+            except (neutron_exceptions.BadRequest,
+                    neutron_exceptions.NotFound) as e:
+                if not parsed_args.no_nuage_policy_groups:
+                    raise
+                # A port without vport has no policygroups to look up, they
+                # are then overwritten regardless
+                LOG.debug('Unable to get the policygroups of port %s: %s',
+                          port.id, e)
+                current = None
+            if parsed_args.no_nuage_policy_groups:
+                # overwrite the existing Nuage policygroups
+                pg_ids = []
+            else:
+                # start from the existing policygroups
+                pg_ids = list(current['nuage_policy_groups'])
+            if parsed_args.nuage_policy_group:
+                # extend with the new policygroups
+                pg_ids.extend(convert_pg_names_to_ids(
+                    nuageclient, parsed_args.nuage_policy_group))
+            if current is None:
+                attrs['nuage_policy_groups'] = pg_ids
+            else:
+                attrs.update(diff_nuage_attrs(
+                    current, {'nuage_policy_groups': pg_ids}))
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
 
+        if parsed_args.nuage_from_file:
+            if parsed_args.port:
+                raise exceptions.CommandError(
+                    _("<port> can not be combined with --nuage-from-file"))
+            options = [action.option_strings[0]
+                       for action in self._port_options
+                       if getattr(parsed_args, action.dest,
+                                  action.default) != action.default]
+            if options:
+                raise exceptions.CommandError(
+                    _("{} can not be combined with "
+                      "--nuage-from-file").format(', '.join(options)))
+            update_ports_from_manifest(client,
+                                       self.app.client_manager.nuageclient,
+                                       parsed_args.nuage_from_file)
+            return
+        if not parsed_args.port:
+            raise exceptions.CommandError(
+                _("<port> or --nuage-from-file is required"))
+
         port._prepare_fixed_ips(self.app.client_manager, parsed_args)
         obj = client.find_port(parsed_args.port, ignore_missing=False)
         attrs = super_get_attrs(self.app.client_manager, parsed_args)
@@ -413,10 +920,8 @@ class SetPort(port.SetPort):
         _tag.update_tags_for_set(client, obj, parsed_args)
 
 
-port._get_attrs = get_nuage_attrs_port_create
-
-
-class CreatePort(port.CreatePort):
+@upstream_patch
+class CreatePort(NuageCommand, port.CreatePort):
 
     def get_parser(self, prog_name):
         parser = super(CreatePort, self).get_parser(prog_name)
@@ -0,0 +1,94 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Profiling of the requests made by the Nuage client
+
+When the global --nuage-profile option is given, every request of the Nuage
+client is recorded with its method, path template, status, latency and
+response size, and a report is written to stderr when the command ends. In
+an interactive openstack shell every command is reported on its own.
+"""
+
+import collections
+import json
+import re
+import threading
+import time
+
+FORMATS = ('table', 'json')
+
+RequestRecord = collections.namedtuple(
+    'RequestRecord', ['method', 'path', 'status', 'latency', 'size'])
+
+# UUIDs, with or without dashes. This module is imported by the plugin for
+# every openstack command, so it keeps to the standard library.
+_ID_SEGMENT = re.compile('^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-'
+                         '[0-9a-f]{12}|[0-9a-f]{32})$', re.IGNORECASE)
+
+
+def path_template(action):
+    """Replace the IDs in the path of a request by {id}"""
+    path = action.split('?')[0]
+    return '/'.join('{id}' if _ID_SEGMENT.match(segment) else segment
+                    for segment in path.split('/'))
+
+
+class RequestProfiler(object):
+    """Collects the requests of a client and reports on them"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget the recorded requests and restart the wall time"""
+        with self._lock:
+            self.started = time.monotonic()
+            self.records = []
+
+    def record(self, method, action, status, latency, size):
+        with self._lock:
+            self.records.append(RequestRecord(
+                method, path_template(action), status, latency, size))
+
+    def totals(self):
+        with self._lock:
+            records = list(self.records)
+        return {'requests': len(records),
+                'latency': sum(r.latency for r in records),
+                'size': sum(r.size or 0 for r in records),
+                'wall_time': time.monotonic() - self.started}
+
+    def report(self, stream, fmt='table'):
+        totals = self.totals()
+        if fmt == 'json':
+            stream.write(json.dumps({
+                'requests': [r._asdict() for r in self.records],
+                'totals': totals}, indent=2))
+            stream.write('\n')
+            return
+
+        line = '{:<7} {:<52} {:>6} {:>10} {:>10}\n'
+        stream.write(line.format('Method', 'Path', 'Status', 'Time (ms)',
+                                 'Bytes'))
+        for r in self.records:
+            stream.write(line.format(r.method, r.path, r.status or '-',
+                                     '{:.1f}'.format(r.latency * 1000),
+                                     r.size if r.size is not None else '-'))
+        stream.write(line.format(
+            'Total', '{} Nuage requests'.format(totals['requests']), '',
+            '{:.1f}'.format(totals['latency'] * 1000), totals['size']))
+        stream.write(line.format(
+            '', 'Command wall time', '',
+            '{:.1f}'.format(totals['wall_time'] * 1000), ''))
@@ -0,0 +1,192 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""In-memory store of the Nuage reference data of an openstack shell
+
+Net partitions, gateways, policy groups and redirect targets are referred to
+by name by many commands, and every command resolves those names again. The
+store lives on the client manager, so in an interactive openstack shell it
+lives as long as the shell, and it keeps the ID and name of every resource of
+those types. Names are resolved from memory, for the lookups which only
+need the ID or name of the resource.
+
+A collection is loaded when a command resolves a name of its type and an
+earlier command of the shell did so too, so a single openstack command keeps
+using the filtered lookups of the server, however many names it resolves.
+The commands report their end with end_command. Once loaded, a collection is
+kept warm with a revision check when it was last checked more than
+REVISION_CHECK_INTERVAL seconds ago: only the IDs and revision numbers are
+listed, and only the resources which were added or changed are fetched
+again. Resources without a revision number are listed again as a whole.
+
+Names which are not found, or not unique, in the store are resolved by the
+server, which reports them as it does without the store.
+"""
+
+import collections
+import logging
+import threading
+import time
+
+LOG = logging.getLogger(__name__)
+
+# Resources kept in the store
+RESOURCES = ('net_partition', 'nuage_gateway', 'nuage_policy_group',
+             'nuage_redirect_target')
+
+REFERENCE_FIELDS = ['id', 'name', 'revision_number']
+REVISION_FIELDS = ['id', 'revision_number']
+
+# Seconds after which a collection is checked for changes before use
+REVISION_CHECK_INTERVAL = 10
+
+# Number of earlier commands resolving names of a type after which its
+# collection is loaded
+LOAD_AFTER_COMMANDS = 1
+
+# Number of IDs per list request when fetching changed resources
+ID_FILTER_CHUNK_SIZE = 100
+
+
+class _Collection(object):
+
+    def __init__(self):
+        self.items = None
+        self.ids_by_name = {}
+        self.checked_at = None
+        # Whether the current command resolved names of the collection
+        self.used = False
+        # Number of ended commands which did
+        self.commands = 0
+
+    def index(self):
+        self.ids_by_name = collections.defaultdict(list)
+        for item in self.items.values():
+            self.ids_by_name[item['name']].append(item['id'])
+
+
+class ReferenceStore(object):
+    """Names and IDs of the Nuage reference resources
+
+    :param check_interval: seconds a collection is used without checking it
+                           for changes
+    """
+
+    def __init__(self, check_interval=REVISION_CHECK_INTERVAL):
+        self.check_interval = check_interval
+        self._collections = dict((resource, _Collection())
+                                 for resource in RESOURCES)
+        self._lock = threading.Lock()
+
+    def holds(self, resource):
+        return resource in self._collections
+
+    def _list(self, client, resource, **params):
+        plural = client.get_resource_plural(resource)
+        return getattr(client, 'list_' + plural)(**params)[plural]
+
+    def _load(self, client, resource, collection):
+        items = self._list(client, resource, fields=REFERENCE_FIELDS)
+        collection.items = dict((item['id'], item) for item in items)
+
+    def _check(self, client, resource, collection):
+        """Fetch the resources which changed since the collection was loaded
+        """
+        revisions = dict(
+            (item['id'], item.get('revision_number')) for item in
+            self._list(client, resource, fields=REVISION_FIELDS))
+        if None in revisions.values():
+            self._load(client, resource, collection)
+            return
+        items = collection.items
+        for resource_id in set(items).difference(revisions):
+            del items[resource_id]
+        changed = sorted(
+            resource_id for resource_id, revision in revisions.items()
+            if items.get(resource_id, {}).get('revision_number') != revision)
+        LOG.debug('%d of the %d cached %s changed', len(changed),
+                  len(revisions), resource)
+        for i in range(0, len(changed), ID_FILTER_CHUNK_SIZE):
+            for item in self._list(
+                    client, resource, fields=REFERENCE_FIELDS,
+                    id=changed[i:i + ID_FILTER_CHUNK_SIZE]):
+                items[item['id']] = item
+
+    def _collection(self, client, resource):
+        """Return the up to date collection of resource, None if not loaded
+        """
+        collection = self._collections[resource]
+        collection.used = True
+        if collection.items is None:
+            if collection.commands < LOAD_AFTER_COMMANDS:
+                return None
+            self._load(client, resource, collection)
+        elif (collection.checked_at is None or
+              time.monotonic() - collection.checked_at >
+              self.check_interval):
+            self._check(client, resource, collection)
+        else:
+            return collection
+        collection.index()
+        collection.checked_at = time.monotonic()
+        return collection
+
+    def find(self, client, resource, name_or_id):
+        """Return the ID and name of a resource by ID or unique name
+
+        :param client: Nuage client to load or check the collection with
+        :returns: dict with the id and name, None when the store does not
+                  have a single match and the server has to be asked
+        """
+        return self.find_all(client, resource, [name_or_id])[name_or_id]
+
+    def find_all(self, client, resource, names_or_ids):
+        """Look up several resources of a type with a single resolution
+
+        :returns: dict of name or ID to the result of find
+        """
+        with self._lock:
+            collection = self._collection(client, resource)
+            found = dict.fromkeys(names_or_ids)
+            if collection is None:
+                return found
+            for name_or_id in found:
+                if name_or_id in collection.items:
+                    ids = [name_or_id]
+                else:
+                    ids = collection.ids_by_name.get(name_or_id, ())
+                if len(ids) == 1:
+                    item = collection.items[ids[0]]
+                    found[name_or_id] = {'id': item['id'],
+                                         'name': item['name']}
+            if None in found.values():
+                # Resources created by another client are fetched with the
+                # next lookup rather than once the check interval is over
+                collection.checked_at = None
+            return found
+
+    def expire(self, resources):
+        """Check the collections of resources for changes before their use"""
+        with self._lock:
+            for resource in resources:
+                if resource in self._collections:
+                    self._collections[resource].checked_at = None
+
+    def end_command(self):
+        """Count the end of a command for the collections it used"""
+        with self._lock:
+            for collection in self._collections.values():
+                if collection.used:
+                    collection.commands += 1
+                    collection.used = False
@@ -12,26 +12,40 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+from concurrent import futures
+
 from openstack.network.v2.router import Router as router_resource
 from openstack import resource
 from openstackclient.network.v2 import router
 from osc_lib import utils as osc_lib_utils
 
 from nuage_neutronclient._i18n import _
-
-
-# Add Nuage specific attributes
-router_resource.nuage_net_partition = resource.Body('net_partition')
-router_resource.nuage_rt = resource.Body('rt')
-router_resource.nuage_rd = resource.Body('rd')
-router_resource.nuage_backhaul_vnid = resource.Body('nuage_backhaul_vnid')
-router_resource.nuage_backhaul_rd = resource.Body('nuage_backhaul_rd')
-router_resource.nuage_backhaul_rt = resource.Body('nuage_backhaul_rt')
-router_resource.nuage_router_template = resource.Body('nuage_router_template')
-router_resource.nuage_tunnel_type = resource.Body('tunnel_type')
-router_resource.nuage_ecmp_count = resource.Body('ecmp_count')
-router_resource.nuage_underlay = resource.Body('nuage_underlay')
-router_resource.nuage_aggregate_flows = resource.Body('nuage_aggregate_flows')
+from nuage_neutronclient.osc.v2.utils import NuageCommand
+from nuage_neutronclient.osc.v2.utils import run_concurrently
+from nuage_neutronclient.osc.v2.utils import UpstreamPatch
+
+# Maximum number of router IDs passed as filter in a single vsd_domains
+# request, which keeps the request URL well below the usual 8k limit of web
+# servers
+ROUTER_FILTER_CHUNK_SIZE = 100
+
+# Number of concurrent requests of router list --nuage-details
+NUAGE_LOOKUP_WORKERS = 4
+
+# Nuage attributes of a router, in the order they are listed, with the
+# attribute of the L3 domain they are taken from
+_nuage_attr_map = (
+    ('nuage_net_partition', 'Nuage Net Partition', 'net_partition_id'),
+    ('nuage_rd', 'Nuage RD', 'rd'),
+    ('nuage_rt', 'Nuage RT', 'rt'),
+    ('nuage_backhaul_vnid', 'Nuage Backhaul VNID', 'backhaul_vnid'),
+    ('nuage_backhaul_rd', 'Nuage Backhaul RD', 'backhaul_rd'),
+    ('nuage_backhaul_rt', 'Nuage Backhaul RT', 'backhaul_rt'),
+    ('nuage_router_template', 'Nuage Router Template', 'router_template_id'),
+    ('nuage_tunnel_type', 'Nuage Tunnel Type', 'tunnel_type'),
+    ('nuage_ecmp_count', 'Nuage ECMP Count', 'ecmp_count'),
+)
 
 
 def add_create_update_attributes(parser):
@@ -87,6 +101,96 @@ def add_create_update_attributes(parser):
                'aggregate flows or route/pbr based aggragate flows enabled.'))
 
 
+def _get_interfaces_info(ports):
+    """Get the interfaces_info of ShowRouter from router ports"""
+    return [{'port_id': port.id,
+             'ip_address': ip_spec.get('ip_address'),
+             'subnet_id': ip_spec.get('subnet_id')}
+            for port in ports
+            if port.device_owner != "network:router_gateway"
+            for ip_spec in port.fixed_ips]
+
+
+def _get_l3domains_for_router_chunk(nuageclient, router_ids):
+    """Get the L3 domains of a chunk of routers with a single request
+
+    :returns: dict of router ID to its L3 domain
+    """
+    domains = nuageclient.list_vsd_domains(
+        os_router_ids=router_ids)['vsd_domains']
+    domains_by_router = {}
+    unknown = []
+    for domain in domains:
+        router_id = domain.get('os_router_id') or domain.get('router_id')
+        if router_id not in router_ids:
+            # The Nuage plugin names the L3 domain of a router by its ID
+            router_id = domain.get('name')
+        if router_id in router_ids:
+            domains_by_router[router_id] = domain
+        else:
+            unknown.append(domain)
+    if unknown:
+        # The domains do not tell which router they belong to, look up the
+        # remaining routers one at a time
+        missing = [router_id for router_id in router_ids
+                   if router_id not in domains_by_router]
+        for router_id, domain, error in run_concurrently(
+                nuageclient.get_l3domain, missing, NUAGE_LOOKUP_WORKERS):
+            if error:
+                raise error
+            domains_by_router[router_id] = domain
+    return domains_by_router
+
+
+def get_nuage_attrs_for_routers(client, nuageclient, router_ids):
+    """Get the Nuage attributes and interfaces of many routers at once
+
+    The L3 domains and the ports of the routers are queried in chunks of
+    ROUTER_FILTER_CHUNK_SIZE routers, and joined client-side by router ID.
+    Like ShowRouter, every port of a router but its gateway port is listed
+    as interface.
+
+    :returns: dict of router ID to a dict with the Nuage attributes and the
+              interfaces_info of the router
+    """
+    router_ids = list(router_ids)
+    router_attrs = {router_id: dict.fromkeys(
+        [attr for attr, _header, _key in _nuage_attr_map] +
+        ['interfaces_info'])
+        for router_id in router_ids}
+    chunks = [router_ids[i:i + ROUTER_FILTER_CHUNK_SIZE]
+              for i in range(0, len(router_ids), ROUTER_FILTER_CHUNK_SIZE)]
+
+    with futures.ThreadPoolExecutor(
+            max_workers=NUAGE_LOOKUP_WORKERS) as executor:
+        port_lookups = [executor.submit(
+            lambda chunk: list(client.ports(device_id=chunk)), chunk)
+            for chunk in chunks]
+        domain_lookups = [executor.submit(_get_l3domains_for_router_chunk,
+                                          nuageclient, chunk)
+                          for chunk in chunks]
+
+        ports_by_router = collections.defaultdict(list)
+        for port_lookup in port_lookups:
+            for port in port_lookup.result():
+                ports_by_router[port.device_id].append(port)
+        for attrs in router_attrs.values():
+            attrs['interfaces_info'] = []
+        for router_id, ports in ports_by_router.items():
+            if router_id in router_attrs:
+                router_attrs[router_id]['interfaces_info'] = (
+                    _get_interfaces_info(ports))
+
+        for domain_lookup in domain_lookups:
+            for router_id, domain in domain_lookup.result().items():
+                if not domain:
+                    continue
+                router_attrs[router_id].update(
+                    (attr, domain.get(key))
+                    for attr, _header, key in _nuage_attr_map)
+    return router_attrs
+
+
 super_get_attrs = router._get_attrs
 
 
@@ -118,11 +222,31 @@ def _get_attrs(client_manager, parsed_args):
     return attrs
 
 
-# router._get_columns = _get_columns
-router._get_attrs = _get_attrs
+def _patch_upstream():
+    # Add Nuage specific attributes
+    router_resource.nuage_net_partition = resource.Body('net_partition')
+    router_resource.nuage_rt = resource.Body('rt')
+    router_resource.nuage_rd = resource.Body('rd')
+    router_resource.nuage_backhaul_vnid = resource.Body('nuage_backhaul_vnid')
+    router_resource.nuage_backhaul_rd = resource.Body('nuage_backhaul_rd')
+    router_resource.nuage_backhaul_rt = resource.Body('nuage_backhaul_rt')
+    router_resource.nuage_router_template = resource.Body(
+        'nuage_router_template')
+    router_resource.nuage_tunnel_type = resource.Body('tunnel_type')
+    router_resource.nuage_ecmp_count = resource.Body('ecmp_count')
+    router_resource.nuage_underlay = resource.Body('nuage_underlay')
+    router_resource.nuage_aggregate_flows = resource.Body(
+        'nuage_aggregate_flows')
+
+    # router._get_columns = _get_columns
+    router._get_attrs = _get_attrs
+
 
+upstream_patch = UpstreamPatch(_patch_upstream)
 
-class CreateRouter(router.CreateRouter):
+
+@upstream_patch
+class CreateRouter(NuageCommand, router.CreateRouter):
     def get_parser(self, prog_name):
         parser = super(CreateRouter, self).get_parser(prog_name)
 
@@ -136,7 +260,8 @@ class CreateRouter(router.CreateRouter):
         return parser
 
 
-class ShowRouter(router.ShowRouter):
+@upstream_patch
+class ShowRouter(NuageCommand, router.ShowRouter):
 
     def _handle_nuage_specific_attributes(self, router):
         """Fetch extra Nuage attributes for the router that we have to show"""
@@ -150,33 +275,16 @@ class ShowRouter(router.ShowRouter):
         domain = nuageclient.get_l3domain(router.id)
 
         if domain:
-            router.nuage_net_partition = domain.get('net_partition_id')
-            router.nuage_rd = domain.get('rd')
-            router.nuage_rt = domain.get('rt')
-            router.nuage_backhaul_vnid = domain.get('backhaul_vnid')
-            router.nuage_backhaul_rd = domain.get('backhaul_rd')
-            router.nuage_backhaul_rt = domain.get('backhaul_rt')
-            router.nuage_router_template = domain.get('router_template_id')
-            router.nuage_tunnel_type = domain.get('tunnel_type')
-            router.nuage_ecmp_count = domain.get('ecmp_count')
+            for attr, _header, key in _nuage_attr_map:
+                setattr(router, attr, domain.get(key))
 
     def take_action(self, parsed_args):
         """Adaptation of the upstream method supporting nuage data"""
 
         client = self.app.client_manager.network
         obj = client.find_router(parsed_args.router, ignore_missing=False)
-        interfaces_info = []
-        filters = {}
-        filters['device_id'] = obj.id
-        for port in client.ports(**filters):
-            if port.device_owner != "network:router_gateway":
-                for ip_spec in port.fixed_ips:
-                    int_info = {
-                        'port_id': port.id,
-                        'ip_address': ip_spec.get('ip_address'),
-                        'subnet_id': ip_spec.get('subnet_id')
-                    }
-                    interfaces_info.append(int_info)
+        interfaces_info = _get_interfaces_info(
+            client.ports(device_id=obj.id))
 
         setattr(obj, 'interfaces_info', interfaces_info)
 
@@ -190,7 +298,45 @@ class ShowRouter(router.ShowRouter):
         return display_columns, data
 
 
-class SetRouter(router.SetRouter):
+@upstream_patch
+class ListRouter(NuageCommand, router.ListRouter):
+
+    def get_parser(self, prog_name):
+        parser = super(ListRouter, self).get_parser(prog_name)
+        parser.add_argument(
+            '--nuage-details',
+            action='store_true',
+            default=False,
+            help=_('List the Nuage L3 domain attributes and the interfaces '
+                   'of the routers as well.'))
+        return parser
+
+    def take_action(self, parsed_args):
+        headers, data = super(ListRouter, self).take_action(parsed_args)
+        if not parsed_args.nuage_details:
+            return headers, data
+
+        rows = list(data)
+        id_index = headers.index('ID')
+        nuage_attrs = get_nuage_attrs_for_routers(
+            self.app.client_manager.network,
+            self.app.client_manager.nuageclient,
+            (row[id_index] for row in rows))
+
+        columns = tuple(attr for attr, _header, _key in _nuage_attr_map) + (
+            'interfaces_info',)
+        headers = tuple(headers) + tuple(
+            header for _attr, header, _key in _nuage_attr_map) + (
+            'Interfaces Info',)
+        formatters = {'interfaces_info': router.RouterInfoColumn}
+        return (headers, (
+            tuple(row) + osc_lib_utils.get_dict_properties(
+                nuage_attrs[row[id_index]], columns, formatters=formatters)
+            for row in rows))
+
+
+@upstream_patch
+class SetRouter(NuageCommand, router.SetRouter):
     def get_parser(self, prog_name):
         parser = super(SetRouter, self).get_parser(prog_name)
         add_create_update_attributes(parser)
@@ -0,0 +1,119 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Incremental decoding of Neutron collection responses
+
+A list response like {"nuage_floatingips": [{...}, ...], "..._links": [...]}
+is decoded while it is received: the elements of the collection are yielded
+one at a time, so only a single element and a chunk of the response are held
+in memory, whatever the size of the collection.
+"""
+
+import codecs
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class CollectionStream(object):
+    """Iterate over the elements of a collection in a JSON response
+
+    :param chunks: iterable of the bytes of the response body
+    :param collection: top-level key of the collection, like 'nuage_gateways'
+
+    The other top-level members, like the pagination links, are small and
+    are decoded as a whole into `others`, which is complete once the
+    iteration ends.
+    """
+
+    def __init__(self, chunks, collection):
+        self.collection = collection
+        self.others = {}
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read(self):
+        """Append the next chunk to the buffer, False at the end of data"""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos:]
+        self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._decoder.decode(chunk)
+                return True
+        self._buffer += self._decoder.decode(b'', final=True)
+        self._eof = True
+        return True
+
+    def _next_char(self):
+        """Skip whitespace and return the next character, '' at the end"""
+        while True:
+            while (self._pos < len(self._buffer) and
+                   self._buffer[self._pos] in _WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ''
+
+    def _expect(self, chars):
+        char = self._next_char()
+        if not char or char not in chars:
+            raise ValueError('Expected {!r} at offset {} of the response, '
+                             'found {!r}'.format(chars, self._pos, char))
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """Decode the JSON value starting at the current position"""
+        self._next_char()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                if not self._read():
+                    raise
+                continue
+            # A number may continue in the next chunk
+            if end < len(self._buffer) or not self._read():
+                self._pos = end
+                return value
+
+    def __iter__(self):
+        self._expect('{')
+        if self._next_char() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key == self.collection:
+                self._expect('[')
+                if self._next_char() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(',]') == ']':
+                            break
+            else:
+                self.others[key] = self._value()
+            if self._expect(',}') == '}':
+                return
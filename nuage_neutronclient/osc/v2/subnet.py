@@ -14,6 +14,7 @@
 
 from neutronclient.common import utils
 from nuage_neutronclient.osc.v2.utils import update_dict
+from nuage_neutronclient.osc.v2.utils import UpstreamPatch
 from openstack.network.v2.subnet import Subnet as subnet_resource
 from openstack import resource
 from openstackclient.i18n import _
@@ -22,14 +23,6 @@ from osc_lib import exceptions
 
 openstack_get_attrs = subnet._get_attrs
 
-# Add Nuage specific attributes to Openstack Subnet
-subnet_resource.net_partition = resource.Body('net_partition')
-subnet_resource.nuagenet = resource.Body('nuagenet')
-subnet_resource.nuage_uplink = resource.Body('nuage_uplink')
-subnet_resource.nuage_underlay = resource.Body('nuage_underlay')
-subnet_resource.underlay = resource.Body('underlay', type=bool)
-subnet_resource.vsd_managed = resource.Body('vsd_managed', type=bool)
-
 
 def nuage_get_attrs(client_manager, parsed_args, is_create=True):
     attrs = openstack_get_attrs(client_manager, parsed_args, is_create)
@@ -49,9 +42,22 @@ def nuage_get_attrs(client_manager, parsed_args, is_create=True):
     return attrs
 
 
-subnet._get_attrs = nuage_get_attrs
+def _patch_upstream():
+    # Add Nuage specific attributes to Openstack Subnet
+    subnet_resource.net_partition = resource.Body('net_partition')
+    subnet_resource.nuagenet = resource.Body('nuagenet')
+    subnet_resource.nuage_uplink = resource.Body('nuage_uplink')
+    subnet_resource.nuage_underlay = resource.Body('nuage_underlay')
+    subnet_resource.underlay = resource.Body('underlay', type=bool)
+    subnet_resource.vsd_managed = resource.Body('vsd_managed', type=bool)
+
+    subnet._get_attrs = nuage_get_attrs
+
+
+upstream_patch = UpstreamPatch(_patch_upstream)
 
 
+@upstream_patch
 class CreateSubnet(subnet.CreateSubnet):
 
     def get_parser(self, prog_name):
@@ -72,6 +78,7 @@ class CreateSubnet(subnet.CreateSubnet):
         return parser
 
 
+@upstream_patch
 class SetSubnet(subnet.SetSubnet):
 
     def get_parser(self, prog_name):
@@ -84,5 +91,6 @@ class SetSubnet(subnet.SetSubnet):
         return parser
 
 
+@upstream_patch
 class ShowSubnet(subnet.ShowSubnet):
     pass
@@ -0,0 +1,268 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Persistent local cache of the Nuage gateway topology
+
+Gateways, gateway ports and gateway VLANs rarely change, but resolving them
+by name takes several list requests. The cache keeps the ID, name and parent
+of each of them in a SQLite database under the user cache directory, one
+database per Neutron endpoint and project. It is only consulted once it has
+been populated with 'openstack nuage cache refresh', and only as long as it
+is younger than its maximum age.
+
+An ID found in the cache is confirmed with a GET of its ID and name before
+it is used, which is a single request where resolving a name takes several.
+Resources the server no longer has, or which were renamed or moved, are
+dropped from the cache and resolved by the server.
+"""
+
+from concurrent import futures
+import contextlib
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+
+from neutronclient import client as http_client
+from neutronclient.common import exceptions
+
+LOG = logging.getLogger(__name__)
+
+GATEWAY = 'nuage_gateway'
+GATEWAY_PORT = 'nuage_gateway_port'
+GATEWAY_VLAN = 'nuage_gateway_vlan'
+
+RESOURCES = (GATEWAY, GATEWAY_PORT, GATEWAY_VLAN)
+
+# Attribute cached as the name, and attribute referring to the parent
+NAME_FIELDS = {GATEWAY: 'name', GATEWAY_PORT: 'name', GATEWAY_VLAN: 'value'}
+PARENT_FIELDS = {GATEWAY_PORT: 'gateway', GATEWAY_VLAN: 'gatewayport'}
+
+DEFAULT_MAX_AGE = 24 * 60 * 60  # seconds
+REFRESH_WORKERS = 4
+MMAP_SIZE = 64 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    resource TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT,
+    parent_id TEXT,
+    PRIMARY KEY (resource, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS resources_by_name
+    ON resources (resource, name, parent_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+def client_scope(client):
+    """Return the Neutron endpoint URL and project ID of a Nuage client"""
+    httpclient = client.httpclient
+    if isinstance(httpclient, http_client.SessionClient):
+        return httpclient.endpoint_url, httpclient.get_project_id()
+    if not httpclient.endpoint_url:
+        httpclient.authenticate_and_fetch_endpoint_url()
+    return (httpclient.endpoint_url,
+            httpclient.auth_tenant_id or httpclient.project_id or
+            httpclient.project_name)
+
+
+def default_path(endpoint_url, project_id):
+    cache_home = (os.environ.get('XDG_CACHE_HOME') or
+                  os.path.join(os.path.expanduser('~'), '.cache'))
+    scope = hashlib.sha256('{}\n{}'.format(
+        endpoint_url.rstrip('/'), project_id or '').encode('utf-8'))
+    return os.path.join(cache_home, 'nuage-openstack-neutronclient',
+                        'topology-{}.db'.format(scope.hexdigest()[:16]))
+
+
+class TopologyCache(object):
+    """Local cache of the Nuage gateways, gateway ports and VLANs
+
+    :param client: Nuage client of the endpoint and project to cache
+    :param path: location of the cache file, defaults to a file of the
+                 endpoint and project of client in the user cache dir
+    :param max_age: age in seconds after which the cache is considered stale
+    """
+
+    def __init__(self, client, path=None, max_age=DEFAULT_MAX_AGE):
+        self.client = client
+        self.path = path or default_path(*client_scope(client))
+        self.max_age = max_age
+        self._fresh = None
+
+    @contextlib.contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        try:
+            connection.execute('PRAGMA mmap_size={}'.format(MMAP_SIZE))
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def refreshed_at(self):
+        """Return the time of the last refresh, None if never refreshed"""
+        if not self.exists():
+            return None
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'refreshed_at'"
+                ).fetchone()
+        except sqlite3.Error as e:
+            LOG.debug('Unable to read nuage topology cache %s: %s',
+                      self.path, e)
+            return None
+        return row[0] if row else None
+
+    def is_fresh(self):
+        if self._fresh is None:
+            refreshed_at = self.refreshed_at()
+            self._fresh = (refreshed_at is not None and
+                           time.time() - refreshed_at < self.max_age)
+        return self._fresh
+
+    def clear(self):
+        if self.exists():
+            os.remove(self.path)
+        self._fresh = False
+
+    def refresh(self):
+        """Fetch the complete gateway topology and replace the cache
+
+        :returns: dict of resource to the number of cached items
+        """
+        client = self.client
+        rows = []
+        gateways = client.list_nuage_gateways(
+            fields=['id', 'name'])['nuage_gateways']
+        rows.extend((GATEWAY, gw['id'], gw['name'], None) for gw in gateways)
+
+        with futures.ThreadPoolExecutor(
+                max_workers=REFRESH_WORKERS) as executor:
+            port_lists = executor.map(
+                lambda gw: (gw['id'], client.list_nuage_gateway_ports(
+                    gateway=gw['id'])['nuage_gateway_ports']),
+                gateways)
+            ports = []
+            for gw_id, gw_ports in port_lists:
+                ports.extend(gw_ports)
+                rows.extend((GATEWAY_PORT, port['id'], port['name'], gw_id)
+                            for port in gw_ports)
+
+            vlan_lists = executor.map(
+                lambda port: (port['id'], client.list_nuage_gateway_vlans(
+                    gatewayport=port['id'], tenant='')['nuage_gateway_vlans']),
+                ports)
+            for port_id, vlans in vlan_lists:
+                rows.extend((GATEWAY_VLAN, vlan['id'], str(vlan['value']),
+                             port_id) for vlan in vlans)
+
+        directory = os.path.dirname(self.path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700)
+        with self._connect() as connection:
+            connection.executescript(_SCHEMA)
+            connection.execute('DELETE FROM resources')
+            connection.executemany(
+                'INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)', rows)
+            connection.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('refreshed_at', ?)",
+                (time.time(),))
+        self._fresh = True
+        return {resource: sum(1 for row in rows if row[0] == resource)
+                for resource in RESOURCES}
+
+    def record(self, resource, items, parent_id=None):
+        """Add resources which were created to the cache
+
+        :param items: the created resources, as returned by the server
+        """
+        if not self.exists():
+            return
+        name_field = NAME_FIELDS[resource]
+        with self._connect() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?)',
+                [(resource, item['id'], str(item[name_field]), parent_id)
+                 for item in items])
+
+    def forget(self, resource, resource_id):
+        """Remove a resource which was deleted from the cache"""
+        if not self.exists():
+            return
+        with self._connect() as connection:
+            connection.execute(
+                'DELETE FROM resources WHERE resource = ? AND id = ?',
+                (resource, resource_id))
+
+    def _revalidate(self, resource, resource_id, name, parent_id):
+        """Confirm with the server that a cached resource is still valid"""
+        name_field = NAME_FIELDS[resource]
+        fields = ['id', name_field]
+        if resource in PARENT_FIELDS:
+            fields.append(PARENT_FIELDS[resource])
+        try:
+            item = getattr(self.client, 'show_' + resource)(
+                resource_id, fields=fields)[resource]
+        except exceptions.NotFound:
+            item = None
+        if (item is None or str(item.get(name_field)) != name or
+                item.get(PARENT_FIELDS.get(resource), parent_id) !=
+                parent_id):
+            LOG.debug('Dropping %s %s from nuage topology cache', resource,
+                      resource_id)
+            self.forget(resource, resource_id)
+            return False
+        return True
+
+    def find_id(self, resource, name_or_id, parent_id=None):
+        """Look up the ID of a resource by ID or name
+
+        :returns: the ID, or None when the cache is stale, has no unique
+                  match or has a match which the server does not confirm,
+                  in which case the caller has to ask the server
+        """
+        if not self.is_fresh():
+            return None
+        query = ('SELECT id, name, parent_id FROM resources WHERE '
+                 'resource = ? AND (id = ? OR name = ?)')
+        args = [resource, name_or_id, str(name_or_id)]
+        if parent_id:
+            query += ' AND parent_id = ?'
+            args.append(parent_id)
+        with self._connect() as connection:
+            matches = connection.execute(query, args).fetchmany(2)
+        if len(matches) != 1 or not self._revalidate(resource, *matches[0]):
+            return None
+        return matches[0][0]
+
+    def find_nested_id(self, resource, name_or_id, parent_resource,
+                       parent_name_or_id=None):
+        """Look up the ID of a resource within its (optional) parent"""
+        parent_id = None
+        if parent_name_or_id:
+            parent_id = self.find_id(parent_resource, parent_name_or_id)
+            if not parent_id:
+                return None
+        return self.find_id(resource, name_or_id, parent_id)
@@ -16,10 +16,19 @@
 to Networking v2 API and its extensions.
 """
 
+import argparse
+from concurrent import futures
+import functools
+import threading
+
 from cliff import columns as cliff_columns
 from neutronclient.common import exceptions
+from osc_lib.utils import columns as column_util
 from osc_lib.utils import format_dict
 
+from nuage_neutronclient._i18n import _
+from nuage_neutronclient.osc import plugin
+
 
 class AdminStateColumn(cliff_columns.FormattableColumn):
     def human_readable(self):
@@ -38,6 +47,30 @@ def update_dict(obj, dict, attributes):
             dict[attribute] = getattr(obj, attribute)
 
 
+def get_fields(attr_map, parsed_args, long_listing=True, required=()):
+    """Get the attributes of a resource that a command has to request
+
+    Only the attributes in the attribute map are requested, limited to the
+    columns selected by the user with -c. When the user selects a column
+    which is not in the attribute map, no projection is done at all.
+
+    :param attr_map: a list of (attribute, column header, listing mode)
+    :param parsed_args: the parsed arguments of the command
+    :param long_listing: whether the long only attributes are displayed
+    :param required: attributes needed by the command itself
+    :rtype: list of attributes to pass as 'fields', empty for all attributes
+    """
+    headers, columns = column_util.get_column_definitions(
+        attr_map, long_listing=long_listing)
+    selected = getattr(parsed_args, 'columns', None)
+    if selected:
+        if not set(selected).issubset(headers):
+            return []
+        columns = [column for header, column in zip(headers, columns)
+                   if header in selected]
+    return list(columns) + [attr for attr in required if attr not in columns]
+
+
 def format_list_of_dicts(data):
     """Return a formatted string of key value pairs for each dict
 
@@ -71,3 +104,107 @@ def find_nested_resource(name_or_id, parent_name_or_id, resource_finder,
                     "'{name_or_id}'".format(resource=resource_name,
                                             name_or_id=name_or_id))
                 raise exceptions.NotFound(message=not_found_message)
+
+
+def run_concurrently(function, items, max_workers):
+    """Call function for every item on a bounded pool of worker threads
+
+    :param function: callable taking a single item
+    :param items: the items to process
+    :param max_workers: maximum number of concurrent calls
+    :returns: list of (item, result, exception) tuples in the order of items,
+              exception is None for the calls which succeeded
+    """
+    def call(item):
+        try:
+            return item, function(item), None
+        except Exception as e:
+            return item, None, e
+
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(call, items))
+
+
+def positive_int(value):
+    """argparse type of an integer greater than 0"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            _("'{}' is not a positive integer").format(value))
+    return number
+
+
+def add_parallel_argument(parser):
+    parser.add_argument(
+        '--parallel',
+        metavar='<N>',
+        type=positive_int,
+        default=1,
+        help=_("Number of resources to delete concurrently (default: 1)"))
+
+
+def delete_concurrently(delete, items, parallel):
+    """Delete items with up to parallel concurrent requests
+
+    :param delete: callable deleting a single item
+    :returns: list of (item, exception) for the items which failed to delete,
+              in the order of items
+    """
+    return [(item, error) for item, _result, error
+            in run_concurrently(delete, items, max(parallel, 1))
+            if error]
+
+
+class NuageCommand(object):
+    """Mixin of the commands using the Nuage client
+
+    The Nuage client is kept on the client manager, which an interactive
+    openstack shell keeps for all its commands. The state of the client that
+    is specific to a command is started and ended around the command.
+    """
+
+    def run(self, parsed_args):
+        client_manager = self.app.client_manager
+        plugin.start_command(client_manager)
+        try:
+            return super(NuageCommand, self).run(parsed_args)
+        finally:
+            plugin.end_command(client_manager)
+
+
+class UpstreamPatch(object):
+    """Monkeypatch of openstacksdk and openstackclient applied on first use
+
+    Command modules are imported whenever cliff loads their commands, e.g.
+    for every 'openstack --help'. Rather than patching the upstream resources
+    and helpers at import time, the patch is applied once, just before a
+    command decorated with it runs.
+
+    :param apply: callable applying the patch
+    """
+
+    def __init__(self, apply):
+        self._apply = apply
+        self._applied = False
+        self._lock = threading.Lock()
+
+    def ensure_applied(self):
+        with self._lock:
+            if not self._applied:
+                self._apply()
+                self._applied = True
+
+    def __call__(self, command_class):
+        """Class decorator applying the patch before take_action"""
+        take_action = command_class.take_action
+
+        @functools.wraps(take_action)
+        def patched_take_action(command, parsed_args):
+            self.ensure_applied()
+            return take_action(command, parsed_args)
+
+        command_class.take_action = patched_take_action
+        return command_class
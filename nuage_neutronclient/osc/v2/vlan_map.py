@@ -0,0 +1,121 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""VLAN allocation maps of Nuage gateway ports
+
+A VLANMap keeps the 4095 VLAN values of a gateway port as the bits of a
+single integer, so that free ranges, the next free VLANs and the utilization
+are computed with a few operations per range rather than one per VLAN.
+"""
+
+from nuage_neutronclient.osc.v2.utils import run_concurrently
+
+MAX_VLAN = 4094
+VLAN_COUNT = MAX_VLAN + 1
+_ALL_VLANS = (1 << VLAN_COUNT) - 1
+
+# Number of gateway ports of which the VLANs are listed at the same time
+VLAN_MAP_WORKERS = 4
+
+
+def _runs(bits):
+    """Yield (first, last) of every run of consecutive set bits"""
+    offset = 0
+    while bits:
+        # skip the clear bits below the lowest set bit
+        skip = (bits & -bits).bit_length() - 1
+        bits >>= skip
+        offset += skip
+        # count the set bits from there on
+        length = (~bits & (bits + 1)).bit_length() - 1
+        yield offset, offset + length - 1
+        bits >>= length
+        offset += length
+
+
+def format_ranges(ranges):
+    """Format ranges like [(0, 99), (101, 101)] as '0-99,101'"""
+    return ','.join(str(first) if first == last else
+                    '{}-{}'.format(first, last) for first, last in ranges)
+
+
+class VLANMap(object):
+    """Allocation bitmap of the VLAN values of a gateway port
+
+    :param used: integer of which bit N is set when VLAN N is in use
+    """
+
+    def __init__(self, used=0):
+        self.used = used & _ALL_VLANS
+
+    @classmethod
+    def from_values(cls, values):
+        used = 0
+        for value in values:
+            used |= 1 << int(value)
+        return cls(used)
+
+    def is_free(self, value):
+        return not self.used >> value & 1
+
+    @property
+    def used_count(self):
+        return bin(self.used).count('1')
+
+    @property
+    def free_count(self):
+        return VLAN_COUNT - self.used_count
+
+    @property
+    def utilization(self):
+        """Percentage of the VLAN values in use"""
+        return 100.0 * self.used_count / VLAN_COUNT
+
+    def free_ranges(self):
+        """Return the ranges of free VLANs as a list of (first, last)"""
+        return list(_runs(~self.used & _ALL_VLANS))
+
+    def used_ranges(self):
+        return list(_runs(self.used))
+
+    def next_free(self, count=1, start=0):
+        """Return the first count free VLANs from start on"""
+        free = []
+        candidates = ~self.used & _ALL_VLANS & ~((1 << start) - 1)
+        for first, last in _runs(candidates):
+            free.extend(range(first, min(last + 1, first + count - len(free))))
+            if len(free) == count:
+                break
+        return free
+
+
+def build_vlan_maps(client, gw_ports):
+    """Build the VLAN map of gateway ports
+
+    The VLANs of every port are fetched with a single paginated listing,
+    the listings of the ports run concurrently.
+
+    :param gw_ports: gateway ports, as dicts with at least an 'id'
+    :returns: list of (gateway port, VLANMap) in the order of gw_ports
+    """
+    def build(gw_port):
+        vlans = client.iter_nuage_gateway_vlans(
+            gatewayport=gw_port['id'], tenant='', fields=['value'])
+        return VLANMap.from_values(vlan['value'] for vlan in vlans)
+
+    results = run_concurrently(build, gw_ports, VLAN_MAP_WORKERS)
+    for _gw_port, _vlan_map, error in results:
+        if error:
+            raise error
+    return [(gw_port, vlan_map) for gw_port, vlan_map, _error in results]
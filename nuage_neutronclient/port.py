@@ -11,11 +11,14 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import collections
+import re
 
 from neutronclient.common import exceptions
 from neutronclient.common import extension
 from neutronclient.neutron import v2_0 as neutronV20
 from neutronclient.neutron.v2_0 import port
+from neutronclient.v2_0.client import UUID_PATTERN
 from nuage_neutronclient import nuage_floatingip
 from nuage_neutronclient import nuage_policy_group
 from oslo_utils import netutils
@@ -46,20 +49,29 @@ def _args2body(port, parsed_args):
 
 
 def handle_pg_names(neutron_client, parsed_args, during_create=False):
+    """Resolve the policy group names of parsed_args to IDs
+
+    IDs are passed through untouched, all names are resolved with a single
+    list request. Names which are not found are passed as is.
+    """
     policy_groups = parsed_args.nuage_policy_groups
+    names = set(pg for pg in policy_groups
+                if not re.match(UUID_PATTERN, pg))
+    ids_by_name = collections.defaultdict(list)
+    if names:
+        filters = {'name': sorted(names), 'fields': ['id', 'name']}
+        if not during_create:
+            filters['for_port'] = parsed_args.id
+        found_pgs = neutron_client.list_nuage_policy_groups(**filters)[
+            nuage_policy_group.NuagePolicyGroup.resource_plural]
+        for policy_group in found_pgs:
+            ids_by_name[policy_group['name']].append(policy_group['id'])
+
     pg_ids = []
     for pg in policy_groups:
-        if during_create:
-            policy_groups = neutron_client.list_nuage_policy_groups(
-                name=pg)[nuage_policy_group.NuagePolicyGroup.resource_plural]
-        else:
-            policy_groups = neutron_client.list_nuage_policy_groups(
-                for_port=parsed_args.id,
-                name=pg
-            )[nuage_policy_group.NuagePolicyGroup.resource_plural]
-        if len(policy_groups) == 1:
-            pg_ids.append(policy_groups[0]['id'])
-        elif len(policy_groups) > 1:
+        if len(ids_by_name[pg]) == 1:
+            pg_ids.append(ids_by_name[pg][0])
+        elif len(ids_by_name[pg]) > 1:
             msg = _("Multiple policy groups exist with name %s") % pg
             raise exceptions.NeutronClientException(message=msg,
                                                     status_code=400)
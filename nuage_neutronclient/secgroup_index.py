@@ -0,0 +1,115 @@
+# Copyright 2020 NOKIA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Security group names of the redirect target and external group rules
+
+The rule listings show the names of the security groups the rules refer to.
+The names are looked up with the unique security group IDs of all rules, in
+as few list requests as the URL length allows, and kept per client so that
+the rule listings of an interactive neutron shell share them.
+"""
+
+import threading
+import time
+import weakref
+
+from neutronclient.common import exceptions
+
+# Length of a query filter on security group id: id=<uuid>& (len(uuid)=36)
+SECURITY_GROUP_ID_FILTER_LEN = 40
+
+# Number of security group IDs per list request, which keeps the request URL
+# well below the 8k limit of neutronclient
+SECURITY_GROUP_CHUNK_SIZE = 150
+
+# Time in seconds the names of the security groups are kept
+SECURITY_GROUP_NAMES_TTL = 60
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+class SecurityGroupIndex(object):
+    """Names of security groups by ID, looked up on demand
+
+    :param client: neutron client to list the security groups with
+    """
+
+    def __init__(self, client, ttl=SECURITY_GROUP_NAMES_TTL):
+        self._client = client
+        self._ttl = ttl
+        self._names = {}
+        self._expiry = time.monotonic() + ttl
+
+    def _list(self, sec_group_ids):
+        return self._client.list_security_groups(
+            id=sec_group_ids,
+            fields=['id', 'name']).get('security_groups', [])
+
+    def _fetch(self, sec_group_ids):
+        secgroups = []
+        chunk_size = SECURITY_GROUP_CHUNK_SIZE
+        i = 0
+        while i < len(sec_group_ids):
+            chunk = sec_group_ids[i:i + chunk_size]
+            try:
+                secgroups.extend(self._list(chunk))
+            except exceptions.RequestURITooLong as uri_len_exc:
+                if len(chunk) == 1:
+                    raise
+                # Use the excess attribute of the exception to know how many
+                # security group id filters fit into a single request
+                excess_ids = ((uri_len_exc.excess +
+                               SECURITY_GROUP_ID_FILTER_LEN - 1) //
+                              SECURITY_GROUP_ID_FILTER_LEN)
+                chunk_size = max(1, len(chunk) - excess_ids)
+                continue
+            i += len(chunk)
+        return secgroups
+
+    def names(self, sec_group_ids):
+        """Return a dict of security group ID to name for sec_group_ids
+
+        Security groups which do not exist or have no name are left out.
+        """
+        if self._expiry < time.monotonic():
+            self._names = {}
+            self._expiry = time.monotonic() + self._ttl
+        sec_group_ids = set(sec_group_ids)
+        unknown = sorted(sec_group_ids.difference(self._names))
+        if unknown:
+            secgroups = self._fetch(unknown)
+            # IDs which are not found are remembered as well
+            self._names.update(dict.fromkeys(unknown))
+            self._names.update((sg['id'], sg['name']) for sg in secgroups)
+        return dict((sg_id, self._names[sg_id]) for sg_id in sec_group_ids
+                    if self._names[sg_id])
+
+    def replace_ids(self, rules, keys):
+        """Replace the security group IDs in keys of rules with their names"""
+        names = self.names(rule[key] for rule in rules for key in keys
+                           if rule.get(key))
+        for rule in rules:
+            for key in keys:
+                if rule.get(key) in names:
+                    rule[key] = names[rule[key]]
+
+
+def get_security_group_index(client):
+    """Return the security group index of a neutron client"""
+    with _indexes_lock:
+        index = _indexes.get(client)
+        if index is None:
+            index = _indexes[client] = SecurityGroupIndex(client)
+        return index